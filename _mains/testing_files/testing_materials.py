@@ -5,10 +5,9 @@ This File serves to provide Materials for Testing Purposes
 
 from structuralcodes import set_design_code
 from structuralcodes.core.base import Material
-from structuralcodes.materials.concrete import create_concrete
 from structuralcodes.materials.constitutive_laws import Elastic
-from structuralcodes.materials.reinforcement import create_reinforcement
 
+from core.analysis_core.material_methods import MATERIALS
 from slab_construction.slab_construction import FloorMaterial
 
 set_design_code('ec2_2004')
@@ -19,16 +18,16 @@ set_design_code('ec2_2004')
 
 
 # - Definitions -
-concrete_c40_uls = create_concrete(fck=40, constitutive_law ='parabolarectangle', alpha_cc = 0.85, gamma_c = 1.5, name ="C40/50 ULS")
+concrete_c40_uls = MATERIALS.concrete(fck=40, constitutive_law ='parabolarectangle', alpha_cc = 0.85, gamma_c = 1.5, name ="C40/50 ULS")
 # concrete_c40_sls = create_concrete(fck=40, constitutive_law ='sargin', name ="C40/50 SLS")
 
-concrete_c50_uls = create_concrete(fck=50, constitutive_law ='parabolarectangle', alpha_cc = 0.85, gamma_c = 1.5, name ="C50/60 ULS")
+concrete_c50_uls = MATERIALS.concrete(fck=50, constitutive_law ='parabolarectangle', alpha_cc = 0.85, gamma_c = 1.5, name ="C50/60 ULS")
 # concrete_c50_sls = create_concrete(fck=50, constitutive_law ='sargin', name ="C50/60 SLS")
 
-concrete_c55_uls = create_concrete(fck=55, constitutive_law ='parabolarectangle', alpha_cc = 0.85, gamma_c = 1.5, name ="C55/67 ULS")
+concrete_c55_uls = MATERIALS.concrete(fck=55, constitutive_law ='parabolarectangle', alpha_cc = 0.85, gamma_c = 1.5, name ="C55/67 ULS")
 # concrete_c55_sls = create_concrete(fck=55, constitutive_law ='sargin', name ="C55/67 SLS")
 
-concrete_c80_uls = create_concrete(fck=80, constitutive_law ='parabolarectangle', alpha_cc = 0.85, gamma_c = 1.5, name ="C80/95 ULS")
+concrete_c80_uls = MATERIALS.concrete(fck=80, constitutive_law ='parabolarectangle', alpha_cc = 0.85, gamma_c = 1.5, name ="C80/95 ULS")
 # concrete_c80_sls = create_concrete(fck=80, constitutive_law ='sargin', name ="C80/95 SLS")
 
 
@@ -42,7 +41,7 @@ Es_b500 = 200000
 epsuk_b500 = 0.07
 
 # - Definition
-reinforcement_B500 = create_reinforcement(
+reinforcement_B500 = MATERIALS.reinforcement(
     fyk=fyk_b500,
     Es=Es_b500,
     ftk=ftk_b500,
@@ -94,7 +93,7 @@ brittle_elastic_law_Q95.set_ultimate_strain(epsuk_Q95)
 
 # solidian GRID Q95/95-CCE-38 prestressed 20 %
 
-solidian_Q95_pre_20 = create_reinforcement(
+solidian_Q95_pre_20 = MATERIALS.reinforcement(
     fyk=fyk_Q95,
     Es=Es_Q95,
     ftk=ftk_Q95,
@@ -108,7 +107,7 @@ solidian_Q95_pre_20 = create_reinforcement(
 
 # solidian GRID Q95/95-CCE-38 prestressed 50 %
 
-solidian_Q95_pre_50 = create_reinforcement(
+solidian_Q95_pre_50 = MATERIALS.reinforcement(
     fyk=fyk_Q95,
     Es=Es_Q95,
     ftk=ftk_Q95,
@@ -124,7 +123,7 @@ solidian_Q95_pre_50 = create_reinforcement(
 
 # solidian GRID Q142/142-CCE-25 regular
 
-solidian_Q142 = create_reinforcement(
+solidian_Q142 = MATERIALS.reinforcement(
     fyk=fyk_Q142,
     Es=Es_Q142,
     ftk=ftk_Q142,
@@ -138,7 +137,7 @@ solidian_Q142 = create_reinforcement(
 
 # solidian GRID Q142/142-CCE-25 prestressed 50 %
 
-solidian_Q142_pre_50 = create_reinforcement(
+solidian_Q142_pre_50 = MATERIALS.reinforcement(
     fyk=fyk_Q142,
     Es=Es_Q142,
     ftk=ftk_Q142,
@@ -152,7 +151,7 @@ solidian_Q142_pre_50 = create_reinforcement(
 
 # solidian GRID Q142/142-CCE-25 prestressed 60 %
 
-solidian_Q142_pre_60 = create_reinforcement(
+solidian_Q142_pre_60 = MATERIALS.reinforcement(
     fyk=fyk_Q142,
     Es=Es_Q142,
     ftk=ftk_Q142,
@@ -167,5 +166,5 @@ solidian_Q142_pre_60 = create_reinforcement(
 # -- Floor Materials --
 
 infill = FloorMaterial(density = 1000)
-sound_insulation = FloorMaterial(density = 24)
+sound_insulation = FloorMaterial(density = 24, dynamic_stiffness = 20)    # s' in [MN/m³]
 screed = FloorMaterial(density = 2000)
\ No newline at end of file
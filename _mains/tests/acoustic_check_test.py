@@ -0,0 +1,38 @@
+import itertools
+
+import numpy as np
+
+from _mains.testing_files.testing_materials import screed
+from _mains.testing_files.testing_slab_construction import test_slab_construction
+from core.analysis_core.checks.acoustic_checks import AcousticCheckDIN4109, FloorBuildUps
+from slab_construction.slab_construction import Floor, FloorLayer, FloorMaterial
+
+"""
+Sound insulation of the test slab with a catalogue of floating screeds (screed thickness x impact sound
+insulation), ranked in one vectorised evaluation. The arrays of FloorBuildUps can also be set up directly.
+"""
+
+insulations = [FloorMaterial(density=24, name=f"EPS-T s'={s}", dynamic_stiffness=s) for s in (7, 10, 15, 20, 30)]
+floors = [
+    Floor([FloorLayer(insulation, thickness_i), FloorLayer(screed, thickness_s)])
+    for insulation, thickness_i, thickness_s in itertools.product(insulations, (20, 30), range(35, 85, 5))
+]
+
+m_slab = AcousticCheckDIN4109.slab_mass(test_slab_construction)
+build_ups = FloorBuildUps.from_floors(floors)
+result = AcousticCheckDIN4109.calculateSoundInsulation(m_slab, build_ups)
+
+print(f"m' slab = {m_slab:.1f} kg/m², {int(result['passes'].sum())} of {len(build_ups)} build-ups pass")
+for i in AcousticCheckDIN4109.rank(result)[:5]:
+    floor = floors[i]
+    print(f"{floor.layers[0].material.name} {floor.layers[0].thickness:.0f} mm + screed {floor.layers[1].thickness:.0f} mm: "
+          f"R'w = {result['R_w_building'][i]:.1f} dB, L'n,w = {result['L_n_w_building'][i]:.1f} dB, "
+          f"utilization = {result['utilization'][i]:.3f}")
+
+# same catalogue from arrays
+direct = AcousticCheckDIN4109.calculateSoundInsulation(
+    m_slab, FloorBuildUps(0.0, build_ups.floating_mass, build_ups.dynamic_stiffness)
+)
+assert np.allclose(direct["utilization"], result["utilization"])
+
+AcousticCheckDIN4109.calculateUtilization(test_slab_construction)
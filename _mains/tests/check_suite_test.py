@@ -0,0 +1,13 @@
+from _mains.testing_files.testing_loads import test_loads
+from _mains.testing_files.testing_slab_construction import test_slab_construction
+from core.analysis_core.checks.check_suite import CheckSuite
+
+"""
+All ultimate moment checks of the test slab: 10 system/moment cases, 5 section solves.
+"""
+
+suite = CheckSuite()
+print(f"{len(suite.cases)} checks, {len(suite.unique_requests())} section solves")
+
+for (system, moment), utilization in suite.run(test_slab_construction, test_loads).items():
+    print(f"{system:<12} {moment:<15} {utilization:.3f}")
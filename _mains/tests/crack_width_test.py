@@ -0,0 +1,30 @@
+import numpy as np
+
+from _mains.testing_files.testing_floor import test_floor
+from _mains.testing_files.testing_hp_sections import hp_shell_c1_3_uls
+from _mains.testing_files.testing_loads import test_loads
+from _mains.testing_files.testing_materials import infill
+from _mains.testing_files.testing_slab_construction import test_slab_construction
+from core.analysis_core.checks.serviceability_checks import CrackWidthCheckEC2004DE
+from slab_construction.slab_construction import SlabConstruction
+from slab_construction.slabs.hp_slab.model.hp_slab import HPSlab
+
+"""
+Crack widths under the frequent combination of the non-prestressed slab C.1.3 as simple beam. Only the stations
+beyond the cracking moment are evaluated, all cracked stations of one section with one table lookup.
+
+The prestressed test slab cannot carry the frequent moments as cantilever: the stations beyond the moment
+capacity have infinite crack widths, and so has the utilization.
+"""
+
+slab_construction = SlabConstruction(HPSlab(hp_shell_c1_3_uls, infill), test_floor)
+
+result = CrackWidthCheckEC2004DE.calculateCrackWidths(slab_construction, test_loads, "SIMPLE_BEAM")
+for x, M, cracked, wk in zip(result["x"], result["moment"], result["cracked"], result["crack_width"]):
+    print(f"x = {x:.2f}  M = {M:9.3f} kNm  {'cracked  ' if cracked else 'uncracked'}  wk = {wk:.3f} mm")
+assert np.all(np.isfinite(result["crack_width"])) and np.max(result["crack_width"]) > 0
+
+CrackWidthCheckEC2004DE.calculateUtilization(slab_construction, test_loads, "SIMPLE_BEAM")
+
+utilization = CrackWidthCheckEC2004DE.calculateUtilization(test_slab_construction, test_loads, "CANTILEVER")
+assert utilization == np.inf
@@ -0,0 +1,30 @@
+from _mains.testing_files.testing_loads import test_loads
+from _mains.testing_files.testing_materials import screed
+from _mains.testing_files.testing_slab_construction import test_slab_construction
+
+"""
+Regression test: the characteristic permanent load Gk of the combinations is the structural plus the
+non-structural dead load, and the cached dead loads follow changes of the floor.
+"""
+
+slab = test_slab_construction.slab
+floor = test_slab_construction.floor
+
+g_structural = slab.self_load()
+g_non_structural = slab.infill_load() + floor.dead_load()
+Gk = g_structural + g_non_structural
+Qk = test_loads.Qk[0]
+
+assert abs(test_slab_construction.dead_load() - Gk) < 1e-9
+assert abs(test_loads.quasi_permanent_combination(test_slab_construction) - (Gk + 0.3 * Qk)) < 1e-9
+assert abs(test_loads.frequent_combination(test_slab_construction) - (Gk + 1.0 * Qk)) < 1e-9
+assert abs(test_loads.fundamental_combination(test_slab_construction) - (1.35 * Gk + 1.5 * Qk)) < 1e-9
+print(f"Gk = {g_structural:.3f} + {g_non_structural:.3f} = {Gk:.3f} kN/m²")
+
+# adding a floor layer invalidates the cached non-structural dead load
+floor.add_layer(screed, 10)
+assert abs(test_slab_construction.dead_load() - (Gk + screed.density * 10 * 1e-5)) < 1e-9
+floor.layers.pop()
+floor.invalidate()
+assert abs(test_slab_construction.dead_load() - Gk) < 1e-9
+print("OK")
@@ -0,0 +1,36 @@
+import numpy as np
+
+from _mains.testing_files.testing_loads import test_loads
+from _mains.testing_files.testing_slab_construction import test_slab_construction
+from core.analysis_core.statics.deformations import Deformations
+
+"""
+Quasi-permanent deflection of the test slab and its load-deflection curve.
+The moment-curvature relations are computed once per station, the load levels reuse them.
+
+The prestressed test slab cambers upwards under the quasi-permanent load (negative deflection), the deflection
+with the largest magnitude is reported.
+"""
+
+L = test_slab_construction.slab.L
+
+result = Deformations.calculate_deflection(test_slab_construction, test_loads, "SIMPLE_BEAM")
+w = result["deflection"]
+w_max = Deformations.calculate_max_deflection(test_slab_construction, test_loads, "SIMPLE_BEAM")
+print(f"w_max = {w_max:.2f} mm" + (f" (L/{L / abs(w_max):.0f})" if w_max != 0 else ""))
+
+# deflection line of a simple beam under uniform load: zero at the supports, symmetric, one sign
+assert np.all(np.isfinite(w)) and w[0] == 0 and abs(w[-1]) < 1e-9 * np.max(np.abs(w))
+assert np.allclose(w, w[::-1], atol=1e-6 * np.max(np.abs(w)))
+assert np.all(np.sign(w[1:-1]) == np.sign(w_max))
+assert w_max == w[np.argmax(np.abs(w))]
+
+load_factors = np.linspace(0.25, 3.0, 12)
+w_max = Deformations.calculate_max_deflection(test_slab_construction, test_loads, "SIMPLE_BEAM",
+                                              load_factors=load_factors)
+for factor, w in zip(load_factors, w_max):
+    print(f"{factor:5.2f} x G+psi2*Q: w = {w:7.2f} mm")
+
+# more load, less camber and more deflection
+finite = np.isfinite(w_max)
+assert np.all(np.diff(w_max[finite]) > 0)
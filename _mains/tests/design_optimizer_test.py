@@ -0,0 +1,44 @@
+from _mains.testing_files.testing_floor import test_floor
+from _mains.testing_files.testing_loads import test_loads
+from _mains.testing_files.testing_materials import infill, fyk_Q142, Es_Q142, ftk_Q142, epsuk_Q142, density_Q142
+from core.analysis_core.design_optimizer import optimize_design
+from core.analysis_core.parameter_sweep import SweepContext
+
+"""
+Lightest (minimum concrete GWP) three-span design around the C.1. Section 4 geometry (Loutfi 2023),
+instead of tuning t, nt and reinf_area by trial and error.
+"""
+
+context = SweepContext(
+    cfrp_products={
+        "Q142": dict(fyk=fyk_Q142, Es=Es_Q142, ftk=ftk_Q142, epsuk=epsuk_Q142, density=density_Q142),
+    },
+    infill_material=infill,
+    floor=test_floor,
+    loads=test_loads,
+    checks=[("THREE_SPAN", "MAX_POS_MOMENT"), ("THREE_SPAN", "MAX_NEG_MOMENT")],
+)
+
+space = dict(
+    B=[1200], L=[6750], Hx=[100], Hy=[300, 400],
+    t=[30, 40, 50, 60, 70, 80, 90, 100],
+    dy=[80],
+    nt=[6, 8, 10],
+    fck=[50, 55],
+    cfrp=["Q142"],
+    prestress=[0.5],
+    reinf_area=[20, 40, 60, 80],
+)
+
+if __name__ == "__main__":
+    result = optimize_design(space, context)
+    print(f"{result.n_evaluations} of {result.n_candidates} designs checked")
+
+    for record in result.trace:
+        print(f"t = {record['t']:5.0f}, reinf_area = {record['reinf_area']:4.0f}, nt = {record['nt']:2d}, "
+              f"fck = {record['fck']}, Hy = {record['Hy']}: utilization = {record['utilization']:.3f}")
+
+    best = result.best
+    if best is not None:
+        print(f"Optimum: t = {best['t']}, reinf_area = {best['reinf_area']}, nt = {best['nt']}, fck = {best['fck']}, "
+              f"Hy = {best['Hy']}, GWP = {best['gwp']:.1f} kg CO2eq/m², utilization = {best['utilization']:.3f}")
@@ -0,0 +1,49 @@
+import numpy as np
+
+from _mains.testing_files.testing_loads import test_loads
+from _mains.testing_files.testing_slab_construction import test_slab_construction
+from core.analysis_core.statics.continuous_beam import ContinuousBeam
+from core.analysis_core.statics.internal_forces import InternalForces
+from core.unit_core import mm_to_m
+
+"""
+Pattern load envelopes of InternalForces.calculate_envelope: the explicit path (all patterns as one matrix product)
+and the governing-pattern path (max_patterns=1) against a brute-force loop over all 2^n patterns and combinations.
+"""
+
+combinations = ("FUNDAMENTAL", "CHARACTERISTIC", "QUASI-PERMANENT")
+parts = [InternalForces._calculate_line_load_parts(test_slab_construction, test_loads, c) for c in combinations]
+
+for spans, EI in ((3, 1.0), ([4.0, 7.5, 5.0, 6.0], [1.0, 1.5, 1.0, 0.8])):
+    x = np.linspace(0, len(spans) if isinstance(spans, list) else spans, 161)
+    explicit = InternalForces.calculate_envelope(test_slab_construction, test_loads, x, spans, EI, combinations)
+    governing = InternalForces.calculate_envelope(test_slab_construction, test_loads, x, spans, EI, combinations,
+                                                  max_patterns=1)
+
+    # brute force: every combination and pattern solved on its own
+    lengths = spans if isinstance(spans, list) else [mm_to_m(test_slab_construction.slab.L)] * spans
+    beam = ContinuousBeam(lengths, EI)
+    cases = {"moment": [], "shear": []}
+    for g, q in parts:
+        for pattern in InternalForces.load_patterns(beam.n_spans):
+            w = g + q * pattern
+            cases["moment"].append(beam.moments(x, w))
+            cases["shear"].append(beam.shears(x, w))
+
+    for effect, values in cases.items():
+        values = np.array(values)                                                 # (n_c * n_p, n_x)
+        scale = np.max(np.abs(values))
+        for bound, reduce in (("max", np.max), ("min", np.min)):
+            key = f"{effect}_{bound}"
+            expected = reduce(values, axis=0)
+            assert np.allclose(explicit[key], expected, rtol=0, atol=1e-9 * scale), key
+            assert np.allclose(governing[key], expected, rtol=0, atol=1e-9 * scale), key
+
+            # the reported combination and pattern reproduce the envelope value
+            for result in (explicit, governing):
+                c, p = result[f"{key}_combination"], result[f"{key}_pattern"]
+                assert np.allclose(values[c * 2 ** beam.n_spans + p, np.arange(x.size)], result[key],
+                                   rtol=0, atol=1e-9 * scale), key
+
+    print(f"{beam.n_spans} spans: M = {explicit['moment_min'].min():.2f} ... {explicit['moment_max'].max():.2f} kNm, "
+          f"V = {explicit['shear_min'].min():.2f} ... {explicit['shear_max'].max():.2f} kN")
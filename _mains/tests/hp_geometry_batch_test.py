@@ -0,0 +1,51 @@
+import numpy as np
+
+from _mains.testing_files.testing_hp_sections import hp_shell_c1_4_uls
+from _mains.testing_files.testing_materials import infill
+from slab_construction.slabs.hp_slab.model.hp_geometry import HPGeometry
+from slab_construction.slabs.hp_slab.model.hp_geometry_batch import HPGeometryBatch
+from slab_construction.slabs.hp_slab.model.hp_shell import HPShell
+from slab_construction.slabs.hp_slab.model.hp_slab import HPSlab
+
+"""
+HPGeometryBatch against the scalar HPGeometry: volumes, minimum infill, loads and tendons of candidates with
+nt = 1 ... 5 tendons per group (padded with NaN up to the largest nt of the batch).
+"""
+
+geometries = [
+    HPGeometry(B=B, L=L, Hx=Hx, Hy=Hy, t=t, dy=dy, nt=nt)
+    for B, L, Hx, Hy, t, dy, nt in (
+        (1200, 6750, 100, 400, 100, 80, 1),
+        (1200, 6750, 100, 300, 60, 80, 2),
+        (1000, 5000, 70, 280, 40, 30, 3),
+        (1500, 8000, 150, 450, 80, 100, 4),
+        (1200, 6750, 100, 400, 50, 80, 5),
+    )
+]
+batch = HPGeometryBatch.from_geometries(geometries)
+assert len(batch) == len(geometries)
+
+concrete = hp_shell_c1_4_uls.concrete
+slabs = [HPSlab(HPShell(g, concrete, hp_shell_c1_4_uls.reinforcement, reinf_area=80), infill) for g in geometries]
+
+assert np.allclose(batch.volume(), [g.volume() for g in geometries], rtol=1e-12)
+assert np.allclose(batch.minimum_infill_volume(), [slab.minimum_infill_volume() for slab in slabs], rtol=1e-12)
+assert np.allclose(batch.self_load(concrete.density), [slab.self_load() for slab in slabs], rtol=1e-12)
+assert np.allclose(batch.infill_load(infill.density), [slab.infill_load() for slab in slabs], rtol=1e-12)
+
+tendons = batch.tendons()
+lengths = batch.tendon_lengths()
+nt_max = int(batch.nt.max())
+for i, g in enumerate(geometries):
+    expected = np.asarray(g.tendons(), dtype=float)                     # (2 * nt, 2, 3)
+    regular, mirrored = tendons[i, :nt_max], tendons[i, nt_max:]
+    assert np.allclose(np.concatenate((regular[:g.nt], mirrored[:g.nt])), expected, rtol=1e-12)
+    assert np.all(np.isnan(regular[g.nt:])) and np.all(np.isnan(mirrored[g.nt:]))
+
+    expected_lengths = np.linalg.norm(expected[:, 1] - expected[:, 0], axis=-1)
+    assert np.allclose(np.sort(lengths[i][~np.isnan(lengths[i])]), np.sort(expected_lengths), rtol=1e-12)
+
+    # round trip to the scalar geometry
+    assert np.isclose(batch.geometry(i).volume(), g.volume(), rtol=1e-12)
+
+print(f"{len(batch)} candidates agree with HPGeometry, volumes {np.round(batch.volume() * 1e-9, 4)} m³")
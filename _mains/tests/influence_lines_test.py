@@ -0,0 +1,48 @@
+import numpy as np
+
+from core.analysis_core.statics.continuous_beam import ContinuousBeam
+from core.analysis_core.statics.influence_lines import InfluenceLines, get_influence_lines
+
+"""
+Influence lines of a continuous beam with unequal spans and stiffnesses: patch loads over whole spans against the
+uniform load solution of ContinuousBeam, a point load against a narrow patch of the same resultant, and the cache
+of get_influence_lines.
+"""
+
+spans = [4.0, 7.5, 5.0]
+EI = [1.0, 1.5, 0.8]
+beam = ContinuousBeam(spans, EI)
+sections = np.array([0.25, 0.5, 1.0, 1.3, 1.5, 2.0, 2.7])
+lines = InfluenceLines(beam, sections)
+
+# patch loads covering all spans, two load sets, against the uniform span loads; the influence lines are
+# interpolated linearly between the grid points, the error decreases with the square of the grid spacing
+w = np.array([[10.0, 0.0], [14.0, 5.0], [8.0, 12.0]])      # (n_spans, k)
+moments, shears = beam.moments(sections, w), beam.shears(sections, w)
+errors = []
+for n_points_per_span in (200, 800):
+    result = InfluenceLines(beam, sections, n_points_per_span).patch_loads([0.0, 1.0, 2.0], [1.0, 2.0, 3.0], w)
+    # the shear at an interior support is taken just right of the support by both
+    errors.append(max(np.max(np.abs(result["moment"] - moments)) / np.max(np.abs(moments)),
+                      np.max(np.abs(result["shear"] - shears)) / np.max(np.abs(shears))))
+assert errors[0] < 1e-4 and errors[1] < 1e-5 and errors[0] / errors[1] > 12, errors
+print(f"M = {np.round(result['moment'][:, 0], 3)} kNm, V = {np.round(result['shear'][:, 0], 3)} kN")
+
+# a point load equals a narrow centred patch load of the same resultant (intensity per physical length), also
+# between grid points and on a section
+P, width = 20.0, 1e-6
+for position in (0.4, 1.3, 1.6123, 2.95):
+    point = lines.point_loads([position], [P])
+    patch = lines.patch_loads([position - width / 2], [position + width / 2], [P / (width * spans[int(position)])])
+    # at a section under the load the point load counts as right of the section, the patch half on each side
+    patch["shear"] = patch["shear"] + np.where(sections == position, P / 2, 0.0)
+    for effect in ("moment", "shear"):
+        scale = np.max(np.abs(point[effect]))
+        assert np.allclose(point[effect], patch[effect], rtol=0, atol=1e-5 * scale), (position, effect)
+
+# the cached influence lines are shared and read-only
+cached = get_influence_lines(spans, sections, EI)
+assert get_influence_lines(np.array(spans), list(sections), EI) is cached
+assert not cached.moment.flags.writeable
+expected = beam.moments(sections, 10.0)
+assert np.allclose(cached.patch_loads([0.0], [3.0], [10.0])["moment"], expected, atol=1e-4 * np.max(np.abs(expected)))
@@ -0,0 +1,36 @@
+import numpy as np
+
+from _mains.testing_files.testing_materials import infill, sound_insulation, screed, fyk_Q142, Es_Q142, ftk_Q142, epsuk_Q142, density_Q142
+from _mains.testing_files.testing_slab_construction import test_slab_construction
+from core.analysis_core.lca import LCAEngine, MaterialImpactRegistry
+from core.analysis_core.material_methods import create_cfrp_reinforcement, create_uls_concrete
+from slab_construction.slabs.hp_slab.model.hp_geometry_batch import HPGeometryBatch
+
+"""
+GWP and cost of the test slab construction, and of a batch of designs with separately created but equal
+materials (one registry entry each).
+"""
+
+materials = MaterialImpactRegistry()
+materials.register(infill, gwp=0.05, cost=0.03)
+materials.register(sound_insulation, gwp=3.3, cost=2.5)
+materials.register(screed, gwp=0.12, cost=0.06)
+shell = test_slab_construction.slab.hp_shell
+materials.register(shell.reinforcement, gwp=25.0, cost=30.0)
+
+engine = LCAEngine(materials)
+single = engine.evaluate(test_slab_construction)
+for name, value in single.items():
+    print(f"{name:12s} {value:10.3f}")
+
+# batch: thickness variants of the test geometry, one concrete and reinforcement object per design
+g = shell.hp_geometry
+t = np.linspace(30, 80, 1000)
+batch = HPGeometryBatch(g.B, g.L, g.Hx, g.Hy, t, g.dy, g.nt)
+concretes = [create_uls_concrete(shell.concrete.fck) for _ in t]
+reinforcement = create_cfrp_reinforcement(fyk_Q142, Es_Q142, ftk_Q142, epsuk_Q142, density_Q142, prestress=0.3)
+
+result = engine.evaluate_batch(batch, concretes, reinforcement, shell.reinf_area, infill,
+                               test_slab_construction.floor)
+assert np.all(np.diff(result["shell_gwp"]) > 0)
+print(f"GWP {result['gwp'].min():.1f} ... {result['gwp'].max():.1f} kg CO2eq/m²")
@@ -0,0 +1,50 @@
+import numpy as np
+
+from _mains.testing_files.testing_slab_construction import test_slab_construction
+from core.analysis_core.loads import Loads
+
+"""
+Combination values of two variable actions against hand calculations (EC0 6.10, 6.10a/b, 6.15b), every variable
+action once as leading action.
+"""
+
+Gk = 5.0                                            # [kN/m²]
+live_loads = [3.0, 2.0]
+psi_0, psi_1, psi_2 = [0.7, 0.6], [0.5, 0.2], [0.3, 0.0]
+
+# 6.10: 1.35 Gk + 1.5 Qk,1 + 1.5 ψ0,2 Qk,2 and 1.35 Gk + 1.5 ψ0,1 Qk,1 + 1.5 Qk,2
+loads = Loads(live_loads, psi_0, psi_1, psi_2)
+assert np.allclose(loads.combination_values(Gk), [[13.05, 12.9]])
+value, governing = loads.design_values(Gk)
+assert np.allclose(value, [13.05]) and governing.tolist() == [0]
+assert loads.combination_labels()[0] == "6.10 (Q1 leading)"
+
+# 6.10a: 1.35 Gk + Σ 1.5 ψ0,i Qk,i, 6.10b: 0.85 * 1.35 Gk + 1.5 Qk,1 + Σ 1.5 ψ0,i Qk,i
+loads_ab = Loads(live_loads, psi_0, psi_1, psi_2, combination_rule="6.10a/b")
+assert np.allclose(loads_ab.combination_values(Gk), [[11.7, 12.0375, 11.8875]])
+value, governing = loads_ab.design_values(Gk)
+assert np.allclose(value, [12.0375]) and loads_ab.combination_labels()[governing[0]] == "6.10b (Q1 leading)"
+
+# 6.10a governs for a large permanent load: 1.35 * 20 + 4.95 = 31.95 > 0.85 * 1.35 * 20 + 6.3 = 29.25
+value, governing = loads_ab.design_values([Gk, 20.0])
+assert np.allclose(value, [12.0375, 31.95]) and governing.tolist() == [1, 0]
+
+# 6.15b: Gk + ψ1,1 Qk,1 + ψ2,2 Qk,2 and Gk + ψ2,1 Qk,1 + ψ1,2 Qk,2; Q2 leads once ψ1,2 Qk,2 is large enough
+assert np.allclose(loads.combination_values(Gk, "FREQUENT"), [[6.5, 6.3]])
+loads_q2 = Loads([3.0, 6.0], psi_0, psi_1, psi_2)
+value, governing = loads_q2.design_values(Gk, "frequent")
+assert np.allclose(value, [5.0 + 0.9 + 1.2]) and governing.tolist() == [1]
+
+# slab constructions and Gk values give the same combinations
+Gk_slab = test_slab_construction.dead_load()
+assert np.allclose(loads.combination_values(test_slab_construction), loads.combination_values(Gk_slab))
+assert np.isclose(loads.fundamental_combination(test_slab_construction), loads.design_values(Gk_slab)[0][0])
+
+try:
+    loads.design_values([])
+except ValueError as exc:
+    print(f"empty input: {exc}")
+else:
+    raise AssertionError("empty input must be rejected")
+
+print(f"Gk = {Gk_slab:.2f} kN/m²: 6.10 design load {loads.fundamental_combination(test_slab_construction):.2f} kN/m²")
@@ -0,0 +1,32 @@
+from _mains.testing_files import testing_materials
+from _mains.testing_files.testing_materials import fyk_Q142, Es_Q142, ftk_Q142, epsuk_Q142, density_Q142
+from _mains.testing_files.testing_slab_construction import test_slab_construction
+from core.analysis_core.material_methods import MATERIALS, create_cfrp_reinforcement, create_uls_concrete, tabulated_concrete
+from core.analysis_core.section_methods import get_concrete, sls_section
+
+"""
+Materials with equal parameters are one shared instance (MATERIALS), including the SLS concretes derived by
+sls_section and the tabulated concretes.
+"""
+
+assert create_uls_concrete(50) is create_uls_concrete(50)
+assert create_uls_concrete(50) is not create_uls_concrete(55)
+
+# equal after the defaults are filled in: implicit design code and density of the test materials, other names
+for fck in (40, 50, 55, 80):
+    assert getattr(testing_materials, f"concrete_c{fck}_uls") is create_uls_concrete(fck)
+assert MATERIALS.concrete(fck=50, design_code="ec2_2004") is MATERIALS.concrete(fck=50, gamma_c=1.5, alpha_cc=1.0,
+                                                                            density=2400.0, name="C50")
+assert MATERIALS.concrete(fck=50, design_code="ec2_2004") is not MATERIALS.concrete(fck=50, alpha_cc=0.85)
+
+cfrp = dict(fyk=fyk_Q142, Es=Es_Q142, ftk=ftk_Q142, epsuk=epsuk_Q142, density=density_Q142)
+assert create_cfrp_reinforcement(**cfrp, prestress=0.5) is create_cfrp_reinforcement(**cfrp, prestress=0.5)
+assert create_cfrp_reinforcement(**cfrp, prestress=0.5) is not create_cfrp_reinforcement(**cfrp, prestress=0.6)
+
+slab = test_slab_construction.slab
+for concrete_tension in (False, True):
+    sections = [sls_section(slab.section_at(x), concrete_tension) for x in (0.0, 0.39, 1.0)]
+    assert len({id(get_concrete(section)) for section in sections}) == 1
+
+assert tabulated_concrete(create_uls_concrete(55)) is create_uls_concrete(55, tabulated=True)
+print(f"{len(MATERIALS)} interned materials")
@@ -0,0 +1,49 @@
+import io
+from collections import Counter
+
+import numpy as np
+
+from _mains.testing_files.testing_hp_sections import hp_c1_4
+from core.ioh_core.mesh_export import n_shell_triangles, shell_triangle_chunks, write_ply, write_stl
+
+"""
+Mesh export of an HP shell: the surface is closed and consistently oriented (every edge is shared by exactly two
+triangles that traverse it in opposite directions, outward normals give a positive enclosed volume), and the
+triangle counts in the STL and PLY headers match the written data.
+"""
+
+nx, ny = 41, 13
+
+# closed surface with consistent orientation, assembled from small chunks
+triangles = np.concatenate(list(shell_triangle_chunks(hp_c1_4, nx, ny, chunk_rows=7)))
+assert len(triangles) == n_shell_triangles(nx, ny)
+
+_, index = np.unique(np.round(triangles.reshape(-1, 3), 6), axis=0, return_inverse=True)
+faces = index.reshape(-1, 3)
+edges = Counter((a, b) for f in faces for a, b in ((f[0], f[1]), (f[1], f[2]), (f[2], f[0])))
+assert all(count == 1 for count in edges.values()), "edge traversed twice in the same direction"
+assert all((b, a) in edges for a, b in edges), "open edge"
+
+# enclosed volume (divergence theorem), positive for outward normals
+volume = np.einsum("ij,ij->i", triangles[:, 0], np.cross(triangles[:, 1], triangles[:, 2])).sum() / 6
+assert volume > 0
+print(f"{len(faces)} triangles, enclosed volume {volume * 1e-9:.4f} m³ (HPGeometry.volume {hp_c1_4.volume() * 1e-9:.4f} m³)")
+
+# STL: 80 byte header, triangle count, 50 bytes per triangle
+f = io.BytesIO()
+n_stl = write_stl(f, hp_c1_4, nx, ny, chunk_rows=7)
+data = f.getvalue()
+assert n_stl == len(faces)
+assert int(np.frombuffer(data[80:84], dtype="<u4")[0]) == n_stl and len(data) == 84 + 50 * n_stl
+
+# PLY: element counts in the header, tendons as edges; two shells side by side
+shells = [(hp_c1_4, (0.0, 0.0, 0.0)), (hp_c1_4, (0.0, hp_c1_4.B, 0.0))]
+f = io.BytesIO()
+n_ply = write_ply(f, shells, nx, ny, chunk_rows=7)
+header = f.getvalue().split(b"end_header\n")[0].decode("ascii").splitlines()
+elements = {line.split()[1]: int(line.split()[2]) for line in header if line.startswith("element")}
+assert n_ply == elements["face"] == 2 * n_shell_triangles(nx, ny)
+assert elements["edge"] == 2 * 2 * hp_c1_4.nt
+assert elements["vertex"] == 2 * 2 * nx * ny + 2 * elements["edge"]
+body = f.getvalue().split(b"end_header\n", 1)[1]
+assert len(body) == 12 * elements["vertex"] + 13 * elements["face"] + 8 * elements["edge"]
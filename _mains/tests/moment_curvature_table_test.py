@@ -0,0 +1,50 @@
+import pickle
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from _mains.testing_files.testing_hp_slabs import hp_slab_c1_4_uls
+from core.analysis_core.moment_curvature_table import MomentCurvatureTable, get_station_table
+
+"""
+Moment-curvature table of the test slab at midspan: lookups, pickle round trip, .npy storage with memory-mapped
+loading and NaN outside the range of the table.
+"""
+
+table = get_station_table(hp_slab_c1_4_uls, 0.5, hogging=True)
+kappa_min, kappa_max = table.curvature_range
+M_min, M_max = table.moment_range
+print(f"{len(table)} points, κ = {kappa_min:.4f} ... {kappa_max:.4f} 1/m, M = {M_min:.1f} ... {M_max:.1f} kNm, "
+      f"M(κ=0) = {table.moment_at_zero_curvature():.1f} kNm")
+
+# the cached sagging table is the upper branch of the full table
+sagging = get_station_table(hp_slab_c1_4_uls, 0.5)
+assert get_station_table(hp_slab_c1_4_uls, 0.5) is sagging
+assert np.allclose(table.moment(sagging.curvatures), sagging.moments)
+
+# moment and curvature lookups are inverse to each other
+kappa = np.linspace(kappa_min, kappa_max, 101)
+assert np.allclose(table.curvature(table.moment(kappa)), kappa)
+assert np.all(table.tangent_stiffness(kappa) > 0)
+
+# NaN outside the table, on both sides
+outside = table.moment([kappa_min - 1e-3, kappa_max + 1e-3])
+assert np.all(np.isnan(outside))
+assert np.all(np.isnan(table.curvature([M_min - 1.0, M_max + 1.0])))
+assert np.isnan(sagging.moment(-1e-3))
+
+# pickle round trip
+copy = pickle.loads(pickle.dumps(table))
+assert all(np.array_equal(a, b, equal_nan=True) for a, b in
+           ((copy.curvatures, table.curvatures), (copy.moments, table.moments),
+            (copy.axial_strains, table.axial_strains)))
+
+# storage, loaded memory-mapped
+with tempfile.TemporaryDirectory() as directory:
+    path = Path(directory) / "table.npy"
+    table.save(path)
+    loaded = MomentCurvatureTable.load(path)
+    assert not loaded.moments.flags.owndata      # view of the mapped file, no copy
+    assert np.array_equal(loaded.moment(kappa), table.moment(kappa), equal_nan=True)
+    del loaded
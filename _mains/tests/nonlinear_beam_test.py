@@ -0,0 +1,41 @@
+import numpy as np
+
+from core.analysis_core.moment_curvature_table import MomentCurvatureTable
+from core.analysis_core.statics import NUMBER_OF_SPANS
+from core.analysis_core.statics.continuous_beam import ContinuousBeam
+from core.analysis_core.statics.internal_forces import InternalForces
+from core.analysis_core.statics.nonlinear_beam import NonlinearBeam
+
+"""
+NonlinearBeam with linear moment-curvature tables (M = EI κ) is a linear-elastic beam: Newton-Raphson converges
+in one iteration to the support moments of InternalForces / ContinuousBeam.
+"""
+
+EI = 5000.0     # [kNm²]
+w = 12.0        # [kN/m]
+linear = MomentCurvatureTable([-1.0, 1.0], [-EI, EI])
+
+for system in ("TWO_SPAN", "THREE_SPAN", "FIVE_SPAN"):
+    beam = NonlinearBeam([6.0] * NUMBER_OF_SPANS[system], lambda xi, hogging: linear)
+    result = beam.solve(w)
+    expected = InternalForces.get_continuous_beam(system, 6.0).support_moments(w)
+
+    assert result["converged"] and result["iterations"] == 1, result["iterations"]
+    assert np.allclose(result["support_moments"], expected, atol=1e-6 * np.max(np.abs(expected)))
+    print(f"{system:10s} {np.round(result['support_moments'], 2)} kNm")
+
+# unequal spans and loads
+spans = [4.0, 7.5, 5.0]
+loads = [10.0, 14.0, 8.0]
+result = NonlinearBeam(spans, lambda xi, hogging: linear).solve(loads)
+expected = ContinuousBeam(spans).support_moments(loads)
+assert result["iterations"] == 1
+assert np.allclose(result["support_moments"], expected, atol=1e-6 * np.max(np.abs(expected)))
+
+# a moment at zero curvature (prestress) adds secondary support moments that do not depend on the load
+elastic = NonlinearBeam(spans, lambda xi, hogging: linear)
+prestressed = NonlinearBeam(spans, lambda xi, hogging: MomentCurvatureTable([-1.0, 1.0], [200.0 - EI, 200.0 + EI]))
+secondary = [prestressed.solve(q)["support_moments"] - elastic.solve(q)["support_moments"]
+             for q in (0.5 * np.array(loads), np.array(loads))]
+assert np.allclose(secondary[0], secondary[1], atol=1e-6)
+print(f"secondary support moments of M(κ=0) = 200 kNm: {np.round(secondary[1], 2)} kNm")
@@ -0,0 +1,45 @@
+import tempfile
+from pathlib import Path
+
+from _mains.testing_files.testing_floor import test_floor
+from _mains.testing_files.testing_loads import test_loads
+from _mains.testing_files.testing_materials import infill, fyk_Q142, Es_Q142, ftk_Q142, epsuk_Q142, density_Q142
+from core.analysis_core.parameter_sweep import SweepContext, parameter_grid, run_sweep
+
+"""
+Author: Elliot Melcer
+Parameter sweep over the C.1. Section 4 geometry (Loutfi 2023), varying thickness, tendon count and prestress.
+
+Running the sweep a second time on the same output file evaluates nothing: all designs are already in it.
+"""
+
+context = SweepContext(
+    cfrp_products={
+        "Q142": dict(fyk=fyk_Q142, Es=Es_Q142, ftk=ftk_Q142, epsuk=epsuk_Q142, density=density_Q142),
+    },
+    infill_material=infill,
+    floor=test_floor,
+    loads=test_loads,
+    checks=[("THREE_SPAN", "MAX_POS_MOMENT"), ("THREE_SPAN", "MAX_NEG_MOMENT")],
+)
+
+space = dict(
+    B=[1200], L=[6750], Hx=[100], Hy=[400],
+    t=[60, 80, 100],
+    dy=[80],
+    nt=[6, 8, 10],
+    fck=[50, 55],
+    cfrp=["Q142"],
+    prestress=[0.0, 0.5],
+    reinf_area=[80],
+)
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "parameter_sweep_test.csv"
+        n_new = run_sweep(parameter_grid(space), context, path)
+        print(f"{n_new} designs evaluated")
+        assert n_new == len(list(parameter_grid(space)))
+
+        # resume: every design is already in the output file
+        assert run_sweep(parameter_grid(space), context, path) == 0
@@ -0,0 +1,55 @@
+import pickle
+import tempfile
+from pathlib import Path
+
+from _mains.testing_files.testing_floor import test_floor
+from _mains.testing_files.testing_loads import test_loads
+from _mains.testing_files.testing_materials import infill, fyk_Q142, Es_Q142, ftk_Q142, epsuk_Q142, density_Q142
+from core.analysis_core.parameter_sweep import SweepContext, parameter_grid
+from core.analysis_core.pareto_front import ParetoContext, explore_pareto_front, read_front
+
+"""
+Cost / GWP / utilization trade-off of three-span designs around the C.1. Section 4 geometry (Loutfi 2023).
+The changes of the front are streamed to a JSON Lines file (see read_front).
+"""
+
+context = ParetoContext(
+    sweep=SweepContext(
+        cfrp_products={
+            "Q142": dict(fyk=fyk_Q142, Es=Es_Q142, ftk=ftk_Q142, epsuk=epsuk_Q142, density=density_Q142),
+        },
+        infill_material=infill,
+        floor=test_floor,
+        loads=test_loads,
+        checks=[("THREE_SPAN", "MAX_POS_MOMENT"), ("THREE_SPAN", "MAX_NEG_MOMENT")],
+    ),
+    cfrp_gwp=20.0,      # kg CO2eq/kg, assumed
+    cfrp_cost=30.0,     # €/kg, assumed
+)
+
+space = dict(
+    B=[1200], L=[6750], Hx=[100], Hy=[300, 400],
+    t=[40, 50, 60, 80, 100],
+    dy=[80],
+    nt=[6, 8, 10],
+    fck=[50, 55],
+    cfrp=["Q142"],
+    prestress=[0.5],
+    reinf_area=[20, 40, 80],
+)
+
+# the optimiser computing GWP and cost is built once with the context and sent along to the workers
+assert pickle.loads(pickle.dumps(context)).optimizer.cfrp_gwp == context.cfrp_gwp
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "pareto_front_test.jsonl"
+        front = explore_pareto_front(parameter_grid(space), context, path)
+
+        # the streamed changes replay to the final front
+        assert {r["design_id"] for r in read_front(path)} == {r["design_id"] for r in front.records}
+
+    for record in sorted(front.records, key=lambda r: r["cost"]):
+        print(f"t = {record['t']:4.0f}, nt = {record['nt']:2d}, fck = {record['fck']}, "
+              f"reinf_area = {record['reinf_area']:3.0f}: cost = {record['cost']:6.2f} €/m², "
+              f"GWP = {record['gwp']:6.2f} kg CO2eq/m², utilization = {record['max_utilization']:.3f}")
@@ -0,0 +1,40 @@
+import csv
+import tempfile
+from pathlib import Path
+
+from _mains.testing_files.testing_floor import test_floor
+from _mains.testing_files.testing_materials import infill, fyk_Q142, Es_Q142, ftk_Q142, epsuk_Q142, density_Q142
+from core.analysis_core.portfolio import PortfolioContext, run_portfolio
+
+"""
+Portfolio check of the slabs in testing_portfolio.csv.
+
+Running the portfolio a second time on the same output file checks nothing: all slabs are already in it.
+A slab that failed is checked again on resume (unless retry_failed=False).
+"""
+
+context = PortfolioContext(
+    cfrp_products={
+        "Q142": dict(fyk=fyk_Q142, Es=Es_Q142, ftk=ftk_Q142, epsuk=epsuk_Q142, density=density_Q142),
+    },
+    infill_material=infill,
+    floors={"default": test_floor},
+)
+
+if __name__ == "__main__":
+    portfolio = Path(__file__).parents[1] / "testing_files" / "testing_portfolio.csv"
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "portfolio_test.csv"
+        n_new = run_portfolio(portfolio, context, path)
+        print(f"{n_new} slabs checked")
+        assert n_new > 0 and run_portfolio(portfolio, context, path) == 0
+
+    # resume retries failed slabs: the second slab refers to an unknown floor
+    with open(portfolio, newline="", encoding="utf-8") as f:
+        slabs = list(csv.DictReader(f))[:2]
+    slabs[1]["floor"] = "missing"
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "portfolio_retry.csv"
+        assert run_portfolio(slabs, context, path) == 2
+        assert run_portfolio(slabs, context, path) == 1
+        assert run_portfolio(slabs, context, path, retry_failed=False) == 0
@@ -0,0 +1,39 @@
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from _mains.testing_files.testing_loads import test_loads
+from _mains.testing_files.testing_slab_construction import test_slab_construction
+from core.analysis_core.statics.pushover import SNAPSHOT_COLUMNS, calculate_pushover
+from core.ioh_core.snapshots import read_snapshots
+
+"""
+Pushover of the test slab as two-span system: permanent load plus the variable load scaled up to failure.
+The snapshot file holds every converged increment of the returned load-deflection path.
+"""
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        result = calculate_pushover(test_slab_construction, test_loads, Path(directory) / "pushover_test.bin",
+                                    "TWO_SPAN")
+
+        print(f"Failure load factor: {result['failure_load_factor']:.2f} ({result['steps']} increments, "
+              f"{result['factorizations']} factorisations)")
+
+        # failure reached beyond the design load, every increment converged and stored
+        assert result["failed"] and result["failure_load_factor"] > 1.0
+        assert result["steps"] > 0 and np.all(np.isfinite(result["max_deflection"]))
+
+        snapshots = read_snapshots(result["path"])
+        assert len(snapshots) == result["steps"] + 1
+        assert np.array_equal(snapshots[:, SNAPSHOT_COLUMNS.index("load_factor")], result["load_factor"])
+        assert np.array_equal(snapshots[:, SNAPSHOT_COLUMNS.index("max_deflection")], result["max_deflection"])
+        assert np.all(snapshots[1:, SNAPSHOT_COLUMNS.index("iterations")] >= 1)
+
+        # the deflection grows with the load up to the peak
+        peak = int(np.argmax(result["load_factor"]))
+        assert np.all(np.diff(result["max_deflection"][:peak + 1]) > 0)
+
+        for record in snapshots[::max(len(snapshots) // 10, 1)]:
+            print(", ".join(f"{name} = {value:.3f}" for name, value in zip(SNAPSHOT_COLUMNS, record)))
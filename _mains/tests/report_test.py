@@ -0,0 +1,24 @@
+import re
+import tempfile
+import time
+
+from _mains.testing_files.testing_hp_slabs import hp_slab_c1_4_uls
+from core.visualization_core.report import render_reports
+
+"""
+Section reports of several slabs rendered headless in a process pool, one multi-page PDF per slab.
+"""
+
+slabs = {f"slab_{i}": hp_slab_c1_4_uls for i in range(3)}
+stations = (0.0, 0.5)
+
+with tempfile.TemporaryDirectory() as directory:
+    start = time.perf_counter()
+    paths = render_reports(slabs, directory, stations=stations, max_workers=3)
+    print(f"{len(paths)} reports in {time.perf_counter() - start:.1f} s")
+
+    for name, path in paths.items():
+        assert path.name == f"{name}.pdf" and path.stat().st_size > 0
+        pages = re.findall(rb"/Type /Page\b(?!s)", path.read_bytes())
+        assert len(pages) == len(stations)
+        print(f"{name}: {path.stat().st_size / 1024:.0f} kB")
@@ -0,0 +1,11 @@
+from _mains.testing_files.testing_loads import test_loads
+from _mains.testing_files.testing_slab_construction import test_slab_construction
+from core.analysis_core.checks.serviceability_checks import StressLimitationCheckEC2004DE
+
+"""
+Stress limitation of the test slab as two-span beam, characteristic and quasi-permanent combination at the span
+and support stations. The moment-curvature tables of both stations are computed once.
+"""
+
+results = StressLimitationCheckEC2004DE.calculateResults(test_slab_construction, test_loads, "TWO_SPAN", log=print)
+print(f"max. utilization = {max(result.utilization for result in results):.3f}")
@@ -0,0 +1,32 @@
+import numpy as np
+from structuralcodes.materials.concrete import create_concrete
+
+from _mains.testing_files.testing_slab_construction import test_slab_construction
+from core.analysis_core.material_methods import create_uls_concrete, tabulated_law
+from core.analysis_core.section_methods import sls_section
+
+"""
+Tabulated Sargin (SLS) and parabola-rectangle (ULS) laws: interpolation error against the exact laws within the
+estimated error, and identical Marin results of the SLS section with and without tabulation.
+"""
+
+for fck in (30, 50, 80):
+    for law in (create_concrete(fck=fck, constitutive_law="sargin").constitutive_law,
+                create_uls_concrete(fck).constitutive_law):
+        table = tabulated_law(law)
+        eps_min, _ = law.get_ultimate_strain()
+        eps = np.linspace(eps_min + 1e-5, 0.0, 100_001)
+        error = np.abs(table.get_stress(eps) - law.get_stress(eps.copy())).max()
+        print(f"C{fck} {type(law).__name__:18s} {table.n_nodes:3d} nodes  error {error:.4f} <= {table.error_estimate:.4f} MPa")
+        assert error <= table.error_estimate + 1e-9
+
+# the stored segments give the Marin coefficients of the public __marin__ of the wrapped law
+law = create_concrete(fck=30, constitutive_law="sargin").constitutive_law
+for strain in ((-0.001, 0.0), (-0.0005, 2e-5)):
+    assert tabulated_law(law).__marin__(strain=list(strain)) == law.__marin__(strain=list(strain))
+
+section = test_slab_construction.slab.section_at(0.39)
+m_exact = sls_section(section, False).section_calculator.calculate_bending_strength().m_y
+m_tabulated = sls_section(section, False, tabulated=True).section_calculator.calculate_bending_strength().m_y
+print(f"M_u = {m_exact / 1e6:.3f} kNm (exact law), {m_tabulated / 1e6:.3f} kNm (tabulated)")
+assert m_exact == m_tabulated
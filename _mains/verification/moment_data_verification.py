@@ -0,0 +1,49 @@
+import numpy as np
+
+from core.analysis_core.statics import MOMENT_DATA, NUMBER_OF_SPANS
+from core.analysis_core.statics.internal_forces import InternalForces
+
+"""
+This file is used for verification of the moment coefficients in MOMENT_DATA against the
+linear-elastic continuous beam solver (equal spans, uniform load on all spans, w = 1, L = 1).
+
+The tabulated x_positions of the maximum span moments partly come from Stab2D-NL analyses, so the
+coefficient is compared with the solver moment at the tabulated x_position as well as with the
+exact elastic maximum.
+
+Output:
+
+System        Type              Table     at x      max    x_max
+SIMPLE_BEAM   MAX_POS_MOMENT    0.125    0.125    0.125    0.500
+TWO_SPAN      MAX_POS_MOMENT    0.070    0.070    0.070    0.375
+TWO_SPAN      MAX_NEG_MOMENT   -0.125   -0.125   -0.125    1.000
+THREE_SPAN    MAX_POS_MOMENT    0.080    0.080    0.080    0.400
+THREE_SPAN    MAX_NEG_MOMENT   -0.100   -0.100   -0.100    1.000
+FOUR_SPAN     MAX_POS_MOMENT    0.077    0.077    0.077    0.393
+FOUR_SPAN     MAX_NEG_MOMENT   -0.107   -0.107   -0.107    1.000
+FIVE_SPAN     MAX_POS_MOMENT    0.078    0.078    0.078    0.395
+FIVE_SPAN     MAX_NEG_MOMENT   -0.105   -0.105   -0.105    1.000
+"""
+
+print(f"{'System':<14}{'Type':<17}{'Table':>6}{'at x':>9}{'max':>9}{'x_max':>9}")
+
+for system, n_spans in NUMBER_OF_SPANS.items():
+    beam = InternalForces.get_continuous_beam(system, span=1.0)
+
+    # first span (and first interior support) governs for equal spans
+    x = np.linspace(0.0, 1.0, 10001)
+    m = beam.moments(x, 1.0)
+
+    for moment_type, data in MOMENT_DATA[system].items():
+        coefficient = data["coefficient"]
+        if coefficient == 0.0:
+            continue
+
+        m_at_x = float(beam.moments(data["x_position"], 1.0))
+        i = np.argmax(m) if moment_type == "MAX_POS_MOMENT" else np.argmin(m)
+
+        print(f"{system:<14}{moment_type:<17}{coefficient:>6.3f}{m_at_x:>9.3f}{m[i]:>9.3f}{x[i]:>9.3f}")
+
+        # table values are rounded to three digits
+        assert abs(m_at_x - coefficient) < 1e-3
+        assert abs(m[i] - coefficient) < 1e-3
@@ -0,0 +1,215 @@
+"""
+Airborne and impact sound insulation of slab constructions (DIN 4109, estimates for massive floors).
+
+A floor build-up is reduced to three values: the mass bonded to the slab (layers below the resilient layer), the
+mass of the floating screed (resilient layer and everything above) and the dynamic stiffness s' of the resilient
+layer. FloorBuildUps holds these as arrays, so catalogues of thousands of build-ups are evaluated and ranked with
+one vectorised call of AcousticCheckDIN4109.calculateSoundInsulation.
+
+Note: the HP slab enters with its mean surface mass (shell and minimum infill); the mass law of DIN 4109-32 is
+an estimate for shells of varying thickness.
+"""
+import warnings
+from dataclasses import dataclass
+from typing import Dict, Iterable
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from core.analysis_core.checks.check_results import CheckLog, log_lines
+from core.analysis_core.code_checks_acoustic import (
+    MAX_IMPACT_SOUND_LEVEL, REQUIRED_AIRBORNE_INSULATION, U_PROG_AIRBORNE, U_PROG_IMPACT,
+    airborne_sound_improvement, airborne_sound_insulation, equivalent_impact_sound_level,
+    impact_sound_improvement, resonance_frequency,
+)
+from slab_construction.slab_construction import Floor, SlabConstruction
+
+# Layers up to this density [kg/m³] under a heavier layer are taken for resilient layers missing their s'
+RESILIENT_LAYER_MAX_DENSITY: float = 300.0
+
+
+@dataclass(slots=True)
+class FloorBuildUps:
+    """
+    Acoustic parameters of n floor build-ups, arrays of shape (n,)
+
+    Note: masses in [kg/m²], dynamic stiffness in [MN/m³] (NaN without resilient layer)
+    """
+    bound_mass: np.ndarray
+    floating_mass: np.ndarray
+    dynamic_stiffness: np.ndarray
+
+    def __post_init__(self):
+        bound, floating, s_dyn = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(a, dtype=float)) for a in
+              (self.bound_mass, self.floating_mass, self.dynamic_stiffness))
+        )
+        if bound.ndim != 1:
+            raise ValueError("FloorBuildUps parameters must be scalars or one-dimensional arrays")
+        if np.any(~np.isnan(s_dyn) & (floating <= 0)):
+            raise ValueError("Build-ups with a resilient layer need a floating mass")
+
+        self.bound_mass, self.floating_mass, self.dynamic_stiffness = bound.copy(), floating.copy(), s_dyn.copy()
+
+    def __len__(self) -> int:
+        return len(self.bound_mass)
+
+    @staticmethod
+    def floor_parameters(floor: Floor) -> tuple[float, float, float]:
+        """
+        Returns (bound mass, floating mass, s') of a floor, layers ordered from the slab upwards.
+        Several resilient layers act in series; layers between them belong to the floating screed.
+        """
+        resilient = [i for i, layer in enumerate(floor.layers)
+                     if getattr(layer.material, "dynamic_stiffness", None) is not None]
+        masses = [layer.material.density * layer.thickness * 1e-3 for layer in floor.layers]    # [kg/m²]
+
+        if not resilient:
+            FloorBuildUps._warn_missing_dynamic_stiffness(floor)
+            return sum(masses), 0.0, np.nan
+
+        s_dyn = 1 / sum(1 / floor.layers[i].material.dynamic_stiffness for i in resilient)
+        return sum(masses[:resilient[0]]), sum(masses[resilient[0]:]), s_dyn
+
+    @staticmethod
+    def _warn_missing_dynamic_stiffness(floor: Floor) -> None:
+        """
+        Warns if a light layer without dynamic stiffness lies under a heavier layer (e.g. insulation under a
+        screed): the floor is then treated as bonded, without the improvement of a floating screed
+        """
+        layers = [layer for layer in floor.layers if layer.thickness > 0]
+        for i, layer in enumerate(layers):
+            density = layer.material.density
+            heavier_above = any(above.material.density > density for above in layers[i + 1:])
+            if density <= RESILIENT_LAYER_MAX_DENSITY and heavier_above:
+                warnings.warn(
+                    f"Floor layer '{layer.material.name}' (density {density:.0f} kg/m³) lies under a heavier layer "
+                    f"but has no dynamic stiffness; the floor is treated as bonded (no floating screed)",
+                    stacklevel=3,
+                )
+                return
+
+    @classmethod
+    def from_floors(cls, floors: Iterable[Floor]) -> "FloorBuildUps":
+        """
+        Returns the build-ups of a catalogue of floors
+        """
+        parameters = np.array([cls.floor_parameters(floor) for floor in floors], dtype=float).reshape(-1, 3)
+        return cls(*parameters.T)
+
+
+class AcousticCheckDIN4109:
+    """
+    Sound insulation between dwellings (DIN 4109-1 requirements, DIN 4109-2 prediction with the safety margin
+    u_prog): R'w - u_prog >= erf. R'w and L'n,w + u_prog <= zul. L'n,w.
+
+    Flanking transmission enters with the corrections K_airborne (subtracted from Rw) and K_impact (added to
+    Ln,w, DIN 4109-2 Table 3), to be determined for the building.
+    """
+
+    @staticmethod
+    def slab_mass(slab_construction: SlabConstruction) -> float:
+        """
+        Returns the surface mass of the slab with its minimum infill in [kg/m²]
+        """
+        load = slab_construction.structural_dead_load() + slab_construction.slab.infill_load()     # [kN/m²]
+        return load * 1000 / 10
+
+    @staticmethod
+    def calculateSoundInsulation(
+            slab_mass: ArrayLike,
+            build_ups: FloorBuildUps,
+            K_airborne: float = 0.0,
+            K_impact: float = 0.0,
+            required_R_w: float = REQUIRED_AIRBORNE_INSULATION,
+            max_L_n_w: float = MAX_IMPACT_SOUND_LEVEL
+    ) -> Dict[str, np.ndarray]:
+        """
+        Sound insulation of all combinations of slab mass and floor build-up (broadcast against each other)
+
+        :param slab_mass: Surface mass of the slab in kg/m², scalar or one value per build-up
+        :param build_ups: Floor build-ups
+        :param K_airborne: Flanking correction of the airborne sound insulation in dB
+        :param K_impact: Flanking correction of the impact sound level in dB
+        :param required_R_w: Required R'w in dB
+        :param max_L_n_w: Admissible L'n,w in dB
+        :return: Dictionary with 'm_base' [kg/m²], 'f0' [Hz], 'R_w', 'delta_R_w', 'R_w_building', 'L_n_eq',
+                 'delta_L_w', 'L_n_w_building', 'airborne_margin', 'impact_margin' [dB] (margins including
+                 u_prog, negative if failing), 'utilization' and 'passes'
+        """
+        m_base = np.asarray(slab_mass, dtype=float) + build_ups.bound_mass
+        f0 = resonance_frequency(build_ups.dynamic_stiffness, build_ups.floating_mass)
+
+        # the screed adds to the mass of the base floor without resilient layer
+        bonded = np.isnan(f0)
+        m_airborne = m_base + np.where(bonded, build_ups.floating_mass, 0.0)
+
+        R_w = airborne_sound_insulation(m_airborne)
+        delta_R_w = airborne_sound_improvement(f0, R_w)
+        R_w_building = R_w + delta_R_w - K_airborne
+
+        L_n_eq = equivalent_impact_sound_level(m_airborne)
+        delta_L_w = impact_sound_improvement(f0)
+        L_n_w_building = L_n_eq - delta_L_w + K_impact
+
+        airborne_margin = R_w_building - U_PROG_AIRBORNE - required_R_w
+        impact_margin = max_L_n_w - (L_n_w_building + U_PROG_IMPACT)
+
+        # ratio of the transmitted to the admissible sound energy of the governing requirement
+        utilization = 10 ** (-np.minimum(airborne_margin, impact_margin) / 10)
+
+        return {
+            "m_base": m_base,
+            "f0": f0,
+            "R_w": R_w,
+            "delta_R_w": delta_R_w,
+            "R_w_building": R_w_building,
+            "L_n_eq": L_n_eq,
+            "delta_L_w": delta_L_w,
+            "L_n_w_building": L_n_w_building,
+            "airborne_margin": airborne_margin,
+            "impact_margin": impact_margin,
+            "utilization": utilization,
+            "passes": utilization <= 1.0,
+        }
+
+    @staticmethod
+    def rank(result: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Returns the indices of the build-ups ordered from the largest to the smallest governing margin
+        """
+        return np.argsort(result["utilization"], kind="stable")
+
+    @staticmethod
+    def calculateUtilization(
+            slab_construction: SlabConstruction,
+            K_airborne: float = 0.0,
+            K_impact: float = 0.0,
+            log: CheckLog = print
+    ) -> float:
+        """
+        Calculate utilization ratio for the sound insulation of a slab construction with its floor
+
+        :param slab_construction: Slab construction object
+        :param K_airborne: Flanking correction of the airborne sound insulation in dB
+        :param K_impact: Flanking correction of the impact sound level in dB
+        :param log: Callback receiving the report lines (default print, None for silent)
+        :return: Utilization ratio (transmitted / admissible sound energy of the governing requirement)
+        """
+        result = AcousticCheckDIN4109.calculateSoundInsulation(
+            AcousticCheckDIN4109.slab_mass(slab_construction),
+            FloorBuildUps.from_floors([slab_construction.floor]),
+            K_airborne, K_impact,
+        )
+        r = {name: values[0] for name, values in result.items()}
+
+        log_lines([
+            f"m' = {r['m_base']:.1f} kg/m², f0 = {r['f0']:.1f} Hz",
+            f"R'w = {r['R_w_building']:.1f} dB (Rw = {r['R_w']:.1f} dB, ΔRw = {r['delta_R_w']:.1f} dB), "
+            f"required {REQUIRED_AIRBORNE_INSULATION:.0f} dB",
+            f"L'n,w = {r['L_n_w_building']:.1f} dB (Ln,eq,0,w = {r['L_n_eq']:.1f} dB, ΔLw = {r['delta_L_w']:.1f} dB), "
+            f"admissible {MAX_IMPACT_SOUND_LEVEL:.0f} dB",
+            f"Utilization = {r['utilization']:.3f} ({r['utilization'] * 100:.1f}%)\n",
+        ], log)
+
+        return float(r["utilization"])
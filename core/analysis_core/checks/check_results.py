@@ -0,0 +1,115 @@
+from dataclasses import astuple, dataclass, fields
+from typing import Callable, Iterable, Optional
+
+import numpy as np
+
+# Receives the report lines of a check, e.g. print or logging.getLogger(...).info
+CheckLog = Optional[Callable[[str], None]]
+
+
+def log_lines(lines: Iterable[str], log: CheckLog) -> None:
+    """
+    Passes report lines to the callback (nothing happens for None)
+    """
+    if log is not None:
+        for line in lines:
+            log(line)
+
+
+@dataclass(slots=True)
+class SectionResistance:
+    """
+    Bending resistance of one section, shared by all checks of that section
+    """
+    MRd: float                      # [kNm]
+    section_fingerprint: str        # see section_fingerprint
+    time: float                     # [s]
+
+
+@dataclass(slots=True)
+class UltimateMomentCheckResult:
+    """
+    Result of one ultimate moment check
+
+    Note: moments in [kNm], signed as in InternalForces (MRd negative for hogging), times in [s]
+    """
+    system: str
+    moment: str
+    x_position: float
+    n: float
+    MEd: float
+    MRd: float
+    utilization: float
+    section_fingerprint: str        # see section_fingerprint
+    resistance_time: float          # section solve (shared solves are reported for every check using them)
+    total_time: float
+
+    def report_lines(self) -> list[str]:
+        """
+        Returns the report of the check as lines of text
+        """
+        return [
+            f"System: {self.system}, Moment Type: {self.moment}",
+            f"x-position: {self.x_position:.3f}",
+            f"M_Rd = {self.MRd:.3f} kNm",
+            f"M_Ed = {self.MEd:.3f} kNm",
+            f"Utilization = {self.utilization:.3f} ({self.utilization * 100:.1f}%)\n",
+        ]
+
+    def log(self, log: CheckLog) -> None:
+        log_lines(self.report_lines(), log)
+
+    def as_dict(self) -> dict:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+def results_to_columns(results: Iterable[UltimateMomentCheckResult]) -> dict[str, np.ndarray]:
+    """
+    Returns check results as columnar table: one array per field (float arrays for numbers, object
+    arrays for strings), e.g. for pandas.DataFrame(...) or np.savez(...)
+    """
+    rows = [astuple(result) for result in results]
+    names = [f.name for f in fields(UltimateMomentCheckResult)]
+
+    columns = {}
+    for i, name in enumerate(names):
+        values = [row[i] for row in rows]
+        if name in ("system", "moment", "section_fingerprint"):
+            columns[name] = np.array(values, dtype=object)
+        else:
+            columns[name] = np.array(values, dtype=float)
+
+    return columns
+
+
+@dataclass(slots=True)
+class StressLimitationResult:
+    """
+    Result of the stress limitation at one station for one combination
+
+    Note: moment in [kNm], stresses in [MPa] (concrete compression negative, limits positive), times in [s]
+    """
+    system: str
+    moment: str
+    x_position: float
+    combination: str
+    M: float
+    sigma_c: float
+    sigma_c_limit: float
+    sigma_p: float
+    sigma_p_limit: float
+    utilization: float
+    total_time: float
+
+    def report_lines(self) -> list[str]:
+        return [
+            f"System: {self.system}, Moment Type: {self.moment}, Combination: {self.combination}",
+            f"x-position: {self.x_position:.3f}",
+            f"M = {self.M:.3f} kNm",
+            f"sigma_c = {self.sigma_c:.2f} MPa (limit {-self.sigma_c_limit:.2f} MPa)",
+            f"sigma_p = {self.sigma_p:.1f} MPa (limit {self.sigma_p_limit:.1f} MPa)",
+            f"Utilization = {self.utilization:.3f} ({self.utilization * 100:.1f}%)\n",
+        ]
+
+    def log(self, log: CheckLog) -> None:
+        log_lines(self.report_lines(), log)
@@ -0,0 +1,122 @@
+"""
+Evaluation of several ultimate moment checks of one slab construction with shared resistances.
+
+Every check needs the bending resistance of one section, identified by (x_position, flipped, n) (see
+UltimateMomentCheckEC2004DE.resistanceRequest). Many system/moment cases share a section, e.g. the span
+sections at x = 0.404 or the support sections at x = 1.0, so the suite first collects the requests of all
+cases, solves every unique section once (optionally in a process pool) and then assembles the utilizations.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, Iterable, Optional
+
+from core.analysis_core.checks.check_results import CheckLog, SectionResistance, UltimateMomentCheckResult
+from core.analysis_core.checks.structural_checks import UltimateMomentCheckEC2004DE
+from core.analysis_core.loads import Loads
+from core.analysis_core.statics import MOMENT_DATA
+from slab_construction.slab_construction import SlabConstruction
+
+# All (system, moment type) cases with a non-zero moment, in the order of MOMENT_DATA
+ULTIMATE_MOMENT_CASES: tuple[tuple[str, str], ...] = tuple(
+    (system, moment)
+    for system, moments in MOMENT_DATA.items()
+    for moment, data in moments.items()
+    if data["coefficient"] != 0.0
+)
+
+
+def system_cases(system: str) -> list[tuple[str, str]]:
+    """
+    Returns the cases of a system: every moment type with a non-zero moment
+    """
+    system = system.strip().upper()
+    if system not in MOMENT_DATA:
+        raise ValueError(f"Invalid system '{system}'. Must be one of: {list(MOMENT_DATA.keys())}")
+
+    return [(system, moment) for moment, data in MOMENT_DATA[system].items() if data["coefficient"] != 0.0]
+
+
+def _solve_resistance(slab, request: tuple[float, bool, float]) -> SectionResistance:
+    return UltimateMomentCheckEC2004DE.solveResistance(slab, *request)
+
+
+class CheckSuite:
+    """
+    Set of ultimate moment checks (system, moment type) evaluated together for a slab construction
+    """
+
+    def __init__(self, cases: Optional[Iterable[tuple[str, str]]] = None, n: float = 0.0):
+        """
+        :param cases: (system, moment type) pairs, all cases with a non-zero moment (ULTIMATE_MOMENT_CASES)
+                      if not given
+        :param n: Axial force in N
+        """
+        cases = ULTIMATE_MOMENT_CASES if cases is None else cases
+        self.cases: list[tuple[str, str]] = [
+            (system.strip().upper(), moment.strip().upper()) for system, moment in cases
+        ]
+        self.n = n
+
+        # validates all cases before anything is computed
+        self.requests: Dict[tuple[str, str], tuple[float, bool, float]] = {
+            case: UltimateMomentCheckEC2004DE.resistanceRequest(*case, n) for case in self.cases
+        }
+
+    def unique_requests(self) -> list[tuple[float, bool, float]]:
+        """
+        Returns the distinct sections (x_position, flipped, n) needed by the checks
+        """
+        return list(dict.fromkeys(self.requests.values()))
+
+    def solve_resistances(self, slab, max_workers: int = 1) -> Dict[tuple[float, bool, float], SectionResistance]:
+        """
+        Returns the resistance of every unique section
+
+        :param slab: Slab with section_at
+        :param max_workers: Number of worker processes, 1 solves in the current process
+        """
+        requests = self.unique_requests()
+
+        if max_workers == 1 or len(requests) < 2:
+            resistances = [_solve_resistance(slab, request) for request in requests]
+        else:
+            with ProcessPoolExecutor(max_workers=min(max_workers or len(requests), len(requests))) as executor:
+                resistances = list(executor.map(_solve_resistance, repeat(slab), requests))
+
+        return dict(zip(requests, resistances))
+
+    def evaluate(
+            self,
+            slab_construction: SlabConstruction,
+            loads: Loads,
+            max_workers: int = 1,
+            log: CheckLog = None
+    ) -> list[UltimateMomentCheckResult]:
+        """
+        Returns the result of every case, in the order of the cases
+
+        :param slab_construction: Slab construction object
+        :param loads: Loads object (only uniformly distributed loads over all spans)
+        :param max_workers: Number of worker processes for the section solves, 1 solves in the current process
+        :param log: Callback receiving the report lines of every check, silent by default
+        """
+        resistances = self.solve_resistances(slab_construction.slab, max_workers)
+
+        return [
+            UltimateMomentCheckEC2004DE.calculateResult(
+                slab_construction, loads, *case, self.n, resistances[self.requests[case]], log
+            )
+            for case in self.cases
+        ]
+
+    def run(
+            self,
+            slab_construction: SlabConstruction,
+            loads: Loads,
+            max_workers: int = 1
+    ) -> Dict[tuple[str, str], float]:
+        """
+        Returns the utilization ratio (MEd/MRd) of every case (see evaluate)
+        """
+        results = self.evaluate(slab_construction, loads, max_workers)
+        return {(result.system, result.moment): result.utilization for result in results}
@@ -0,0 +1,461 @@
+"""
+Serviceability checks (EC2 2004, German NA) of one-way slabs at the critical stations of a system.
+
+The strain state of a station under a moment comes from its cached moment-curvature table (get_station_table,
+SLS section without concrete tension); stresses are evaluated with the SLS materials on all fibers of the
+station at once. One SLS section per station is built and cached (get_station_fibers) and serves all combinations.
+Crack widths are only evaluated at stations where the moment exceeds the cached cracking moment of the station
+(get_station_cracking_moment).
+"""
+import time
+from typing import Dict, Optional
+from weakref import WeakKeyDictionary
+
+import numpy as np
+from numpy.typing import ArrayLike
+from shapely import box
+from structuralcodes.sections import GenericSection
+
+from core.analysis_core.checks.check_results import CheckLog, StressLimitationResult, log_lines
+from core.analysis_core.checks.check_suite import system_cases
+from core.analysis_core.checks.structural_checks import StructuralCheck
+from core.analysis_core.loads import Loads
+from core.analysis_core.moment_curvature_table import get_station_table
+from core.analysis_core.section_methods import (
+    calculate_cracking_moment_sls, flipped_section, get_concrete, sls_section
+)
+from core.analysis_core.statics.deformations import Deformations
+from core.analysis_core.statics.internal_forces import InternalForces
+from core.unit_core import Nmm_to_kNm
+from slab_construction.slab_construction import SlabConstruction
+from slab_construction.slabs.one_way_slab import OneWaySlab
+
+# Stress limits EC2 7.2
+#   concrete: σc <= k1 fck (characteristic, 7.2(2)), σc <= k2 fck (quasi-permanent, 7.2(3), linear creep)
+#   tendons : σp <= k5 ftk (characteristic, 7.2(5) recommended value), σp <= 0.65 ftk (quasi-permanent,
+#             DIN EN 1992-1-1/NA); for CFRP the limits of the product approval may be lower
+CONCRETE_STRESS_LIMITS: Dict[str, float] = {"CHARACTERISTIC": 0.60, "QUASI-PERMANENT": 0.45}
+TENDON_STRESS_LIMITS: Dict[str, float] = {"CHARACTERISTIC": 0.75, "QUASI-PERMANENT": 0.65}
+
+# Crack width EC2 7.3.4, DIN EN 1992-1-1/NA
+#   kt   : factor for long-term loading
+#   wk,max: limit for prestressed members with bonded tendons, frequent combination (Table 7.1DE, XC1)
+CRACK_WIDTH_KT: float = 0.4
+CRACK_WIDTH_LIMIT: float = 0.2      # [mm]
+
+
+class SectionFibers:
+    """
+    Fiber arrays of the SLS section of a station: z-coordinates of the concrete outline and of the tendons
+    with their materials, for vectorised stress evaluation over many strain profiles
+
+    Note: coordinates in [mm], stresses in [MPa]
+    """
+
+    __slots__ = (
+        "polygons", "z_concrete", "concrete", "z_tendons", "tendon_areas", "tendon_diameters", "tendon_materials",
+        "_tendon_groups",
+    )
+
+    def __init__(self, section: GenericSection):
+        """
+        :param section: ULS section of the station (the SLS section is derived with sls_section)
+        """
+        sls = sls_section(section, concrete_tension=False)
+        geometry = sls.geometry
+
+        self.polygons = [g.polygon for g in geometry.geometries]
+
+        # the extreme concrete strains occur at vertices of the outline
+        z = []
+        for g in geometry.geometries:
+            z.append(np.asarray(g.polygon.exterior.coords.xy[1], dtype=float))
+            z.extend(np.asarray(ring.coords.xy[1], dtype=float) for ring in g.polygon.interiors)
+        self.z_concrete = np.unique(np.concatenate(z))
+        self.concrete = get_concrete(sls)
+
+        self.z_tendons = np.array([pg.point.y for pg in geometry.point_geometries], dtype=float)
+        self.tendon_areas = np.array([pg.area for pg in geometry.point_geometries], dtype=float)
+        self.tendon_diameters = np.array([pg.diameter for pg in geometry.point_geometries], dtype=float)
+        self.tendon_materials = [pg.material for pg in geometry.point_geometries]
+
+        # tendons sharing a material are evaluated with one call of its constitutive law
+        groups: dict[int, list[int]] = {}
+        for i, material in enumerate(self.tendon_materials):
+            groups.setdefault(id(material), []).append(i)
+        self._tendon_groups = [(self.tendon_materials[idx[0]], np.array(idx)) for idx in groups.values()]
+
+    @staticmethod
+    def strains(eps_0: ArrayLike, chi_y: ArrayLike, z: np.ndarray) -> np.ndarray:
+        """
+        Returns the strains ε = ε0 + χy z at the fibers z for strain profiles of shape (...), shape (..., n_fibers)
+        """
+        eps_0 = np.asarray(eps_0, dtype=float)[..., None]
+        chi_y = np.asarray(chi_y, dtype=float)[..., None]
+        return eps_0 + chi_y * z
+
+    @property
+    def z_range(self) -> tuple[float, float]:
+        return float(self.z_concrete[0]), float(self.z_concrete[-1])
+
+    def concrete_area_between(self, z_1: float, z_2: float) -> float:
+        """
+        Returns the concrete area [mm²] between the levels z_1 and z_2
+        """
+        z_low, z_high = min(z_1, z_2), max(z_1, z_2)
+        area = 0.0
+        for polygon in self.polygons:
+            y_min, _, y_max, _ = polygon.bounds
+            area += polygon.intersection(box(y_min, z_low, y_max, z_high)).area
+        return area
+
+    def effective_tension_area(self, eps_0: float, chi_y: float) -> Dict[str, float]:
+        """
+        Effective tension area (EC2 7.3.2(3), Figure 7.1) of a cracked strain profile and the tendons within it
+
+        :return: Dictionary with 'Ac_eff' [mm²], 'Ap' [mm²], 'diameter' (equivalent diameter, EC2 (7.12)) [mm]
+                 and 'eps_p' (largest strain of the concrete at the tendon level) [-]
+        """
+        z_min, z_max = self.z_range
+        h = z_max - z_min
+        eps_tendons = eps_0 + chi_y * self.z_tendons
+
+        # tension edge and compression depth x (sagging: chi_y < 0, tension at the bottom)
+        sagging = chi_y < 0
+        z_edge = z_min if sagging else z_max
+        z_neutral = -eps_0 / chi_y
+        x = np.clip(z_max - z_neutral if sagging else z_neutral - z_min, 0.0, h)
+
+        tension = eps_tendons > 0
+        if not np.any(tension):
+            tension = eps_tendons == eps_tendons.max()
+        weights = self.tendon_areas[tension]
+        d = h - abs(np.average(self.z_tendons[tension], weights=weights) - z_edge)
+
+        h_c_ef = min(2.5 * (h - d), (h - x) / 3, h / 2)
+        z_band = z_edge + h_c_ef if sagging else z_edge - h_c_ef
+
+        # tendons in the effective area, the one closest to the tension edge if the area contains none
+        in_band = np.abs(self.z_tendons - z_edge) <= h_c_ef
+        if not np.any(in_band):
+            in_band = np.abs(self.z_tendons - z_edge) == np.abs(self.z_tendons - z_edge).min()
+        diameters = self.tendon_diameters[in_band]
+
+        return {
+            "Ac_eff": self.concrete_area_between(z_edge, z_band),
+            "Ap": float(self.tendon_areas[in_band].sum()),
+            "diameter": float(np.sum(diameters ** 2) / np.sum(diameters)),
+            "eps_p": float(eps_tendons[in_band].max()),
+        }
+
+    def concrete_stress(self, eps_0: ArrayLike, chi_y: ArrayLike) -> np.ndarray:
+        """
+        Returns the largest concrete compressive stress (negative, 0 without compression) for every strain profile
+        """
+        eps = self.strains(eps_0, chi_y, self.z_concrete)
+        sigma = np.asarray(self.concrete.constitutive_law.get_stress(eps.ravel()), dtype=float).reshape(eps.shape)
+        return np.minimum(sigma.min(axis=-1), 0.0)
+
+    def tendon_stresses(self, eps_0: ArrayLike, chi_y: ArrayLike) -> np.ndarray:
+        """
+        Returns the stresses of all tendons (including prestress) for every strain profile, shape (..., n_tendons)
+        """
+        eps = self.strains(eps_0, chi_y, self.z_tendons)
+        sigma = np.empty_like(eps)
+        for material, idx in self._tendon_groups:
+            sigma[..., idx] = np.asarray(
+                material.constitutive_law.get_stress(eps[..., idx].ravel()), dtype=float
+            ).reshape(eps[..., idx].shape)
+        return sigma
+
+
+# SLS fibers of every station of a slab, released together with the slab
+_STATION_FIBERS: "WeakKeyDictionary[OneWaySlab, Dict[float, SectionFibers]]" = WeakKeyDictionary()
+
+
+def get_station_fibers(slab: OneWaySlab, xi: float) -> SectionFibers:
+    """
+    Returns the (cached) SLS fiber arrays of the slab section at station xi ∈ [0 ; 1]
+    """
+    fibers = _STATION_FIBERS.setdefault(slab, {})
+    xi = round(float(xi), 12)
+    if xi not in fibers:
+        fibers[xi] = SectionFibers(slab.section_at(xi))
+    return fibers[xi]
+
+
+# Cracking moments of every station of a slab [kNm, sagging positive], released together with the slab
+_STATION_CRACKING_MOMENTS: "WeakKeyDictionary[OneWaySlab, Dict[tuple, float]]" = WeakKeyDictionary()
+
+
+def get_station_cracking_moment(slab: OneWaySlab, xi: float, n: float = 0.0, hogging: bool = False) -> float:
+    """
+    Returns the (cached) cracking moment [kNm, sagging positive] of the slab section at station xi ∈ [0 ; 1],
+    the (negative) hogging cracking moment from the flipped section for hogging=True
+    """
+    moments = _STATION_CRACKING_MOMENTS.setdefault(slab, {})
+    key = (round(float(xi), 12), float(n), hogging)
+
+    if key not in moments:
+        section = slab.section_at(key[0])
+        if hogging:
+            moments[key] = Nmm_to_kNm(calculate_cracking_moment_sls(flipped_section(section), n)["m_cr"])
+        else:
+            moments[key] = -Nmm_to_kNm(calculate_cracking_moment_sls(section, n)["m_cr"])
+    return moments[key]
+
+
+def station_strains(slab: OneWaySlab, xi: float, moment: ArrayLike, n: float = 0.0) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the strain profiles (ε0 at the section origin, χy [1/mm] in structuralcodes sign) of the station xi
+    under the moments [kNm, sagging positive] from its cached moment-curvature table, NaN beyond the capacity
+    """
+    moment = np.asarray(moment, dtype=float)
+    table = get_station_table(slab, xi, n)
+    # the hogging branch is only needed below the moment at zero curvature
+    if np.any(moment < table.moments[0]):
+        table = get_station_table(slab, xi, n, hogging=True)
+
+    kappa = table.curvature(moment)                 # [1/m]
+    return table.axial_strain(kappa), -kappa / 1000     # chi_y [1/mm], sagging negative
+
+
+class StressLimitationCheckEC2004DE(StructuralCheck):
+    """
+    Stress limitation (EC2 7.2) of concrete and tendons under the characteristic and quasi-permanent
+    combinations at the critical stations (MOMENT_DATA) of a system
+    """
+
+    COMBINATIONS: tuple[str, ...] = ("CHARACTERISTIC", "QUASI-PERMANENT")
+
+    @staticmethod
+    def calculateResults(
+            slab_construction: SlabConstruction,
+            loads: Loads,
+            system: str = "SIMPLE_BEAM",
+            moments: Optional[list[str]] = None,
+            n: float = 0.0,
+            log: CheckLog = None
+    ) -> list[StressLimitationResult]:
+        """
+        Stress limitation at the stations of the given moment types, one result per station and combination
+
+        :param slab_construction: Slab construction object
+        :param loads: Loads object (only uniformly distributed loads over all spans)
+        :param system: Structural system type
+        :param moments: Moment types ("MAX_POS_MOMENT", "MAX_NEG_MOMENT"), all with a non-zero moment if not given
+        :param n: Axial force in N
+        :param log: Callback receiving the report lines, e.g. print
+        :return: Check results
+        """
+        slab = slab_construction.slab
+        system = system.strip().upper()
+        cases = system_cases(system) if moments is None else [(system, m.strip().upper()) for m in moments]
+        combinations = StressLimitationCheckEC2004DE.COMBINATIONS
+
+        results = []
+        for _, moment in cases:
+            start = time.perf_counter()
+            x_position = InternalForces.get_moment_data(system, moment)["x_position"]
+            InternalForces.validate_x_position(system, x_position)
+
+            # both combinations in one evaluation
+            M = np.array([InternalForces.calculate_moment(slab_construction, loads, system, moment, combination)
+                          for combination in combinations])
+            eps_0, chi_y = station_strains(slab, x_position, M, n)
+
+            fibers = get_station_fibers(slab, x_position)
+            sigma_c = fibers.concrete_stress(eps_0, chi_y)
+            sigma_p = fibers.tendon_stresses(eps_0, chi_y).max(axis=-1)
+
+            fck = fibers.concrete.fck
+            ftk = min(material.ftk for material in fibers.tendon_materials)
+            elapsed = (time.perf_counter() - start) / len(combinations)
+
+            for i, combination in enumerate(combinations):
+                sigma_c_limit = CONCRETE_STRESS_LIMITS[combination] * fck
+                sigma_p_limit = TENDON_STRESS_LIMITS[combination] * ftk
+                result = StressLimitationResult(
+                    system=system,
+                    moment=moment,
+                    x_position=float(x_position),
+                    combination=combination,
+                    M=float(M[i]),
+                    sigma_c=float(sigma_c[i]),
+                    sigma_c_limit=sigma_c_limit,
+                    sigma_p=float(sigma_p[i]),
+                    sigma_p_limit=sigma_p_limit,
+                    utilization=float(max(-sigma_c[i] / sigma_c_limit, sigma_p[i] / sigma_p_limit)),
+                    total_time=elapsed,
+                )
+                result.log(log)
+                results.append(result)
+
+        return results
+
+    @staticmethod
+    def calculateUtilization(
+            slab_construction: SlabConstruction,
+            loads: Loads,
+            system: str = "SIMPLE_BEAM",
+            moment: str = "MAX_POS_MOMENT",
+            n: float = 0.0,
+            log: CheckLog = print
+    ) -> float:
+        """
+        Calculate utilization ratio for the stress limitation at the station of a moment type
+
+        :param slab_construction: Slab construction object
+        :param loads: Loads object (only uniformly distributed loads over all spans)
+        :param system: Structural system type
+        :param moment: Moment type ("MAX_POS_MOMENT" or "MAX_NEG_MOMENT")
+        :param n: Axial force in N
+        :param log: Callback receiving the report lines (default print, None for silent)
+        :return: Largest utilization ratio (σ/σ_lim) of both combinations, NaN beyond the moment capacity
+        """
+        results = StressLimitationCheckEC2004DE.calculateResults(
+            slab_construction, loads, system, [moment], n, log
+        )
+        return max(result.utilization for result in results)
+
+
+class CrackWidthCheckEC2004DE(StructuralCheck):
+    """
+    Crack width (EC2 7.3.4, DIN EN 1992-1-1/NA) along the span under the frequent combination.
+
+    Adapted to prestressed CFRP tendons: σs is the stress change Δσp = Ep εp of the tendons from the state of zero
+    concrete strain at their level (EC2 7.3.4(1), note on bonded tendons), ρp,eff = Ap / Ac,eff with the tendons in
+    the effective tension area; bond factor ξ1 = 1 and no mixed reinforcement. At cracked stations whose tendons
+    are still compressed (Δσp < 0) the crack does not reach the tendons and wk = 0 is reported.
+    """
+
+    @staticmethod
+    def calculateCrackWidths(
+            slab_construction: SlabConstruction,
+            loads: Loads,
+            system: str = "SIMPLE_BEAM",
+            combination: str = "FREQUENT",
+            n: float = 0.0,
+            stations_per_span: int = 11
+    ) -> Dict[str, np.ndarray]:
+        """
+        Crack widths at the stations of the system (see Deformations.stations)
+
+        :param slab_construction: Slab construction object
+        :param loads: Loads object (only uniformly distributed loads over all spans)
+        :param system: Structural system type
+        :param combination: Load combination type
+        :param n: Axial force in N
+        :param stations_per_span: Number of stations per span
+        :return: Dictionary with 'x' (stations), 'moment' [kNm], 'cracked', 'sigma_s' [MPa], 'sr_max' [mm] and
+                 'crack_width' [mm], shape (n_x,); 0 at uncracked stations, beyond the moment capacity the crack
+                 width is inf (sigma_s and sr_max NaN)
+        """
+        system = system.strip().upper()
+        slab = slab_construction.slab
+
+        x = Deformations.stations(system, stations_per_span)
+        moment = InternalForces.calculate_moment_diagram(slab_construction, loads, x, system, combination)
+
+        # equal spans: stations with the same position within their span share one section
+        xi = np.round(np.where(x == np.floor(x), np.minimum(x, 1.0), x - np.floor(x)), 12)
+
+        # cracking moments only for the directions that occur at a station
+        cracked = np.zeros(len(x), dtype=bool)
+        for xi_j in np.unique(xi):
+            at = np.flatnonzero(xi == xi_j)
+            m = moment[at]
+            if np.any(m > 0):
+                cracked[at] |= m > get_station_cracking_moment(slab, xi_j, n)
+            if np.any(m < 0):
+                cracked[at] |= m < get_station_cracking_moment(slab, xi_j, n, hogging=True)
+
+        sigma_s = np.zeros(len(x))
+        sr_max = np.zeros(len(x))
+        crack_width = np.zeros(len(x))
+
+        # cracked stations of one section are evaluated with one table lookup
+        for xi_j in np.unique(xi[cracked]):
+            idx = np.flatnonzero(cracked & (xi == xi_j))
+            eps_0, chi_y = station_strains(slab, xi_j, moment[idx], n)
+
+            fibers = get_station_fibers(slab, xi_j)
+            fct_eff = fibers.concrete.fctm
+            Ep = min(material.Es for material in fibers.tendon_materials)
+            alpha_e = Ep / fibers.concrete.Ecm
+            for i, e, c in zip(idx, eps_0, chi_y):
+                if not (np.isfinite(e) and np.isfinite(c)):
+                    sigma_s[i] = sr_max[i] = np.nan
+                    crack_width[i] = np.inf
+                    continue
+
+                zone = fibers.effective_tension_area(e, c)
+                rho = zone["Ap"] / zone["Ac_eff"]
+                sigma = Ep * zone["eps_p"]
+
+                # EC2 (7.9) and (7.11), DIN EN 1992-1-1/NA: sr,max = φ / (3.6 ρ) <= σs φ / (3.6 fct,eff)
+                eps_sm_cm = max((sigma - CRACK_WIDTH_KT * fct_eff / rho * (1 + alpha_e * rho)) / Ep, 0.6 * sigma / Ep)
+                spacing = min(zone["diameter"] / (3.6 * rho), max(sigma, 0.0) * zone["diameter"] / (3.6 * fct_eff))
+
+                sigma_s[i] = sigma
+                sr_max[i] = spacing
+                crack_width[i] = max(0.0, spacing * eps_sm_cm)
+
+        return {
+            "x": x,
+            "moment": moment,
+            "cracked": cracked,
+            "sigma_s": sigma_s,
+            "sr_max": sr_max,
+            "crack_width": crack_width,
+        }
+
+    @staticmethod
+    def calculateUtilization(
+            slab_construction: SlabConstruction,
+            loads: Loads,
+            system: str = "SIMPLE_BEAM",
+            n: float = 0.0,
+            wk_max: float = CRACK_WIDTH_LIMIT,
+            stations_per_span: int = 11,
+            log: CheckLog = print
+    ) -> float:
+        """
+        Calculate utilization ratio for the crack width under the frequent combination
+
+        :param slab_construction: Slab construction object
+        :param loads: Loads object (only uniformly distributed loads over all spans)
+        :param system: Structural system type
+        :param n: Axial force in N
+        :param wk_max: Crack width limit in mm
+        :param stations_per_span: Number of stations per span
+        :param log: Callback receiving the report lines (default print, None for silent)
+        :return: Largest utilization ratio (wk/wk,max) along the span, inf beyond the moment capacity
+        """
+        start = time.perf_counter()
+        result = CrackWidthCheckEC2004DE.calculateCrackWidths(
+            slab_construction, loads, system, "FREQUENT", n, stations_per_span
+        )
+        wk = result["crack_width"]
+        utilization = float(np.max(wk)) / wk_max
+        finite = np.isfinite(wk)
+
+        lines = [f"System: {system.strip().upper()}, Combination: FREQUENT",
+                 f"Cracked stations: {int(result['cracked'].sum())} of {len(wk)}"]
+        if not np.all(finite):
+            lines.append(f"Stations beyond the moment capacity: {int(np.sum(~finite))} "
+                         f"(x = {', '.join(f'{x:.2f}' for x in result['x'][~finite])})")
+        if np.any(finite):
+            # governing station among those within the moment capacity
+            i = int(np.nanargmax(np.where(finite, wk, np.nan)))
+            lines += [
+                f"x-position: {result['x'][i]:.3f}",
+                f"M = {result['moment'][i]:.3f} kNm",
+                f"sigma_s = {result['sigma_s'][i]:.1f} MPa, sr,max = {result['sr_max'][i]:.1f} mm",
+                f"wk = {wk[i]:.3f} mm (limit {wk_max:.2f} mm)",
+            ]
+        lines += [f"Utilization = {utilization:.3f} ({utilization * 100:.1f}%)",
+                  f"Time: {time.perf_counter() - start:.2f} s\n"]
+        log_lines(lines, log)
+
+        return utilization
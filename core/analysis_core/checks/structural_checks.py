@@ -1,10 +1,15 @@
+import time
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from structuralcodes.sections import GenericSection
 
+from core.analysis_core.checks.check_results import CheckLog, SectionResistance, UltimateMomentCheckResult
 from core.analysis_core.statics.internal_forces import InternalForces
 from core.analysis_core.loads import Loads
-from core.analysis_core.section_methods import calculate_bending_strength_uls, flipped_section
+from core.analysis_core.section_methods import (
+    calculate_bending_strength_uls, flipped_section, section_fingerprint
+)
 from core.unit_core import Nmm_to_kNm
 from core.visualization_core.visualization import plot_cross_section
 from slab_construction.slab_construction import SlabConstruction
@@ -26,85 +31,131 @@ class StructuralCheck(ABC):
 class UltimateMomentCheckEC2004DE(StructuralCheck):
 
     @staticmethod
-    def calculateUtilization(
+    def resistanceRequest(system: str, moment: str, n: float = 0.0) -> tuple[float, bool, float]:
+        """
+        Returns the section the resistance of a check is computed for, as key (x_position, flipped, n):
+        the section at x_position (normalized, 0 at first support, 1 at second support, etc.), flipped for
+        hogging moments (MAX_NEG_MOMENT). Checks with equal keys share the same M_Rd.
+
+        :param system: Structural system type
+        :param moment: Moment type ("MAX_POS_MOMENT" or "MAX_NEG_MOMENT")
+        :param n: Axial force in N
+        """
+        # Normalize string inputs
+        system = system.strip().upper()
+        moment = moment.strip().upper()
+
+        # Get moment data (coefficient and x-position) from lookup table
+        x_position = InternalForces.get_moment_data(system, moment)["x_position"]
+
+        # Validate x-position is within bounds for this system
+        InternalForces.validate_x_position(system, x_position)
+
+        return float(x_position), moment == "MAX_NEG_MOMENT", float(n)
+
+    @staticmethod
+    def sectionResistance(section: GenericSection, flipped: bool, n: float = 0.0) -> float:
+        """
+        Returns the bending resistance M_Rd [kNm] of a section, positive for sagging, negative for hogging
+        (flipped section)
+        """
+        if not flipped:
+            return -Nmm_to_kNm(calculate_bending_strength_uls(section, n).get("m_u"))
+
+        rotated_section = flipped_section(section)
+        # plot_cross_section(rotated_section)
+        return Nmm_to_kNm(calculate_bending_strength_uls(rotated_section, n).get("m_u"))
+
+    @staticmethod
+    def calculateResistance(slab, x_position: float, flipped: bool, n: float = 0.0) -> float:
+        """
+        Returns the bending resistance M_Rd [kNm] of the slab section at x_position, positive for sagging,
+        negative for hogging (flipped section)
+
+        :param slab: Slab with section_at
+        :param x_position: Normalized position (0 at first support, 1 at second support, etc.)
+        :param flipped: Hogging resistance of the rotated section
+        :param n: Axial force in N
+        """
+        return UltimateMomentCheckEC2004DE.sectionResistance(slab.section_at(x_position), flipped, n)
+
+    @staticmethod
+    def solveResistance(slab, x_position: float, flipped: bool, n: float = 0.0) -> SectionResistance:
+        """
+        Same as calculateResistance, with fingerprint of the section and solve time
+        """
+        start = time.perf_counter()
+        section = slab.section_at(x_position)
+        MRd = UltimateMomentCheckEC2004DE.sectionResistance(section, flipped, n)
+        return SectionResistance(float(MRd), section_fingerprint(section), time.perf_counter() - start)
+
+    @staticmethod
+    def calculateResult(
             slab_construction: SlabConstruction,
             loads: Loads,
             system: str = "SIMPLE_BEAM",
             moment: str = "MAX_POS_MOMENT",
-            n: float = 0.0
-    ) -> float:
+            n: float = 0.0,
+            resistance: Optional[SectionResistance] = None,
+            log: CheckLog = None
+    ) -> UltimateMomentCheckResult:
         """
-        Calculate utilization ratio for ultimate moment check
+        Ultimate moment check, silent unless a log callback is given
 
-        :param n:
         :param slab_construction: Slab construction object
         :param loads: Loads object (only uniformly distributed loads over all spans)
-        :param system: Available structural system types:
-                            ("CANTILEVER",
-                            "SIMPLE_BEAM",
-                            "TWO_SPAN",
-                            "THREE_SPAN",
-                            "FOUR_SPAN" or
-                            "FIVE_SPAN")
-        :param moment: Moment type
-                            ("MAX_POS_MOMENT" or
-                            "MAX_NEG_MOMENT")
-        :return: Utilization ratio (MEd/MRd)
+        :param system: Structural system type (see calculateUtilization)
+        :param moment: Moment type ("MAX_POS_MOMENT" or "MAX_NEG_MOMENT")
+        :param n: Axial force in N
+        :param resistance: Resistance of the section if already known (see resistanceRequest, CheckSuite)
+        :param log: Callback receiving the report lines, e.g. print
+        :return: Check result
         """
-        slab = slab_construction.slab
+        start = time.perf_counter()
 
         # Normalize string inputs
         system = system.strip().upper()
         moment = moment.strip().upper()
 
-        # Get moment data (coefficient and x-position) from lookup table
-        moment_data = InternalForces.get_moment_data(system, moment)
-        x_position = moment_data["x_position"]
-
-        # Validate x-position is within bounds for this system
-        InternalForces.validate_x_position(system, x_position)
+        x_position, flipped, n = UltimateMomentCheckEC2004DE.resistanceRequest(system, moment, n)
 
         # Calculate resistance at the specific x-position where max moment occurs
-        # x_position is normalized (0 at first support, 1 at second support, etc.)
-        if moment == "MAX_POS_MOMENT":
-            MRd = -Nmm_to_kNm(
-                calculate_bending_strength_uls(slab.section_at(x_position), n).get("m_u")
-            )
-        else:
-            rotated_section = flipped_section(slab.section_at(x_position))
-            # plot_cross_section(rotated_section)
-            MRd = Nmm_to_kNm(
-                calculate_bending_strength_uls(rotated_section, n).get("m_u")
-            )
-
-        print(f"System: {system}, Moment Type: {moment}")
-        print(f"x-position: {x_position:.3f}")
-        print(f"M_Rd = {MRd:.3f} kNm")
+        if resistance is None:
+            resistance = UltimateMomentCheckEC2004DE.solveResistance(slab_construction.slab, x_position, flipped, n)
 
         # Calculate design moment based on system and moment type
         MEd = InternalForces.calculate_moment(slab_construction, loads, system, moment, "FUNDAMENTAL")
 
-        print(f"M_Ed = {MEd:.3f} kNm")
-
-        # Calculate utilization
-        utilization = abs(MEd / MRd)
-
-        print(f"Utilization = {utilization:.3f} ({utilization * 100:.1f}%)\n")
-
-        return utilization
+        result = UltimateMomentCheckResult(
+            system=system,
+            moment=moment,
+            x_position=x_position,
+            n=n,
+            MEd=MEd,
+            MRd=resistance.MRd,
+            utilization=float(abs(MEd / resistance.MRd)),
+            section_fingerprint=resistance.section_fingerprint,
+            resistance_time=resistance.time,
+            total_time=time.perf_counter() - start,
+        )
+        result.log(log)
+
+        return result
 
     @staticmethod
-    def calculateUtilizationRotatedSupportSection(
+    def calculateUtilization(
             slab_construction: SlabConstruction,
             loads: Loads,
             system: str = "SIMPLE_BEAM",
             moment: str = "MAX_POS_MOMENT",
-            n: float = 0.0
+            n: float = 0.0,
+            MRd: Optional[float] = None,
+            log: CheckLog = print
     ) -> float:
         """
         Calculate utilization ratio for ultimate moment check
 
-        :param n:
+        :param n: Axial force in N
         :param slab_construction: Slab construction object
         :param loads: Loads object (only uniformly distributed loads over all spans)
         :param system: Available structural system types:
@@ -117,48 +168,27 @@ class UltimateMomentCheckEC2004DE(StructuralCheck):
         :param moment: Moment type
                             ("MAX_POS_MOMENT" or
                             "MAX_NEG_MOMENT")
+        :param MRd: Bending resistance in kNm if already known (see resistanceRequest, CheckSuite)
+        :param log: Callback receiving the report lines (default print, None for silent)
         :return: Utilization ratio (MEd/MRd)
         """
-        slab = slab_construction.slab
-
-        # Normalize string inputs
-        system = system.strip().upper()
-        moment = moment.strip().upper()
-
-        # Get moment data (coefficient and x-position) from lookup table
-        moment_data = InternalForces.get_moment_data(system, moment)
-        x_position = moment_data["x_position"]
-
-        # Validate x-position is within bounds for this system
-        InternalForces.validate_x_position(system, x_position)
+        resistance = None if MRd is None else SectionResistance(MRd, "", 0.0)
 
-        # Calculate resistance at the specific x-position where max moment occurs
-        # x_position is normalized (0 at first support, 1 at second support, etc.)
-        if moment == "MAX_POS_MOMENT":
-            MRd = -Nmm_to_kNm(
-                calculate_bending_strength_uls(slab.section_at(x_position), n).get("m_u")
-            )
-        else:
-            rotated_section = flipped_section(slab.section_at(x_position))
-            # plot_cross_section(rotated_section)
-            MRd = Nmm_to_kNm(
-                calculate_bending_strength_uls(rotated_section, n).get("m_u")
-            )
-
-
-
-        print(f"System: {system}, Moment Type: {moment}")
-        print(f"x-position: {x_position}")
-        print(f"M_Rd = {MRd:.3f} kNm")
-
-        # Calculate design moment based on system and moment type
-        MEd = InternalForces.calculate_moment(slab_construction, loads, system, moment, "FUNDAMENTAL")
-
-        print(f"M_Ed = {MEd:.3f} kNm")
-
-        # Calculate utilization
-        utilization = abs(MEd / MRd)
-
-        print(f"Utilization = {utilization:.3f} ({utilization * 100:.1f}%)\n")
+        return UltimateMomentCheckEC2004DE.calculateResult(
+            slab_construction, loads, system, moment, n, resistance, log
+        ).utilization
 
-        return utilization
\ No newline at end of file
+    @staticmethod
+    def calculateUtilizationRotatedSupportSection(
+            slab_construction: SlabConstruction,
+            loads: Loads,
+            system: str = "SIMPLE_BEAM",
+            moment: str = "MAX_POS_MOMENT",
+            n: float = 0.0,
+            log: CheckLog = print
+    ) -> float:
+        """
+        Calculate utilization ratio for ultimate moment check
+        Same as calculateUtilization (which uses the rotated section for MAX_NEG_MOMENT), kept for compatibility
+        """
+        return UltimateMomentCheckEC2004DE.calculateUtilization(slab_construction, loads, system, moment, n, log=log)
@@ -1 +1,64 @@
-# probably not necessary to implement
\ No newline at end of file
+"""
+Sound insulation of massive floors with floating screeds (DIN 4109-32/-34, EN ISO 12354-1/-2 estimates).
+
+All functions operate element-wise on arrays, so whole catalogues of floor build-ups are evaluated at once.
+
+Note: surface masses m' in [kg/m²], dynamic stiffness s' in [MN/m³], frequencies in [Hz], levels in [dB]
+"""
+import numpy as np
+from numpy.typing import ArrayLike
+
+# Requirements DIN 4109-1, Table 2 (floors between dwellings)
+REQUIRED_AIRBORNE_INSULATION: float = 54.0      # erf. R'w
+MAX_IMPACT_SOUND_LEVEL: float = 50.0            # zul. L'n,w
+
+# Safety margins of the prediction DIN 4109-2, 4.3
+U_PROG_AIRBORNE: float = 2.0
+U_PROG_IMPACT: float = 3.0
+
+
+def airborne_sound_insulation(m_base: ArrayLike) -> np.ndarray:
+    """
+    Returns the weighted sound reduction index Rw of a single-leaf massive floor, DIN 4109-32 (1)
+
+    Note: mass law for 65 <= m' <= 720 kg/m²
+    """
+    return 30.9 * np.log10(np.asarray(m_base, dtype=float)) - 22.2
+
+
+def equivalent_impact_sound_level(m_base: ArrayLike) -> np.ndarray:
+    """
+    Returns the equivalent weighted normalized impact sound pressure level Ln,eq,0,w of a massive floor
+    without floor covering, DIN 4109-32 (20)
+    """
+    return 164.0 - 35.0 * np.log10(np.asarray(m_base, dtype=float))
+
+
+def resonance_frequency(s_dyn: ArrayLike, m_floating: ArrayLike) -> np.ndarray:
+    """
+    Returns the resonance frequency f0 = 160 √(s'/m') of a floating screed on a heavy base floor,
+    DIN 4109-34, EN ISO 12354-2 C.2 (NaN without resilient layer)
+    """
+    return 160.0 * np.sqrt(np.asarray(s_dyn, dtype=float) / np.asarray(m_floating, dtype=float))
+
+
+def impact_sound_improvement(f0: ArrayLike) -> np.ndarray:
+    """
+    Returns the weighted reduction of impact sound pressure level ΔLw = 30 lg(500 Hz / f0) + 3 dB of a floating
+    screed, EN ISO 12354-2 C.2 (0 without resilient layer)
+    """
+    f0 = np.asarray(f0, dtype=float)
+    with np.errstate(invalid="ignore"):
+        return np.where(np.isnan(f0), 0.0, np.maximum(30.0 * np.log10(500.0 / f0) + 3.0, 0.0))
+
+
+def airborne_sound_improvement(f0: ArrayLike, R_w: ArrayLike) -> np.ndarray:
+    """
+    Returns the improvement ΔRw = 74.4 - 20 lg(f0) - Rw / 2 >= 0 of the sound reduction index by a floating
+    screed, EN ISO 12354-1 D.2 for 30 <= f0 <= 160 Hz (lower f0 treated as 30 Hz, 0 above 160 Hz and without
+    resilient layer)
+    """
+    f0 = np.asarray(f0, dtype=float)
+    with np.errstate(invalid="ignore"):
+        delta = np.maximum(74.4 - 20.0 * np.log10(np.maximum(f0, 30.0)) - np.asarray(R_w, dtype=float) / 2, 0.0)
+        return np.where(np.isnan(f0) | (f0 > 160.0), 0.0, delta)
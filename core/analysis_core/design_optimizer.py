@@ -0,0 +1,213 @@
+"""
+Minimum-material design of HP slabs.
+
+Finds the design of a discrete parameter space (see parameter_sweep) with the lowest weighted concrete GWP and
+cost per m² that passes the ultimate moment checks (utilization <= max_utilization).
+
+The objective of all candidates is screened at once with HPGeometryBatch; only the checks need section solves.
+The search relies on monotonicity: the objective grows with t and reinf_area, the utilization falls with them.
+Within every group of candidates that differ only in t and reinf_area, the smallest feasible t is bracketed by
+bisection for each reinf_area in ascending order; since it can only decrease with reinf_area, the previous result
+is the upper bracket of the next search. Groups and thicknesses that cannot beat the best design found so far
+are skipped without being checked.
+"""
+import itertools
+from dataclasses import dataclass, field
+from typing import Mapping, Optional, Sequence
+
+import numpy as np
+
+from core.analysis_core.checks.check_suite import CheckSuite
+from core.analysis_core.material_methods import ConcreteCO2Registry, create_uls_concrete
+from core.analysis_core.parameter_sweep import (
+    SWEEP_PARAMETERS, SweepContext, build_slab_construction, check_parameters, design_id
+)
+from core.unit_core import mm2_to_m2, mm3_to_m3
+from slab_construction.slabs.hp_slab.model.hp_geometry_batch import HPGeometryBatch
+
+# Parameters searched by bisection, all others are enumerated
+_BISECTED = ("t", "reinf_area")
+
+
+@dataclass(slots=True)
+class OptimizationResult:
+    """
+    Optimum (None if no design is feasible) and all evaluated designs in evaluation order.
+    Every record holds the design parameters, 'design_id', 'gwp' [kg CO2eq/m²], 'cost' [€/m²], 'objective',
+    'utilization', 'feasible' and 'error'.
+    """
+    best: Optional[dict]
+    trace: list[dict] = field(default_factory=list)
+    n_candidates: int = 0
+
+    @property
+    def n_evaluations(self) -> int:
+        return len(self.trace)
+
+
+class DesignOptimizer:
+    """
+    Minimises gwp_weight * GWP + cost_weight * cost per m² of slab subject to utilization <= max_utilization
+    """
+
+    def __init__(
+            self,
+            context: SweepContext,
+            registry: Optional[ConcreteCO2Registry] = None,
+            gwp_weight: float = 1.0,
+            cost_weight: float = 0.0,
+            cfrp_gwp: float = 0.0,
+            cfrp_cost: float = 0.0,
+            max_utilization: float = 1.0,
+    ):
+        """
+        :param context: Materials, floor, loads and checks (see SweepContext)
+        :param registry: GWP and cost data of the concretes
+        :param gwp_weight: Weight of the GWP [per kg CO2eq/m²]
+        :param cost_weight: Weight of the cost [per €/m²]
+        :param cfrp_gwp: GWP of the CFRP reinforcement in kg CO2eq/kg (0: concrete only)
+        :param cfrp_cost: Cost of the CFRP reinforcement in €/kg (0: concrete only)
+        :param max_utilization: Largest admissible utilization of every check
+        """
+        self.context = context
+        self.registry = registry if registry is not None else ConcreteCO2Registry()
+        self.gwp_weight = gwp_weight
+        self.cost_weight = cost_weight
+        self.cfrp_gwp = cfrp_gwp
+        self.cfrp_cost = cfrp_cost
+        self.max_utilization = max_utilization
+
+        self._cache: dict[str, dict] = {}
+        self.trace: list[dict] = []
+
+    # -----------------------------------------------------------------------
+    # Objective
+    # -----------------------------------------------------------------------
+
+    def objectives(self, designs: Sequence[Mapping]) -> dict[str, np.ndarray]:
+        """
+        Returns 'gwp' [kg CO2eq/m²], 'cost' [€/m²] and the weighted 'objective' of all designs, without any
+        section solve
+        """
+        def column(name):
+            return np.array([d[name] for d in designs], dtype=float)
+
+        batch = HPGeometryBatch(*(column(name) for name in ("B", "L", "Hx", "Hy", "t", "dy", "nt")))
+        area = mm2_to_m2(batch.B * batch.L)                                          # [m²]
+        concrete = mm3_to_m3(batch.volume()) / area                                  # [m³/m²]
+
+        fck = [d["fck"] for d in designs]
+        gwp = concrete * np.array([self.registry.gwp(create_uls_concrete(f)) for f in fck])
+        cost = concrete * np.array([self.registry.cost(create_uls_concrete(f)) for f in fck])
+
+        if self.cfrp_gwp or self.cfrp_cost:
+            density = np.array([self.context.cfrp_products[d["cfrp"]]["density"] for d in designs], dtype=float)
+            tendon_volume = np.nansum(batch.tendon_lengths(), axis=1) * column("reinf_area")     # [mm³]
+            cfrp = mm3_to_m3(tendon_volume) * density / area                                      # [kg/m²]
+            gwp = gwp + cfrp * self.cfrp_gwp
+            cost = cost + cfrp * self.cfrp_cost
+
+        return {"gwp": gwp, "cost": cost, "objective": self.gwp_weight * gwp + self.cost_weight * cost}
+
+    # -----------------------------------------------------------------------
+    # Checks
+    # -----------------------------------------------------------------------
+
+    def evaluate(self, params: Mapping, objective: Optional[Mapping] = None) -> dict:
+        """
+        Returns the record of a design, running its checks on first use (cached by design id)
+
+        :param params: Design parameters
+        :param objective: 'gwp', 'cost' and 'objective' of the design if already known (see objectives)
+        """
+        key = design_id(params)
+        if key in self._cache:
+            return self._cache[key]
+
+        if objective is None:
+            objective = {name: float(values[0]) for name, values in self.objectives([params]).items()}
+
+        record = {"design_id": key, **{name: params[name] for name in SWEEP_PARAMETERS}, **objective,
+                  "utilization": np.inf, "feasible": False, "error": ""}
+        try:
+            slab_construction = build_slab_construction(params, self.context)
+            utilizations = CheckSuite(self.context.checks, self.context.n).run(slab_construction, self.context.loads)
+            record["utilization"] = max(utilizations.values())
+            record["feasible"] = bool(record["utilization"] <= self.max_utilization)
+        except Exception as exc:
+            record["error"] = f"{type(exc).__name__}: {exc}"
+
+        self._cache[key] = record
+        self.trace.append(record)
+        return record
+
+    # -----------------------------------------------------------------------
+    # Search
+    # -----------------------------------------------------------------------
+
+    def optimize(self, space: Mapping[str, Sequence]) -> OptimizationResult:
+        """
+        Returns the feasible design with the smallest objective
+
+        :param space: Values of every parameter in SWEEP_PARAMETERS (as for parameter_grid)
+        """
+        check_parameters(space)
+        t_values = sorted(set(space["t"]))
+        ra_values = sorted(set(space["reinf_area"]))
+        outer_names = [name for name in SWEEP_PARAMETERS if name not in _BISECTED]
+        groups = [dict(zip(outer_names, values))
+                  for values in itertools.product(*(space[name] for name in outer_names))]
+
+        # designs[g][j][i]: group g, reinf_area j, thickness i
+        designs = [[[{**group, "t": t, "reinf_area": ra} for t in t_values] for ra in ra_values] for group in groups]
+        flat = [d for group in designs for row in group for d in row]
+        shape = (len(groups), len(ra_values), len(t_values))
+        values = {name: array.reshape(shape) for name, array in self.objectives(flat).items()}
+        objective = values["objective"]
+
+        def record(g, j, i):
+            return self.evaluate(designs[g][j][i], {name: float(values[name][g, j, i]) for name in values})
+
+        best = None
+        best_objective = np.inf
+
+        # cheapest groups first, so that the bound prunes as much as possible
+        for g in np.argsort(objective[:, 0, 0], kind="stable"):
+            if objective[g, 0, 0] >= best_objective:
+                break
+
+            upper = len(t_values) - 1      # t index known to be feasible for the previous reinf_area
+            upper_feasible = False
+            for j in range(len(ra_values)):
+                cheaper = np.flatnonzero(objective[g, j] < best_objective)
+                if len(cheaper) == 0:
+                    break
+                hi = min(upper, int(cheaper[-1]))
+
+                # smallest feasible thickness in [0, hi], None if there is none
+                if not (upper_feasible and hi == upper) and not record(g, j, hi)["feasible"]:
+                    continue
+                lo = 0
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if record(g, j, mid)["feasible"]:
+                        hi = mid
+                    else:
+                        lo = mid + 1
+
+                upper, upper_feasible = hi, True
+                if objective[g, j, hi] < best_objective:
+                    best, best_objective = record(g, j, hi), objective[g, j, hi]
+
+        return OptimizationResult(best, list(self.trace), n_candidates=len(flat))
+
+
+def optimize_design(
+        space: Mapping[str, Sequence],
+        context: SweepContext,
+        **options,
+) -> OptimizationResult:
+    """
+    Returns the minimum-material design of a parameter space (see DesignOptimizer for the options)
+    """
+    return DesignOptimizer(context, **options).optimize(space)
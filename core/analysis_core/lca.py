@@ -0,0 +1,187 @@
+"""
+Life-cycle assessment (GWP, cost) of complete HP slab constructions.
+
+The contributions per m² of slab are the concrete shell (HPGeometry.volume), the minimum infill, the floor layers
+and the CFRP tendons. Concretes are looked up per m³ in ConcreteCO2Registry, all other materials per kg in a
+MaterialImpactRegistry. Both are keyed by material properties, so equal materials created separately (e.g. one
+per design of a sweep) share one entry.
+
+LCAEngine.evaluate_batch evaluates many designs at once on an HPGeometryBatch; evaluate runs the same code for a
+single slab construction.
+"""
+from typing import Dict, Hashable, Optional, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike
+from structuralcodes.core.base import Material
+from structuralcodes.materials.concrete import Concrete
+from structuralcodes.materials.reinforcement import Reinforcement
+
+from core.analysis_core.material_methods import ConcreteCO2Registry
+from core.unit_core import mm2_to_m2, mm3_to_m3
+from slab_construction.slab_construction import Floor, SlabConstruction
+from slab_construction.slabs.hp_slab.model.hp_geometry_batch import HPGeometryBatch
+from slab_construction.slabs.hp_slab.model.hp_slab import HPSlab
+
+# Contributions of a slab construction
+COMPONENTS: tuple[str, ...] = ("shell", "infill", "floor", "tendons")
+
+
+def material_key(material: Material) -> tuple:
+    """
+    Returns the lookup key of a material from its properties (not its identity). The prestress of a reinforcement
+    does not enter, so all prestress levels of a product share one entry.
+    """
+    if isinstance(material, Concrete):
+        return ("concrete", ConcreteCO2Registry.key(material))
+    if isinstance(material, Reinforcement):
+        return ("reinforcement", *(float(getattr(material, name)) for name in ("fyk", "Es", "ftk", "epsuk", "density")))
+    return (type(material).__name__, material.name, float(material.density),
+            getattr(material, "dynamic_stiffness", None))
+
+
+class MaterialImpactRegistry:
+    """Registry for GWP and cost data per kg of materials other than concrete (infill, floor layers, CFRP)."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self):
+        # Key: material_key, Value: {"gwp": ..., "cost": ...}
+        self._data: dict[Hashable, dict[str, float]] = {}
+
+    def register(self, material: Material, gwp: float, cost: float) -> None:
+        """
+        Registers the data of a material (and of all materials with equal properties)
+
+        :param gwp: GWP in kg CO2eq / kg
+        :param cost: Cost in €/kg
+        """
+        self._data[material_key(material)] = {"gwp": gwp, "cost": cost}
+
+    def _get(self, material: Material) -> dict[str, float]:
+        try:
+            return self._data[material_key(material)]
+        except KeyError as exc:
+            raise KeyError(f"No CO2/cost data registered for material '{material.name}'") from exc
+
+    def gwp(self, material: Material) -> float:
+        """Returns GWP in kg CO2eq / kg."""
+        return self._get(material)["gwp"]
+
+    def cost(self, material: Material) -> float:
+        """Returns cost in €/kg."""
+        return self._get(material)["cost"]
+
+
+def _per_candidate(materials, n: int, value) -> np.ndarray:
+    """
+    Returns value(material) for one material or a sequence of n materials, evaluated once per distinct key
+    """
+    if not isinstance(materials, Sequence):
+        return np.full(n, value(materials), dtype=float)
+    if len(materials) != n:
+        raise ValueError(f"Expected {n} materials, received {len(materials)}")
+
+    values: dict[tuple, float] = {}
+    result = np.empty(n)
+    for i, material in enumerate(materials):
+        key = material_key(material)
+        if key not in values:
+            values[key] = value(material)
+        result[i] = values[key]
+    return result
+
+
+class LCAEngine:
+    """
+    GWP [kg CO2eq/m²] and cost [€/m²] of slab constructions per m² of slab
+    """
+
+    def __init__(
+            self,
+            materials: MaterialImpactRegistry,
+            concretes: Optional[ConcreteCO2Registry] = None,
+    ):
+        """
+        :param materials: Data of infill, floor and reinforcement materials
+        :param concretes: Data of the concretes
+        """
+        self.materials = materials
+        self.concretes = concretes if concretes is not None else ConcreteCO2Registry()
+
+    def _floor_impacts(self, floor: Floor) -> tuple[float, float]:
+        gwp = cost = 0.0
+        for layer in floor.layers:
+            mass = layer.material.density * layer.thickness * 1e-3        # [kg/m²]
+            gwp += mass * self.materials.gwp(layer.material)
+            cost += mass * self.materials.cost(layer.material)
+        return gwp, cost
+
+    def evaluate_batch(
+            self,
+            batch: HPGeometryBatch,
+            concrete: Concrete | Sequence[Concrete],
+            reinforcement: Reinforcement | Sequence[Reinforcement],
+            reinf_area: ArrayLike,
+            infill_material: Material | Sequence[Material],
+            floor: Floor | Sequence[Floor],
+    ) -> Dict[str, np.ndarray]:
+        """
+        GWP and cost of n designs, every material either shared by all designs or given per design
+
+        :param batch: Geometries of the shells
+        :param concrete: Concrete of the shells
+        :param reinforcement: Tendon material
+        :param reinf_area: Area of one tendon in mm², scalar or shape (n,)
+        :param infill_material: Infill material
+        :param floor: Floor construction
+        :return: Dictionary with '<component>_gwp', '<component>_cost' for every component of COMPONENTS
+                 and the totals 'gwp' and 'cost', shape (n,)
+        """
+        n = len(batch)
+        area = mm2_to_m2(batch.B * batch.L)                                                 # [m²]
+
+        shell = mm3_to_m3(batch.volume()) / area                                            # [m³/m²]
+        infill_density = _per_candidate(infill_material, n, lambda m: m.density)
+        infill = mm3_to_m3(batch.minimum_infill_volume()) * infill_density / area           # [kg/m²]
+        tendon_volume = np.nansum(batch.tendon_lengths(), axis=1) * np.asarray(reinf_area, dtype=float)
+        tendon_density = _per_candidate(reinforcement, n, lambda m: m.density)
+        tendons = mm3_to_m3(tendon_volume) * tendon_density / area                           # [kg/m²]
+
+        # floors are evaluated once per floor object (layers may change, so no property key)
+        if isinstance(floor, Sequence):
+            if len(floor) != n:
+                raise ValueError(f"Expected {n} floors, received {len(floor)}")
+            impacts = {id(f): self._floor_impacts(f) for f in floor}
+            floors = np.array([impacts[id(f)] for f in floor], dtype=float).reshape(n, 2)
+        else:
+            floors = np.tile(self._floor_impacts(floor), (n, 1))
+
+        result = {
+            "shell_gwp": shell * _per_candidate(concrete, n, self.concretes.gwp),
+            "shell_cost": shell * _per_candidate(concrete, n, self.concretes.cost),
+            "infill_gwp": infill * _per_candidate(infill_material, n, self.materials.gwp),
+            "infill_cost": infill * _per_candidate(infill_material, n, self.materials.cost),
+            "floor_gwp": floors[:, 0],
+            "floor_cost": floors[:, 1],
+            "tendons_gwp": tendons * _per_candidate(reinforcement, n, self.materials.gwp),
+            "tendons_cost": tendons * _per_candidate(reinforcement, n, self.materials.cost),
+        }
+        result["gwp"] = sum(result[f"{component}_gwp"] for component in COMPONENTS)
+        result["cost"] = sum(result[f"{component}_cost"] for component in COMPONENTS)
+        return result
+
+    def evaluate(self, slab_construction: SlabConstruction) -> Dict[str, float]:
+        """
+        GWP and cost of an HP slab construction (see evaluate_batch)
+        """
+        slab = slab_construction.slab
+        if not isinstance(slab, HPSlab):
+            raise ValueError(f"LCA is only available for HP slabs, received {type(slab).__name__}")
+
+        shell = slab.hp_shell
+        result = self.evaluate_batch(
+            HPGeometryBatch.from_geometries([shell.hp_geometry]),
+            shell.concrete, shell.reinforcement, shell.reinf_area, slab.infill_material, slab_construction.floor,
+        )
+        return {name: float(values[0]) for name, values in result.items()}
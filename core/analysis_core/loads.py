@@ -1,7 +1,15 @@
+from typing import Sequence
+
 import numpy as np
+from numpy.typing import ArrayLike
 
 from slab_construction.slab_construction import SlabConstruction
 
+# Combination rules for the fundamental combination (EC0 6.4.3.2)
+#   "6.10"   : γG Gk + γQ Qk,1 + Σ γQ ψ0,i Qk,i
+#   "6.10a/b": less favourable of 6.10a (γG Gk + Σ γQ ψ0,i Qk,i) and 6.10b (ξ γG Gk + γQ Qk,1 + Σ γQ ψ0,i Qk,i)
+COMBINATION_RULES: tuple[str, ...] = ("6.10", "6.10a/b")
+
 
 class Loads:
 
@@ -10,6 +18,9 @@ class Loads:
     Class for instantiating a load model according to Eurocode 0
 
     Note: only uniformly distributed loads over ALL spans
+
+    Combinations are built as coefficient matrices over the actions [Gk, Qk,1, ..., Qk,n] with one row per
+    combination (every variable action once as leading action), see combination_matrix.
     """
 
     def __init__(
@@ -20,6 +31,8 @@ class Loads:
         psi_2_values,
         gamma_g = 1.35,
         gamma_q = 1.5,
+        combination_rule = "6.10",
+        xi = 0.85,
     ):
         self.Qk = np.array(live_loads, dtype=float)
         self.psi_0_values = np.array(psi_0_values, dtype=float)
@@ -27,8 +40,13 @@ class Loads:
         self.psi_2_values = np.array(psi_2_values, dtype=float)
         self.gamma_g = gamma_g
         self.gamma_q = gamma_q
+        self.combination_rule = combination_rule
+        self.xi = xi
         self._check_dimensions()
 
+        if self.combination_rule not in COMBINATION_RULES:
+            raise ValueError(f"Invalid combination rule. Must be one of: {list(COMBINATION_RULES)}")
+
     def _check_dimensions(self) -> None:
         """
         Checks the dimension compatibility of the input.
@@ -38,32 +56,161 @@ class Loads:
             if len(arr) != n:
                 raise ValueError("All live load (Qk) and psi arrays must have the same length")
 
+    def _permanent_load(self, slab_construction: SlabConstruction) -> float:
+        """
+        Characteristic permanent load Gk [kN/m²]
+        """
+        return slab_construction.dead_load()
+
+    @staticmethod
+    def normalize_combination(combination: str) -> str:
+        """
+        Returns the combination name in canonical form ('FUNDAMENTAL', 'CHARACTERISTIC', 'FREQUENT' or
+        'QUASI-PERMANENT'). Accepts e.g. "fundamental", "  Fundamental  ", "QUASI_PERMANENT" or "quasi permanent".
+        """
+        combination = combination.strip().upper()
+
+        if combination in ("QUASI-PERMANENT", "QUASI_PERMANENT", "QUASI PERMANENT"):
+            return "QUASI-PERMANENT"
+        if combination in ("FUNDAMENTAL", "CHARACTERISTIC", "FREQUENT"):
+            return combination
+
+        raise ValueError(
+            "Invalid combination. Must be one of: 'FUNDAMENTAL', 'CHARACTERISTIC', 'FREQUENT', 'QUASI-PERMANENT'."
+        )
+
+    def combination_matrix(self, combination: str = "FUNDAMENTAL") -> np.ndarray:
+        """
+        Returns the coefficients of all combinations of a type as array (n_combinations, 1 + n_live_loads) over
+        the actions [Gk, Qk,1, ..., Qk,n]; the design values are combination_matrix @ [Gk, *Qk].
+
+        FUNDAMENTAL      : one row per leading action (6.10), or the 6.10a row followed by one 6.10b row per
+                           leading action (combination_rule "6.10a/b")
+        CHARACTERISTIC   : one row per leading action, Gk + Qk,1 + Σ ψ0,i Qk,i (6.14b)
+        FREQUENT         : one row per leading action, Gk + ψ1,1 Qk,1 + Σ ψ2,i Qk,i (6.15b)
+        QUASI-PERMANENT  : one row, Gk + Σ ψ2,i Qk,i (6.16b)
+        """
+        combination = self.normalize_combination(combination)
+        n = len(self.Qk)
+        leading = np.eye(n, dtype=bool)
+
+        if combination == "QUASI-PERMANENT":
+            return np.concatenate(([1.0], self.psi_2_values))[None, :]
+
+        if combination == "CHARACTERISTIC":
+            variable = np.where(leading, 1.0, self.psi_0_values[None, :])
+            return np.column_stack((np.ones(n), variable))
+
+        if combination == "FREQUENT":
+            variable = np.where(leading, self.psi_1_values[None, :], self.psi_2_values[None, :])
+            return np.column_stack((np.ones(n), variable))
+
+        variable = self.gamma_q * np.where(leading, 1.0, self.psi_0_values[None, :])
+        if self.combination_rule == "6.10":
+            return np.column_stack((np.full(n, self.gamma_g), variable))
+
+        row_6_10a = np.concatenate(([self.gamma_g], self.gamma_q * self.psi_0_values))
+        rows_6_10b = np.column_stack((np.full(n, self.xi * self.gamma_g), variable))
+        return np.vstack((row_6_10a, rows_6_10b))
+
+    def combination_labels(self, combination: str = "FUNDAMENTAL") -> list[str]:
+        """
+        Returns a label for every row of combination_matrix, e.g. "6.10 (Q1 leading)"
+        """
+        combination = self.normalize_combination(combination)
+        n = len(self.Qk)
+
+        if combination == "QUASI-PERMANENT":
+            return ["6.16b"]
+        if combination == "CHARACTERISTIC":
+            return [f"6.14b (Q{i + 1} leading)" for i in range(n)]
+        if combination == "FREQUENT":
+            return [f"6.15b (Q{i + 1} leading)" for i in range(n)]
+        if self.combination_rule == "6.10":
+            return [f"6.10 (Q{i + 1} leading)" for i in range(n)]
+        return ["6.10a"] + [f"6.10b (Q{i + 1} leading)" for i in range(n)]
+
+    def _action_matrix(self, slab_constructions: SlabConstruction | Sequence[SlabConstruction] | ArrayLike) -> np.ndarray:
+        """
+        Returns the characteristic actions [Gk, Qk,1, ..., Qk,n] of slab constructions (or of given Gk values)
+        as array (n_constructions, 1 + n_live_loads)
+        """
+        if isinstance(slab_constructions, SlabConstruction):
+            slab_constructions = [slab_constructions]
+        items = np.atleast_1d(np.asarray(slab_constructions, dtype=object))
+        if items.ndim != 1 or len(items) == 0:
+            raise ValueError("Expected a slab construction, a Gk value or a non-empty sequence of them")
+
+        Gk = np.array([self._permanent_load(item) if isinstance(item, SlabConstruction) else item for item in items],
+                      dtype=float)
+
+        return np.column_stack((Gk, np.broadcast_to(self.Qk, (len(Gk), len(self.Qk)))))
+
+    def combination_values(
+            self,
+            slab_constructions: SlabConstruction | Sequence[SlabConstruction] | ArrayLike,
+            combination: str = "FUNDAMENTAL",
+    ) -> np.ndarray:
+        """
+        Returns the values [kN/m²] of all combinations of a type for all slab constructions as one matrix product,
+        array (n_constructions, n_combinations) with columns as in combination_matrix
+
+        :param slab_constructions: Slab construction(s), or their characteristic permanent loads Gk [kN/m²]
+        :param combination: Load combination type
+        """
+        return self._action_matrix(slab_constructions) @ self.combination_matrix(combination).T
+
+    def design_values(
+            self,
+            slab_constructions: SlabConstruction | Sequence[SlabConstruction] | ArrayLike,
+            combination: str = "FUNDAMENTAL",
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the governing (largest) combination values [kN/m²] of all slab constructions and the index of the
+        governing row of combination_matrix, each as array (n_constructions,)
+
+        :param slab_constructions: Slab construction(s), or their characteristic permanent loads Gk [kN/m²]
+        :param combination: Load combination type
+        """
+        values = self.combination_values(slab_constructions, combination)
+        governing = np.argmax(values, axis=1)
+        return values[np.arange(len(values)), governing], governing
+
+    def combination_parts(self, slab_construction: SlabConstruction, combination: str) -> tuple[float, float]:
+        """
+        Returns the permanent and the variable part [kN/m²] of the governing combination, e.g. to place the
+        variable part on individual spans only (pattern loading). Their sum is the combination value.
+        """
+        matrix = self.combination_matrix(combination)
+        actions = self._action_matrix(slab_construction)[0]
+        governing = int(np.argmax(matrix @ actions))
+
+        return float(matrix[governing, 0] * actions[0]), float(matrix[governing, 1:] @ actions[1:])
+
     def fundamental_combination(self, slab_construction: SlabConstruction):
         """
         Ultimate Limit State (ULS) - fundamental combination
-        EC0 6.10
+        EC0 6.10 (or 6.10a/b), governing leading variable action
         """
-        Gd = self.gamma_g * (slab_construction.non_structural_dead_load()
-                             + slab_construction.non_structural_dead_load())
-
-        Qd = self.gamma_q * float(np.sum(self.Qk * self.psi_0_values))
+        return sum(self.combination_parts(slab_construction, "FUNDAMENTAL"))
 
-        return Gd + Qd
+    def characteristic_combination(self, slab_construction: SlabConstruction):
+        """
+        Serviceability Limit State (SLS) – characteristic combination
+        EC0 6.14b, governing leading variable action
+        """
+        return sum(self.combination_parts(slab_construction, "CHARACTERISTIC"))
 
     def frequent_combination(self, slab_construction: SlabConstruction):
         """
         Serviceability Limit State (SLS) – frequent combination
-        EC0 6.15b
+        EC0 6.15b, governing leading variable action
         """
-        return (slab_construction.non_structural_dead_load()
-                + slab_construction.non_structural_dead_load()
-                + float(np.sum(self.Qk * self.psi_1_values)))
+        return sum(self.combination_parts(slab_construction, "FREQUENT"))
 
     def quasi_permanent_combination(self, slab_construction: SlabConstruction):
         """
         Serviceability Limit State (SLS) – quasi-permanent combination
         EC0 6.16b
         """
-        return (slab_construction.non_structural_dead_load()
-                + slab_construction.non_structural_dead_load()
-                + float(np.sum(self.Qk * self.psi_2_values)))
+        return sum(self.combination_parts(slab_construction, "QUASI-PERMANENT"))
@@ -2,9 +2,15 @@
 Author: Elliot Melcer
 Internal CO2 and cost registry for materials.
 """
+import inspect
+from typing import Callable, Hashable, Mapping
+from weakref import WeakKeyDictionary
+
 import numpy as np
-from structuralcodes.materials.concrete import Concrete
-from structuralcodes.materials.constitutive_laws import Sargin, UserDefined
+from structuralcodes.core.base import ConstitutiveLaw, Material
+from structuralcodes.materials.concrete import Concrete, create_concrete
+from structuralcodes.materials.constitutive_laws import Elastic, ParabolaRectangle, Sargin, UserDefined
+from structuralcodes.materials.reinforcement import Reinforcement, create_reinforcement
 
 # ---------------------------------------------------------------------------
 # Internal data table (source: Beton.xlsx, internalised)
@@ -39,12 +45,14 @@ class ConcreteCO2Registry:
     __slots__ = ("_cache",)
 
     def __init__(self):
-        # Key: concrete instance, Value: {"gwp": ..., "cost": ...}
-        self._cache: dict[object, dict[str, float]] = {}
+        # Key: strength class fck (equal concretes created separately share an entry), Value: {"gwp": ..., "cost": ...}
+        self._cache: dict[int, dict[str, float]] = {}
 
-    def _register(self, concrete) -> None:
-        fck = int(round(concrete.fck))
+    @staticmethod
+    def key(concrete) -> int:
+        return int(round(concrete.fck))
 
+    def _register(self, fck: int) -> None:
         try:
             data = CONCRETE_CO2_TABLE[fck]
         except KeyError as exc:
@@ -52,19 +60,21 @@ class ConcreteCO2Registry:
                 f"No CO2/cost data available for concrete with fck = {fck}"
             ) from exc
 
-        self._cache[concrete] = data
+        self._cache[fck] = data
 
     def gwp(self, concrete) -> float:
         """Returns GWP in kg CO2eq / m3."""
-        if concrete not in self._cache:
-            self._register(concrete)
-        return self._cache[concrete]["gwp"]
+        fck = self.key(concrete)
+        if fck not in self._cache:
+            self._register(fck)
+        return self._cache[fck]["gwp"]
 
     def cost(self, concrete) -> float:
         """Returns cost in €/m3."""
-        if concrete not in self._cache:
-            self._register(concrete)
-        return self._cache[concrete]["cost"]
+        fck = self.key(concrete)
+        if fck not in self._cache:
+            self._register(fck)
+        return self._cache[fck]["cost"]
 
 
 def sargin_elastic_law(concrete: Concrete, n_c: int = 80, n_t: int = 20) -> UserDefined:
@@ -128,6 +138,261 @@ def sargin_elastic_law(concrete: Concrete, n_c: int = 80, n_t: int = 20) -> User
         flag=0,
     )
 
+# ---------------------------------------------------------------------------
+# Tabulated constitutive laws
+# ---------------------------------------------------------------------------
+
+# Default tolerance of the estimated stress interpolation error [MPa]
+TABULATION_TOLERANCE: float = 0.01
+
+
+class TabulatedLaw(ConstitutiveLaw):
+    """
+    Piecewise-linear tabulation of a concrete law on its compressive branch [eps_cu ; 0].
+
+    Stress and tangent of the wrapped law are evaluated once on the nodes and interpolated linearly. Intervals are
+    halved until the estimated interpolation error of the stress, h²/8 max|σ''| per interval, is below the
+    tolerance. σ'' is estimated from finite differences of the exact tangent at five points per interval, so the
+    estimate is not a strict bound (a sharp kink of the tangent between the sample points can be missed). Strains
+    outside the table are passed to the wrapped law.
+
+    Marin integration (the default integrator of GenericSection) is independent of the tolerance: the wrapped law
+    discretizes itself into a few linear segments on every call, the tabulated law does this once and reuses the
+    segments, with identical results. A parabola-rectangle law with exponent 2 keeps its exact polynomial.
+
+    The segments come from ConstitutiveLaw._discretize_law, the private method behind the default
+    ConstitutiveLaw.__marin__ (structuralcodes 0.7). Without it, every Marin call is passed to the public __marin__
+    of the wrapped law. tabulated_law_test checks that both give the same results.
+    """
+
+    __materials__ = ("concrete",)
+
+    def __init__(
+            self,
+            law: ConstitutiveLaw,
+            tolerance: float = TABULATION_TOLERANCE,
+            max_nodes: int = 4097,
+            name: str | None = None
+    ):
+        """
+        :param law: Concrete law to tabulate
+        :param tolerance: Largest admissible estimated stress interpolation error in [MPa]
+        :param max_nodes: Largest number of nodes
+        """
+        super().__init__(name=name if name is not None else f"{law.name} (tabulated)")
+        if tolerance <= 0:
+            raise ValueError("Tolerance must be positive")
+
+        self.law = law
+        self.tolerance = tolerance
+        eps_min, _ = law.get_ultimate_strain()
+
+        eps = np.linspace(eps_min, 0.0, 9)
+        while True:
+            h = np.diff(eps)
+            sub = eps[:-1, None] + h[:, None] * np.linspace(0.0, 1.0, 5)
+            tangent = np.asarray(law.get_tangent(sub.ravel()), dtype=float).reshape(sub.shape)
+            curvature = np.abs(np.diff(tangent, axis=1)).max(axis=1) / (h / 4)
+            estimate = h ** 2 / 8 * curvature
+
+            refine = estimate > tolerance
+            if not np.any(refine):
+                break
+            if len(eps) + np.count_nonzero(refine) > max_nodes:
+                raise ValueError(
+                    f"Tabulation of {law.name} needs more than {max_nodes} nodes for a tolerance of {tolerance} MPa"
+                )
+            eps = np.sort(np.concatenate((eps, eps[:-1][refine] + h[refine] / 2)))
+
+        self.error_estimate = float(estimate.max())
+        self._eps = eps
+        self._sigma = np.asarray(law.get_stress(eps.copy()), dtype=float)
+        self._tangent = np.asarray(law.get_tangent(eps.copy()), dtype=float)
+
+        # exact polynomial Marin coefficients (the parabola-rectangle law discretizes itself for n != 2), otherwise
+        # the discretization ConstitutiveLaw.__marin__ would repeat on every call
+        exact_marin = isinstance(law, ParabolaRectangle) and getattr(law, "_n", None) == 2
+        discretize = getattr(law, "_discretize_law", None)
+        self._piecewise = None if exact_marin or discretize is None else discretize()
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self._eps)
+
+    def _evaluate(self, eps, table: np.ndarray, exact):
+        scalar = np.isscalar(eps)
+        eps = np.atleast_1d(np.asarray(eps, dtype=float))
+
+        inside = (eps >= self._eps[0]) & (eps <= self._eps[-1])
+        values = np.interp(eps, self._eps, table)
+        if not np.all(inside):
+            values[~inside] = exact(eps[~inside].copy())
+
+        return float(values[0]) if scalar else values
+
+    def get_stress(self, eps):
+        """Return the stress given the strain."""
+        return self._evaluate(eps, self._sigma, self.law.get_stress)
+
+    def get_tangent(self, eps):
+        """Return the tangent given the strain."""
+        return self._evaluate(eps, self._tangent, self.law.get_tangent)
+
+    def get_ultimate_strain(self, **kwargs) -> tuple[float, float]:
+        return self.law.get_ultimate_strain(**kwargs)
+
+    def __marin__(self, **kwargs):
+        if self._piecewise is None:
+            return self.law.__marin__(**kwargs)
+        return self._piecewise.__marin__(**kwargs)
+
+    def __marin_tangent__(self, **kwargs):
+        if self._piecewise is None:
+            return self.law.__marin_tangent__(**kwargs)
+        return self._piecewise.__marin_tangent__(**kwargs)
+
+
+# Tabulations of every law, released together with the law
+_TABULATED_LAWS: "WeakKeyDictionary[ConstitutiveLaw, dict[float, TabulatedLaw]]" = WeakKeyDictionary()
+
+
+def tabulated_law(law: ConstitutiveLaw, tolerance: float = TABULATION_TOLERANCE) -> TabulatedLaw:
+    """
+    Returns the (cached) tabulation of a concrete law, the law itself if it is already tabulated
+    """
+    if isinstance(law, TabulatedLaw):
+        return law
+
+    tables = _TABULATED_LAWS.setdefault(law, {})
+    if tolerance not in tables:
+        tables[tolerance] = TabulatedLaw(law, tolerance)
+    return tables[tolerance]
+
+
+def tabulated_concrete(concrete: Concrete, tolerance: float = TABULATION_TOLERANCE) -> Concrete:
+    """
+    Returns the (interned) copy of an EC2 (2004) concrete with its constitutive law tabulated (see TabulatedLaw).
+    Piecewise-linear laws (UserDefined) are returned unchanged.
+    """
+    if isinstance(concrete.constitutive_law, (TabulatedLaw, UserDefined)):
+        return concrete
+
+    return MATERIALS.concrete(
+        fck=concrete.fck,
+        name=concrete.name,
+        density=concrete.density,
+        gamma_c=concrete.gamma_c,
+        alpha_cc=concrete.alpha_cc,
+        constitutive_law=tabulated_law(concrete.constitutive_law, tolerance),
+        design_code="ec2_2004",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Material interning
+# ---------------------------------------------------------------------------
+
+def law_key(law: str | ConstitutiveLaw) -> Hashable:
+    """
+    Returns the interning key of a constitutive law: its parameters for the laws created in this project,
+    the law object itself (identity) for all others
+    """
+    if isinstance(law, str):
+        return law.lower()
+    if isinstance(law, TabulatedLaw):
+        return ("tabulated", law_key(law.law), law.tolerance)
+    if isinstance(law, UserDefined):
+        return ("userdefined", tuple(law._x), tuple(law._y), law.get_ultimate_strain())
+    if isinstance(law, Elastic):
+        return ("elastic", float(law.get_tangent(0.0)), law.get_ultimate_strain())
+    return law
+
+
+# Parameters with defaults of the design code that are part of the interning key even if not given
+RESOLVED_PARAMETERS: dict[str, tuple[str, ...]] = {
+    "concrete": ("density", "gamma_c", "alpha_cc", "constitutive_law"),
+    "reinforcement": ("density", "gamma_s", "constitutive_law"),
+}
+
+
+class MaterialRegistry:
+    """
+    Registry of interned materials: materials created with equal parameters are one shared instance, so caches
+    keyed by material (tabulated laws, SLS concretes, CO2 data, ...) hold one entry per distinct material.
+
+    Materials are equal if they have the same class (design code) and the same parameters after the defaults of
+    the design code are filled in; an implicit default and the same value given explicitly give the same
+    material. The display name is not compared, the shared material keeps the name of its first creation.
+
+    Note: interned materials are shared, do not modify them
+    """
+
+    __slots__ = ("_materials", "_aliases")
+
+    def __init__(self):
+        # Key: (kind, class, sorted resolved parameters), Value: material
+        self._materials: dict[Hashable, Material] = {}
+        # Key: (kind, sorted parameters as given), Value: material, repeated calls skip the creation
+        self._aliases: dict[Hashable, Material] = {}
+
+    def __len__(self) -> int:
+        return len(self._materials)
+
+    @staticmethod
+    def key(kind: str, parameters: Mapping) -> tuple:
+        """
+        Returns the key of the parameters as given
+        """
+        return (kind, *sorted(
+            (name, law_key(value) if name == "constitutive_law" else value) for name, value in parameters.items()
+        ))
+
+    @staticmethod
+    def resolved_key(kind: str, material: Material, parameters: Mapping) -> tuple:
+        """
+        Returns the key of a created material: its class and its parameters with the defaults of the design code
+        (see RESOLVED_PARAMETERS), without the name and the design code
+        """
+        def resolve(name):
+            if name == "constitutive_law":
+                law = parameters.get(name)
+                if law is None:
+                    law = inspect.signature(type(material)).parameters[name].default
+                return law_key(law)
+            return getattr(material, name) if hasattr(material, name) else parameters[name]
+
+        names = (set(parameters) | set(RESOLVED_PARAMETERS[kind])) - {"name", "design_code"}
+        return (kind, type(material), *sorted((name, resolve(name)) for name in names))
+
+    def _intern(self, kind: str, factory: Callable[..., Material], parameters: Mapping) -> Material:
+        alias = self.key(kind, parameters)
+        if alias not in self._aliases:
+            material = factory(**parameters)
+            key = self.resolved_key(kind, material, parameters)
+            self._aliases[alias] = self._materials.setdefault(key, material)
+        return self._aliases[alias]
+
+    def concrete(self, **parameters) -> Concrete:
+        """
+        Returns the shared concrete with the given parameters of create_concrete
+        """
+        return self._intern("concrete", create_concrete, parameters)
+
+    def reinforcement(self, **parameters) -> Reinforcement:
+        """
+        Returns the shared reinforcement with the given parameters of create_reinforcement
+        """
+        return self._intern("reinforcement", create_reinforcement, parameters)
+
+    def clear(self) -> None:
+        self._materials.clear()
+        self._aliases.clear()
+
+
+# Materials of this project (create_uls_concrete, create_cfrp_reinforcement, sls_section, ...)
+MATERIALS = MaterialRegistry()
+
+
 def get_cube(cylinder_strength) -> float:
     """
     Author: Elliot Melcer
@@ -156,3 +421,52 @@ def get_cube(cylinder_strength) -> float:
 
     return table[cylinder_strength]
 
+
+def create_uls_concrete(fck: float, tabulated: bool = False) -> Concrete:
+    """
+    Returns the (interned) EC2 (2004) ULS concrete with parabola-rectangle law, alpha_cc = 0.85 and gamma_c = 1.5,
+    named after the EN 206 strength class (e.g. "C50/60 ULS")
+
+    :param tabulated: Use the tabulated law (see TabulatedLaw)
+    """
+    concrete = MATERIALS.concrete(
+        fck=fck,
+        constitutive_law="parabolarectangle",
+        alpha_cc=0.85,
+        gamma_c=1.5,
+        name=f"C{fck:g}/{get_cube(fck):g} ULS",
+        design_code="ec2_2004",
+    )
+    return tabulated_concrete(concrete) if tabulated else concrete
+
+
+def create_cfrp_reinforcement(
+        fyk: float,
+        Es: float,
+        ftk: float,
+        epsuk: float,
+        density: float,
+        prestress: float = 0.0,
+        gamma_s: float = 1.3,
+        name: str | None = None,
+) -> Reinforcement:
+    """
+    Returns the (interned) brittle linear-elastic CFRP reinforcement (EC2 2004)
+
+    :param prestress: Prestress level as fraction of the ultimate strain epsuk (initial_strain = prestress * epsuk)
+    """
+    law = Elastic(Es)
+    law.set_ultimate_strain(epsuk)
+
+    return MATERIALS.reinforcement(
+        fyk=fyk,
+        Es=Es,
+        ftk=ftk,
+        epsuk=epsuk,
+        density=density,
+        constitutive_law=law,
+        initial_strain=prestress * epsuk,
+        gamma_s=gamma_s,
+        name=name,
+        design_code="ec2_2004",
+    )
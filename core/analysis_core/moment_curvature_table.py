@@ -0,0 +1,285 @@
+from typing import Dict, Optional
+from weakref import WeakKeyDictionary
+
+import numpy as np
+from numpy.typing import ArrayLike
+from structuralcodes.core._section_results import MomentCurvatureResults
+from structuralcodes.sections import GenericSection
+
+from core.analysis_core.section_methods import calculate_moment_curvature_sls, flipped_section
+from core.unit_core import Nmm_to_kNm, per_mm_to_per_m
+from slab_construction.slabs.one_way_slab import OneWaySlab
+
+
+class MomentCurvatureTable:
+    """
+    Compact moment-curvature relation of a section for fast lookups.
+
+    Stores curvature κ [1/m], moment M [kNm] and axial strain (at the section origin) as float arrays sorted by
+    curvature; both κ and M are strictly increasing, so every query is a searchsorted plus a linear
+    interpolation and works on arrays of any shape. Sagging moments and curvatures are positive. Queries outside
+    the table (beyond the moment capacity or, for a table without hogging branch, below κ = 0) return NaN.
+
+    Tables are picklable and can be stored as .npy file and memory-mapped (save / load).
+    """
+
+    __slots__ = ("curvatures", "moments", "axial_strains")
+
+    def __init__(self, curvatures: ArrayLike, moments: ArrayLike, axial_strains: Optional[ArrayLike] = None):
+        """
+        :param curvatures: Curvatures in 1/m, strictly increasing
+        :param moments: Moments in kNm, strictly increasing
+        :param axial_strains: Axial strains [-], NaN if not given
+        """
+        self.curvatures = np.asarray(curvatures, dtype=float)
+        self.moments = np.asarray(moments, dtype=float)
+        self.axial_strains = (
+            np.full(self.curvatures.shape, np.nan) if axial_strains is None else np.asarray(axial_strains, dtype=float)
+        )
+
+        if not (self.curvatures.ndim == 1 and self.curvatures.shape == self.moments.shape == self.axial_strains.shape):
+            raise ValueError("curvatures, moments and axial_strains must be one-dimensional arrays of equal length")
+        if len(self.curvatures) < 2:
+            raise ValueError("A moment-curvature table needs at least two points")
+        if np.any(np.diff(self.curvatures) <= 0) or np.any(np.diff(self.moments) <= 0):
+            raise ValueError("curvatures and moments must be strictly increasing")
+
+    def __len__(self) -> int:
+        return len(self.curvatures)
+
+    def __getstate__(self):
+        return self.curvatures, self.moments, self.axial_strains
+
+    def __setstate__(self, state):
+        self.curvatures, self.moments, self.axial_strains = state
+
+    # -----------------------------------------------------------------------
+    # Construction
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _branch(results: MomentCurvatureResults, z_shift: float = 0.0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns (κ, M, ε) of a moment-curvature calculation in sagging-positive units, from κ = 0 up to the peak
+        moment, with points removed where M does not increase. The axial strain is taken at z = z_shift [mm].
+        """
+        chi_y = np.asarray(results.chi_y, dtype=float)
+        kappa = -per_mm_to_per_m(chi_y)
+        M = -Nmm_to_kNm(np.asarray(results.m_y, dtype=float))
+        eps = np.asarray(results.eps_axial, dtype=float) + chi_y * z_shift
+
+        # κ(M) must be single-valued: keep the rising part up to the peak moment
+        peak = int(np.argmax(M))
+        kappa, M, eps = kappa[:peak + 1], M[:peak + 1], eps[:peak + 1]
+        keep = np.concatenate(([True], M[1:] > np.maximum.accumulate(M)[:-1]))
+        kappa, M, eps = kappa[keep], M[keep], eps[keep]
+
+        # start the branch at κ = 0 (a prestressed section carries a moment at zero curvature)
+        if kappa[0] != 0.0 and len(kappa) > 1:
+            t = -kappa[0] / (kappa[1] - kappa[0])
+            M_0 = M[0] + t * (M[1] - M[0])
+            if abs(M_0) < 1e-9 * abs(M[-1]):
+                M_0 = 0.0
+            kappa = np.concatenate(([0.0], kappa))
+            M = np.concatenate(([M_0], M))
+            eps = np.concatenate(([eps[0] + t * (eps[1] - eps[0])], eps))
+
+        return kappa, M, eps
+
+    @classmethod
+    def from_results(
+            cls,
+            results: MomentCurvatureResults,
+            flipped_results: Optional[MomentCurvatureResults] = None,
+            centroid_z: float = 0.0
+    ) -> "MomentCurvatureTable":
+        """
+        Returns the table of a moment-curvature calculation.
+
+        :param results: Moment-curvature results of the section (sagging branch)
+        :param flipped_results: Moment-curvature results of the flipped section (hogging branch), optional
+        :param centroid_z: z-coordinate of the gross centroid in mm, about which flipped_section rotates the section.
+                           Used to refer the axial strains of the flipped section to the origin of the section.
+        """
+        sagging = cls(*cls._branch(results))
+        if flipped_results is None:
+            return sagging
+
+        # the sagging branch of the flipped section is the hogging branch of the section,
+        # the origin of the section lies at z = 2 * centroid_z in the flipped section
+        hogging = cls(*cls._branch(flipped_results, 2 * centroid_z)).mirrored()
+        return cls.combine(hogging, sagging)
+
+    @classmethod
+    def from_section(cls, section: GenericSection, n: float = 0.0, hogging: bool = True) -> "MomentCurvatureTable":
+        """
+        Returns the table of a (ULS) section from the SLS moment-curvature calculation (see
+        calculate_moment_curvature_sls), including the hogging branch of the flipped section if requested
+
+        :param section: Section
+        :param n: Axial force in N
+        :param hogging: Include the hogging branch (negative curvatures)
+        """
+        results = calculate_moment_curvature_sls(section, n)
+        if not hogging:
+            return cls.from_results(results)
+
+        flipped_results = calculate_moment_curvature_sls(flipped_section(section), n)
+        return cls.from_results(results, flipped_results, section.gross_properties.cz)
+
+    @classmethod
+    def combine(cls, hogging: "MomentCurvatureTable", sagging: "MomentCurvatureTable") -> "MomentCurvatureTable":
+        """
+        Returns the table over both branches, given the hogging branch (in sagging-positive units, κ <= 0) and the
+        sagging branch (κ >= 0)
+        """
+        lower = hogging.curvatures < 0
+        M = np.concatenate((hogging.moments[lower], sagging.moments))
+        keep = np.concatenate(([True], M[1:] > np.maximum.accumulate(M)[:-1]))
+        return cls(
+            np.concatenate((hogging.curvatures[lower], sagging.curvatures))[keep],
+            M[keep],
+            np.concatenate((hogging.axial_strains[lower], sagging.axial_strains))[keep],
+        )
+
+    def linearized(self, offset: bool = True) -> "MomentCurvatureTable":
+        """
+        Returns the linear-elastic table M = M(0) + EI0 κ with the initial tangent stiffness EI0 (at κ = 0), over
+        1000 times the curvature range of the table (reference for linear-elastic solutions)
+
+        :param offset: Keep the moment at zero curvature (prestress), otherwise M = EI0 κ
+        """
+        M_0 = self.moment_at_zero_curvature() if offset else 0.0
+        EI_0 = float(self.tangent_stiffness(0.0))
+        kappa = 1e3 * max(abs(self.curvatures[0]), abs(self.curvatures[-1])) * np.array([-1.0, 1.0])
+        return MomentCurvatureTable(kappa, M_0 + EI_0 * kappa)
+
+    def mirrored(self) -> "MomentCurvatureTable":
+        """
+        Returns the table with the sign of curvatures and moments reversed (e.g. a flipped section's sagging
+        branch as hogging branch of the section)
+        """
+        return MomentCurvatureTable(-self.curvatures[::-1], -self.moments[::-1], self.axial_strains[::-1])
+
+    # -----------------------------------------------------------------------
+    # Storage
+    # -----------------------------------------------------------------------
+
+    def save(self, path) -> None:
+        """
+        Stores the table as .npy file (array of shape (3, n): curvatures, moments, axial strains)
+        """
+        np.save(path, np.stack((self.curvatures, self.moments, self.axial_strains)))
+
+    @classmethod
+    def load(cls, path, mmap_mode: Optional[str] = "r") -> "MomentCurvatureTable":
+        """
+        Loads a table stored with save, memory-mapped by default (no copy of the data)
+        """
+        data = np.load(path, mmap_mode=mmap_mode)
+        return cls(data[0], data[1], data[2])
+
+    # -----------------------------------------------------------------------
+    # Queries
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _interpolate(xp: np.ndarray, fp: np.ndarray, x: ArrayLike) -> np.ndarray:
+        """
+        Linear interpolation of fp(xp) at x with searchsorted, NaN outside [xp[0] ; xp[-1]]
+        """
+        x = np.asarray(x, dtype=float)
+        i = np.clip(np.searchsorted(xp, x, side="right") - 1, 0, len(xp) - 2)
+        t = (x - xp[i]) / (xp[i + 1] - xp[i])
+        return np.where((x >= xp[0]) & (x <= xp[-1]), fp[i] + t * (fp[i + 1] - fp[i]), np.nan)
+
+    @property
+    def curvature_range(self) -> tuple[float, float]:
+        return float(self.curvatures[0]), float(self.curvatures[-1])
+
+    @property
+    def moment_range(self) -> tuple[float, float]:
+        return float(self.moments[0]), float(self.moments[-1])
+
+    def moment_at_zero_curvature(self) -> float:
+        """
+        Returns the moment at κ = 0 in kNm (non-zero for prestressed sections), NaN if κ = 0 is not in the table
+        """
+        return float(self._interpolate(self.curvatures, self.moments, 0.0))
+
+    def curvature(self, M: ArrayLike) -> np.ndarray:
+        """
+        Returns the curvatures [1/m] for moments M [kNm]
+        """
+        return self._interpolate(self.moments, self.curvatures, M)
+
+    def moment(self, kappa: ArrayLike) -> np.ndarray:
+        """
+        Returns the moments [kNm] for curvatures κ [1/m]
+        """
+        return self._interpolate(self.curvatures, self.moments, kappa)
+
+    def axial_strain(self, kappa: ArrayLike) -> np.ndarray:
+        """
+        Returns the axial strains [-] at the section origin for curvatures κ [1/m]
+        """
+        return self._interpolate(self.curvatures, self.axial_strains, kappa)
+
+    def tangent_stiffness(self, kappa: ArrayLike) -> np.ndarray:
+        """
+        Returns the tangent stiffness dM/dκ [kNm²] for curvatures κ [1/m] (slope of the table segment)
+        """
+        kappa = np.asarray(kappa, dtype=float)
+        xp, fp = self.curvatures, self.moments
+        i = np.clip(np.searchsorted(xp, kappa, side="right") - 1, 0, len(xp) - 2)
+        slope = (fp[i + 1] - fp[i]) / (xp[i + 1] - xp[i])
+        return np.where((kappa >= xp[0]) & (kappa <= xp[-1]), slope, np.nan)
+
+    def secant_stiffness(self, kappa: ArrayLike) -> np.ndarray:
+        """
+        Returns the secant stiffness (M(κ) - M(0)) / κ [kNm²] for curvatures κ [1/m], measured from the state of
+        zero curvature; at κ = 0 the tangent stiffness is returned
+        """
+        kappa = np.asarray(kappa, dtype=float)
+        dM = self.moment(kappa) - self.moment_at_zero_curvature()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            secant = dM / kappa
+        return np.where(kappa == 0.0, self.tangent_stiffness(kappa), secant)
+
+
+# Station tables of every slab, released together with the slab
+_STATION_TABLES: "WeakKeyDictionary[OneWaySlab, Dict[tuple, MomentCurvatureTable]]" = WeakKeyDictionary()
+# Sagging moment-curvature results of the stations, kept to add the hogging branch on demand
+_STATION_RESULTS: "WeakKeyDictionary[OneWaySlab, Dict[tuple, MomentCurvatureResults]]" = WeakKeyDictionary()
+
+
+def get_station_table(slab: OneWaySlab, xi: float, n: float = 0.0, hogging: bool = False) -> MomentCurvatureTable:
+    """
+    Returns the (cached) moment-curvature table of the slab section at station xi ∈ [0 ; 1].
+
+    The sagging and hogging branches are computed once each, on first use; hogging=True returns the table over both
+    branches.
+
+    :param slab: One-way slab
+    :param xi: Station within the span (0 at first support, 1 at second support)
+    :param n: Axial force in N
+    :param hogging: Include the hogging branch (negative curvatures)
+    """
+    tables = _STATION_TABLES.setdefault(slab, {})
+    results = _STATION_RESULTS.setdefault(slab, {})
+    xi, n = round(float(xi), 12), float(n)
+
+    if (xi, n) not in results:
+        results[(xi, n)] = calculate_moment_curvature_sls(slab.section_at(xi), n)
+        tables[(xi, n, "sagging")] = MomentCurvatureTable.from_results(results[(xi, n)])
+    if not hogging:
+        return tables[(xi, n, "sagging")]
+
+    if (xi, n, "full") not in tables:
+        section = slab.section_at(xi)
+        tables[(xi, n, "full")] = MomentCurvatureTable.from_results(
+            results[(xi, n)],
+            calculate_moment_curvature_sls(flipped_section(section), n),
+            section.gross_properties.cz,
+        )
+    return tables[(xi, n, "full")]
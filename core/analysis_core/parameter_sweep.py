@@ -0,0 +1,255 @@
+"""
+Parameter sweeps over HP slab designs.
+
+A design is a flat dict of the parameters in SWEEP_PARAMETERS. Designs are generated from a grid or a
+random sample, evaluated in a process pool (HPSlab construction plus the requested ultimate moment
+checks) and streamed to CSV or Parquet one row per design. Designs that are already in the output
+file are skipped, so an interrupted sweep is resumed by simply running it again.
+"""
+import hashlib
+import itertools
+import json
+import math
+import os
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator, Mapping, Optional, Sequence
+
+from core.analysis_core.checks.check_suite import CheckSuite
+from core.analysis_core.loads import Loads
+from core.analysis_core.material_methods import create_cfrp_reinforcement, create_uls_concrete
+from core.ioh_core.result_writers import ResultWriter, open_result_writer
+from core.unit_core import mm3_to_m3
+from slab_construction.slab_construction import Floor, FloorMaterial, SlabConstruction
+from slab_construction.slabs.hp_slab.model.hp_geometry import HPGeometry
+from slab_construction.slabs.hp_slab.model.hp_shell import HPShell
+from slab_construction.slabs.hp_slab.model.hp_slab import HPSlab
+
+# Parameters that define one design
+#   B, L, Hx, Hy, t, dy, nt : HPGeometry [mm], nt [-]
+#   fck                     : concrete grade [MPa]
+#   cfrp                    : label of a CFRP product in SweepContext.cfrp_products
+#   prestress               : prestress level as fraction of epsuk [-]
+#   reinf_area              : area per tendon [mm²]
+SWEEP_PARAMETERS: tuple[str, ...] = (
+    "B", "L", "Hx", "Hy", "t", "dy", "nt", "fck", "cfrp", "prestress", "reinf_area",
+)
+
+
+@dataclass(slots=True)
+class SweepContext:
+    """
+    Everything a design needs besides its own parameters. Sent once to every worker process.
+
+    cfrp_products maps a label to the keyword arguments of create_cfrp_reinforcement (without prestress),
+    checks is a list of (system, moment type) pairs evaluated with CheckSuite.
+    """
+    cfrp_products: dict[str, dict]
+    infill_material: FloorMaterial
+    floor: Floor
+    loads: Loads
+    checks: list[tuple[str, str]] = field(default_factory=lambda: [("SIMPLE_BEAM", "MAX_POS_MOMENT")])
+    n: float = 0.0
+
+
+# ---------------------------------------------------------------------------
+# Design generation
+# ---------------------------------------------------------------------------
+
+def parameter_grid(space: Mapping[str, Sequence]) -> Iterator[dict]:
+    """
+    Yields the full factorial grid of the given parameter values, lazily (the grid is never materialised)
+    """
+    check_parameters(space)
+    names = list(space)
+    for values in itertools.product(*(space[name] for name in names)):
+        yield dict(zip(names, values))
+
+
+def parameter_sample(space: Mapping[str, Sequence | tuple[float, float]], n_samples: int,
+                     seed: Optional[int] = None) -> Iterator[dict]:
+    """
+    Yields n_samples random designs. A tuple (low, high) is sampled uniformly, any other sequence is
+    sampled by random choice (use a list for discrete numeric values such as nt).
+    """
+    check_parameters(space)
+    rng = random.Random(seed)
+    for _ in range(n_samples):
+        design = {}
+        for name, values in space.items():
+            if isinstance(values, tuple):
+                low, high = values
+                design[name] = rng.uniform(low, high)
+            else:
+                design[name] = rng.choice(list(values))
+        yield design
+
+
+def check_parameters(params: Mapping) -> None:
+    """
+    Raises a ValueError unless params has exactly the names of SWEEP_PARAMETERS (a design or a parameter space)
+    """
+    missing = [name for name in SWEEP_PARAMETERS if name not in params]
+    unknown = [name for name in params if name not in SWEEP_PARAMETERS]
+    if missing or unknown:
+        raise ValueError(f"Invalid sweep parameters. Missing: {missing}, unknown: {unknown}")
+
+
+def design_id(params: Mapping) -> str:
+    """
+    Returns a stable identifier of a design, independent of parameter order and process
+    """
+    canonical = json.dumps({name: params[name] for name in SWEEP_PARAMETERS}, sort_keys=True, default=str)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+# ---------------------------------------------------------------------------
+# Design evaluation
+# ---------------------------------------------------------------------------
+
+def build_slab_construction(params: Mapping, context: SweepContext) -> SlabConstruction:
+    """
+    Returns the slab construction (HP slab plus floor) of a design
+    """
+    hp_geometry = HPGeometry(
+        B=params["B"], L=params["L"], Hx=params["Hx"], Hy=params["Hy"],
+        t=params["t"], dy=params["dy"], nt=int(params["nt"]),
+    )
+    reinforcement = create_cfrp_reinforcement(**context.cfrp_products[params["cfrp"]],
+                                               prestress=params["prestress"])
+    hp_shell = HPShell(hp_geometry, create_uls_concrete(params["fck"]), reinforcement,
+                       reinf_area=params["reinf_area"])
+
+    return SlabConstruction(HPSlab(hp_shell, context.infill_material), context.floor)
+
+
+def utilization_column(system: str, moment: str) -> str:
+    return f"utilization_{system.strip().lower()}_{moment.strip().lower()}"
+
+
+def result_fieldnames(context: SweepContext) -> list[str]:
+    """
+    Returns the output columns of a sweep: design id, parameters, loads, one utilization per check
+    """
+    return (
+        ["design_id", *SWEEP_PARAMETERS, "concrete_volume", "self_load", "infill_load"]
+        + [utilization_column(system, moment) for system, moment in context.checks]
+        + ["max_utilization", "error"]
+    )
+
+
+def evaluate_design(params: Mapping, context: SweepContext) -> dict:
+    """
+    Builds a design and runs all checks of the context. Failing designs are reported in the
+    'error' column instead of aborting the sweep.
+    """
+    row = {"design_id": design_id(params), **{name: params[name] for name in SWEEP_PARAMETERS}, "error": ""}
+
+    try:
+        slab_construction = build_slab_construction(params, context)
+        slab = slab_construction.slab
+
+        row["concrete_volume"] = mm3_to_m3(slab.hp_shell.hp_geometry.volume())  # [m³]
+        row["self_load"] = slab.self_load()                                     # [kN/m²]
+        row["infill_load"] = slab.infill_load()                                 # [kN/m²]
+
+        # checks sharing a section share one resistance calculation
+        utilizations = CheckSuite(context.checks, context.n).run(slab_construction, context.loads)
+        for (system, moment), utilization in utilizations.items():
+            row[utilization_column(system, moment)] = utilization
+
+        row["max_utilization"] = max(utilizations.values()) if utilizations else math.nan
+
+    except Exception as exc:
+        row["error"] = f"{type(exc).__name__}: {exc}"
+
+    return row
+
+
+_WORKER_TASK: Optional[tuple[Callable, object]] = None
+
+
+def _init_worker(evaluate: Callable, context) -> None:
+    global _WORKER_TASK
+    _WORKER_TASK = (evaluate, context)
+
+
+def _evaluate_in_worker(item: dict) -> dict:
+    evaluate, context = _WORKER_TASK
+    return evaluate(item, context)
+
+
+# ---------------------------------------------------------------------------
+# Sweep driver
+# ---------------------------------------------------------------------------
+
+def stream_results(
+        items: Iterable[dict],
+        evaluate: Callable[[dict, object], dict],
+        context,
+        writer: ResultWriter,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+) -> int:
+    """
+    Evaluates all items with evaluate(item, context) and writes the returned rows as they finish
+    (also used by the portfolio runner)
+
+    :param items: Iterable of items (e.g. designs), only consumed as the pool has capacity
+    :param evaluate: Picklable (module-level) function returning one result row per item
+    :param context: Shared data, sent once to every worker process
+    :param writer: Result writer (or any object with write_row)
+    :param max_workers: Number of worker processes, 1 evaluates in the current process
+    :param max_pending: Maximum number of items in flight, bounds memory for very large runs
+    :return: Number of items evaluated
+    """
+    count = 0
+    if max_workers == 1:
+        for item in items:
+            writer.write_row(evaluate(item, context))
+            count += 1
+        return count
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                             initargs=(evaluate, context)) as executor:
+        limit = max_pending or 4 * (max_workers or os.cpu_count() or 1)
+        pending = set()
+
+        for item in items:
+            pending.add(executor.submit(_evaluate_in_worker, item))
+            if len(pending) >= limit:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    writer.write_row(future.result())
+                    count += 1
+
+        for future in wait(pending).done:
+            writer.write_row(future.result())
+            count += 1
+
+    return count
+
+
+def run_sweep(
+        designs: Iterable[Mapping],
+        context: SweepContext,
+        path,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+) -> int:
+    """
+    Evaluates all designs and streams one row per design to path ('.csv' or Parquet directory).
+
+    :param designs: Iterable of designs, e.g. parameter_grid(...) or parameter_sample(...)
+    :param context: Shared materials, floor, loads and checks
+    :param path: Output file; designs already contained are skipped (resume)
+    :param max_workers: Number of worker processes, 1 evaluates in the current process
+    :param max_pending: Maximum number of designs in flight, bounds memory for very large sweeps
+    :return: Number of designs evaluated in this run
+    """
+    with open_result_writer(path, result_fieldnames(context)) as writer:
+        done = writer.completed_keys()
+        todo = (dict(params) for params in designs if design_id(params) not in done)
+
+        return stream_results(todo, evaluate_design, context, writer, max_workers, max_pending)
@@ -0,0 +1,190 @@
+"""
+Trade-off between cost, embodied carbon and structural reserve of HP slab designs.
+
+Candidate designs (e.g. parameter_grid or parameter_sample) are evaluated in a process pool; the non-dominated
+designs (minimum cost, GWP and utilization) are kept in a ParetoFront that is updated as results arrive. Every
+change of the front is appended to a JSON Lines file, so the front can be plotted while the run is in progress
+(read_front replays the file).
+"""
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Mapping, Optional, Sequence
+
+import numpy as np
+
+from core.analysis_core.design_optimizer import DesignOptimizer
+from core.analysis_core.material_methods import ConcreteCO2Registry
+from core.analysis_core.parameter_sweep import SweepContext, evaluate_design, stream_results
+
+# Minimised objectives of a design record
+OBJECTIVES: tuple[str, ...] = ("cost", "gwp", "max_utilization")
+
+
+class ParetoFront:
+    """
+    Incrementally maintained set of non-dominated records (all objectives minimised).
+
+    The objective values of the front are kept in one array, so a dominance check against the whole front is a
+    single vectorised comparison.
+    """
+
+    def __init__(self, objectives: Sequence[str] = OBJECTIVES):
+        self.objectives = tuple(objectives)
+        self._values = np.empty((0, len(self.objectives)))
+        self._records: list[dict] = []
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def records(self) -> list[dict]:
+        return list(self._records)
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Objective values of the front as array (n, n_objectives)
+        """
+        return self._values.copy()
+
+    def _point(self, record: Mapping) -> np.ndarray:
+        return np.array([record[name] for name in self.objectives], dtype=float)
+
+    def is_dominated(self, record: Mapping) -> bool:
+        """
+        True if a design of the front is at least as good in all objectives and better in one
+        (or equal in all objectives, duplicates are not kept)
+        """
+        point = self._point(record)
+        return bool(np.any(np.all(self._values <= point, axis=1)))
+
+    def add(self, record: dict) -> tuple[bool, list[dict]]:
+        """
+        Adds a record unless it is dominated, removing the records it dominates
+
+        :return: (added, removed records)
+        """
+        point = self._point(record)
+        if not np.all(np.isfinite(point)) or self.is_dominated(record):
+            return False, []
+
+        dominated = np.all(point <= self._values, axis=1)
+        removed = [r for r, d in zip(self._records, dominated) if d]
+
+        self._values = np.vstack((self._values[~dominated], point))
+        self._records = [r for r, d in zip(self._records, dominated) if not d] + [record]
+        return True, removed
+
+
+@dataclass(slots=True)
+class ParetoContext:
+    """
+    Everything a candidate needs besides its own parameters. Sent once to every worker process.
+
+    cfrp_gwp [kg CO2eq/kg] and cfrp_cost [€/kg] add the CFRP reinforcement to the concrete values (see
+    DesignOptimizer), designs above max_utilization are not admitted to the front.
+
+    The DesignOptimizer computing GWP and cost (with its concrete registry) is built with the context, so every
+    worker receives it once instead of building it for each candidate.
+    """
+    sweep: SweepContext
+    registry: Optional[ConcreteCO2Registry] = None
+    cfrp_gwp: float = 0.0
+    cfrp_cost: float = 0.0
+    max_utilization: float = 1.0
+    optimizer: DesignOptimizer = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.optimizer = DesignOptimizer(self.sweep, self.registry, cfrp_gwp=self.cfrp_gwp, cfrp_cost=self.cfrp_cost)
+
+
+def evaluate_candidate(params: Mapping, context: ParetoContext) -> dict:
+    """
+    Returns the sweep row of a design (see evaluate_design) with its 'gwp' [kg CO2eq/m²] and 'cost' [€/m²]
+    """
+    row = evaluate_design(params, context.sweep)
+    try:
+        values = context.optimizer.objectives([params])
+        row["gwp"], row["cost"] = float(values["gwp"][0]), float(values["cost"][0])
+    except Exception as exc:
+        row["error"] = row["error"] or f"{type(exc).__name__}: {exc}"
+    return row
+
+
+class _FrontStream:
+    """
+    Receives the evaluated candidates (as result writer of stream_results), updates the front and appends its
+    changes to a JSON Lines file: {"event": "add", "record": {...}} and {"event": "remove", "design_id": ...}
+    """
+
+    def __init__(self, front: ParetoFront, path, max_utilization: float):
+        self.front = front
+        self.max_utilization = max_utilization
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write_row(self, row: dict) -> None:
+        # designs without checks have max_utilization NaN
+        if row["error"] or not row["max_utilization"] <= self.max_utilization:
+            return
+
+        added, removed = self.front.add(row)
+        if not added:
+            return
+
+        lines = [{"event": "remove", "design_id": r["design_id"]} for r in removed]
+        lines.append({"event": "add", "record": row})
+        self._file.write("".join(json.dumps(line, default=float) + "\n" for line in lines))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def explore_pareto_front(
+        designs: Iterable[Mapping],
+        context: ParetoContext,
+        path,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+) -> ParetoFront:
+    """
+    Evaluates all candidate designs and returns the front of cost, GWP and utilization. An existing file is
+    overwritten.
+
+    :param designs: Iterable of designs, e.g. parameter_grid(...) or parameter_sample(...)
+    :param context: Shared materials, floor, loads, checks and CO2/cost data
+    :param path: JSON Lines file receiving the changes of the front
+    :param max_workers: Number of worker processes, 1 evaluates in the current process
+    :param max_pending: Maximum number of designs in flight
+    """
+    front = ParetoFront()
+    stream = _FrontStream(front, path, context.max_utilization)
+    try:
+        stream_results((dict(params) for params in designs), evaluate_candidate, context, stream,
+                       max_workers, max_pending)
+    finally:
+        stream.close()
+
+    return front
+
+
+def read_front(path) -> list[dict]:
+    """
+    Returns the records of the front stored in a JSON Lines file written by explore_pareto_front
+    (also while the exploration is running; a partly written last line is ignored)
+    """
+    records: dict[str, dict] = {}
+    with Path(path).open(encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            event = json.loads(line)
+            if event["event"] == "add":
+                records[event["record"]["design_id"]] = event["record"]
+            else:
+                records.pop(event["design_id"], None)
+
+    return list(records.values())
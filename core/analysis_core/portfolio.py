@@ -0,0 +1,184 @@
+"""
+Batch checks of a portfolio of project slabs.
+
+Every slab is one row of a CSV or JSON table: an identifier, the structural system, the HP slab parameters
+(SWEEP_PARAMETERS), the floor (label in PortfolioContext.floors) and its own loads. The ultimate moment checks
+of all slabs run in a process pool and one result row per slab is streamed to the output file, which is also
+the checkpoint: slabs already contained are skipped, so an interrupted run is resumed by running it again.
+Slabs whose evaluation failed (non-empty 'error') are checked again on resume unless retry_failed is False; their
+new row is appended, so the last row of a slab is its current result.
+"""
+import csv
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Mapping, Optional
+
+from core.analysis_core.checks.check_suite import CheckSuite, system_cases
+from core.analysis_core.loads import Loads
+from core.analysis_core.parameter_sweep import SWEEP_PARAMETERS, SweepContext, build_slab_construction, stream_results
+from core.analysis_core.statics import MomentType
+from core.ioh_core.result_writers import open_result_writer
+from slab_construction.slab_construction import Floor, FloorMaterial
+
+# Columns of a portfolio table
+#   slab_id                    : unique identifier of the slab
+#   system                     : structural system (CANTILEVER ... FIVE_SPAN)
+#   SWEEP_PARAMETERS           : HP slab parameters, see parameter_sweep
+#   live_loads, psi_0/1/2      : lists (JSON) or ';'-separated values (CSV), see Loads
+# optional:
+#   floor                      : label in PortfolioContext.floors (default "default")
+#   gamma_g, gamma_q           : partial factors (default 1.35, 1.5)
+#   n                          : axial force in N (default 0.0)
+PORTFOLIO_COLUMNS: tuple[str, ...] = (
+    "slab_id", "system", *SWEEP_PARAMETERS, "live_loads", "psi_0", "psi_1", "psi_2",
+)
+_LIST_COLUMNS = ("live_loads", "psi_0", "psi_1", "psi_2")
+_TEXT_COLUMNS = ("slab_id", "system", "cfrp", "floor")
+_DEFAULTS = {"floor": "default", "gamma_g": 1.35, "gamma_q": 1.5, "n": 0.0}
+
+RESULT_COLUMNS: list[str] = [
+    "slab_id", "system", "self_load", "non_structural_load", "design_load",
+    *(f"utilization_{moment.value.lower()}" for moment in MomentType),
+    "max_utilization", "governing_moment", "error",
+]
+
+
+@dataclass(slots=True)
+class PortfolioContext:
+    """
+    Materials and floors shared by the slabs of a portfolio. Sent once to every worker process.
+
+    cfrp_products maps a label to the keyword arguments of create_cfrp_reinforcement (without prestress),
+    floors maps a label to a floor construction.
+    """
+    cfrp_products: dict[str, dict]
+    infill_material: FloorMaterial
+    floors: dict[str, Floor]
+
+
+# ---------------------------------------------------------------------------
+# Input
+# ---------------------------------------------------------------------------
+
+def _parse_slab(row: Mapping) -> dict:
+    """
+    Returns a slab definition with typed values (CSV cells are strings)
+    """
+    missing = [name for name in PORTFOLIO_COLUMNS if row.get(name) in (None, "")]
+    if missing:
+        raise ValueError(f"Slab {row.get('slab_id', '?')}: missing columns {missing}")
+
+    slab = {**_DEFAULTS, **{name: value for name, value in row.items() if value not in (None, "")}}
+    for name, value in slab.items():
+        if name in _TEXT_COLUMNS:
+            slab[name] = str(value).strip()
+        elif name in _LIST_COLUMNS:
+            values = value.split(";") if isinstance(value, str) else value
+            slab[name] = [float(v) for v in values]
+        elif name == "nt":
+            slab[name] = int(float(value))
+        else:
+            slab[name] = float(value)
+
+    slab["system"] = slab["system"].upper()
+    return slab
+
+
+def read_portfolio(path) -> list[dict]:
+    """
+    Reads the slab definitions of a portfolio from a CSV file or a JSON file (list of objects)
+    """
+    path = Path(path)
+
+    if path.suffix.lower() == ".json":
+        with path.open(encoding="utf-8") as f:
+            rows = json.load(f)
+    else:
+        with path.open(newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+
+    slabs = [_parse_slab(row) for row in rows]
+
+    ids = [slab["slab_id"] for slab in slabs]
+    duplicates = sorted({slab_id for slab_id in ids if ids.count(slab_id) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate slab ids: {duplicates}")
+
+    return slabs
+
+
+# ---------------------------------------------------------------------------
+# Evaluation
+# ---------------------------------------------------------------------------
+
+def evaluate_slab(slab: Mapping, context: PortfolioContext) -> dict:
+    """
+    Builds a slab construction and runs its checks. Failing slabs are reported in the 'error' column
+    instead of aborting the run.
+    """
+    row = {"slab_id": slab["slab_id"], "system": slab["system"], "error": ""}
+
+    try:
+        if slab["floor"] not in context.floors:
+            raise ValueError(f"Unknown floor '{slab['floor']}'. Must be one of: {list(context.floors)}")
+
+        loads = Loads(slab["live_loads"], slab["psi_0"], slab["psi_1"], slab["psi_2"],
+                      gamma_g=slab["gamma_g"], gamma_q=slab["gamma_q"])
+        sweep_context = SweepContext(
+            cfrp_products=context.cfrp_products,
+            infill_material=context.infill_material,
+            floor=context.floors[slab["floor"]],
+            loads=loads,
+            checks=system_cases(slab["system"]),
+            n=slab["n"],
+        )
+        slab_construction = build_slab_construction(slab, sweep_context)
+
+        row["self_load"] = slab_construction.structural_dead_load()             # [kN/m²]
+        row["non_structural_load"] = slab_construction.non_structural_dead_load()   # [kN/m²]
+        row["design_load"] = loads.fundamental_combination(slab_construction)   # [kN/m²]
+
+        results = CheckSuite(sweep_context.checks, sweep_context.n).evaluate(slab_construction, loads)
+        for result in results:
+            row[f"utilization_{result.moment.lower()}"] = result.utilization
+
+        governing = max(results, key=lambda result: result.utilization)
+        row["max_utilization"] = governing.utilization
+        row["governing_moment"] = governing.moment
+
+    except Exception as exc:
+        row["error"] = f"{type(exc).__name__}: {exc}"
+
+    return row
+
+
+def run_portfolio(
+        slabs: Iterable[Mapping] | str | Path,
+        context: PortfolioContext,
+        path,
+        max_workers: Optional[int] = None,
+        batch_size: int = 1,
+        retry_failed: bool = True,
+) -> int:
+    """
+    Checks all slabs of a portfolio and streams one row per slab to path ('.csv' or Parquet directory).
+
+    :param slabs: Slab definitions, or the path of a portfolio table (see read_portfolio)
+    :param context: Shared materials and floors
+    :param path: Output file and checkpoint; slabs already contained are skipped (resume)
+    :param max_workers: Number of worker processes, 1 evaluates in the current process
+    :param batch_size: Rows buffered before they are written, 1 writes every slab as soon as it is checked
+    :param retry_failed: Check slabs again whose stored row has an error (a new row is appended)
+    :return: Number of slabs checked in this run
+    """
+    if isinstance(slabs, (str, Path)):
+        slabs = read_portfolio(slabs)
+    else:
+        slabs = (_parse_slab(slab) for slab in slabs)
+
+    with open_result_writer(path, RESULT_COLUMNS, key="slab_id", batch_size=batch_size) as writer:
+        done = writer.completed_keys(error_column="error" if retry_failed else None)
+        todo = (slab for slab in slabs if slab["slab_id"] not in done)
+
+        return stream_results(todo, evaluate_slab, context, writer, max_workers)
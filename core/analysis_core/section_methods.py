@@ -1,12 +1,14 @@
+import hashlib
+
 import numpy as np
 from structuralcodes.core._section_results import MomentCurvatureResults
 from structuralcodes.geometry import  CompoundGeometry, SurfaceGeometry
-from structuralcodes.materials.concrete import Concrete, create_concrete
+from structuralcodes.materials.concrete import Concrete
 from structuralcodes.materials.constitutive_laws import Sargin, UserDefined
 from structuralcodes.materials.reinforcement import Reinforcement
 from structuralcodes.sections import GenericSection
 
-from core.analysis_core.material_methods import sargin_elastic_law, get_cube
+from core.analysis_core.material_methods import MATERIALS, sargin_elastic_law, get_cube, tabulated_concrete
 
 
 def calculate_cracking_moment_sls(section: GenericSection, n: float = 0.0) -> dict:
@@ -283,10 +285,13 @@ def get_strain_at_point(strain_profile, y, z) -> float:
     eps_0, chi_y, chi_z = strain_profile
     return eps_0 + chi_y * z + chi_z * y
 
-def sls_section(section_uls: GenericSection, concrete_tension: bool) -> GenericSection:
+def sls_section(section_uls: GenericSection, concrete_tension: bool, tabulated: bool = False) -> GenericSection:
     """
     Author: Elliot Melcer
     Returns the section with sls constitutive law for concrete
+    The SLS concretes are interned (MATERIALS), all SLS sections of equal concretes share one material.
+    With tabulated=True the Sargin law is replaced by its tabulation (see TabulatedLaw); the law with concrete
+    tension is piecewise linear already.
     """
     # get the geometry of the section
     geo = section_uls.geometry
@@ -298,10 +303,12 @@ def sls_section(section_uls: GenericSection, concrete_tension: bool) -> GenericS
 
     # If Concrete should be able to take tension forces, use custom constitutive law (linear in tension and non-linear in compression)
     if concrete_tension:
-        concrete_sls = create_concrete(fck=f_ck, constitutive_law=sargin_elastic_law(conc), name = f"C{f_ck}/{f_cube} SLS")
+        concrete_sls = MATERIALS.concrete(fck=f_ck, constitutive_law=sargin_elastic_law(conc), name = f"C{f_ck}/{f_cube} SLS")
     # If Concrete should not be able to take tension forces, use sargin (nonlinear) constitutive law
     else:
-        concrete_sls = create_concrete(fck=f_ck, constitutive_law='sargin', name=f"C{f_ck}/{f_cube} SLS")
+        concrete_sls = MATERIALS.concrete(fck=f_ck, constitutive_law='sargin', name=f"C{f_ck}/{f_cube} SLS")
+        if tabulated:
+            concrete_sls = tabulated_concrete(concrete_sls)
 
     processed_geoms = []
     for g in geo.geometries:
@@ -388,4 +395,42 @@ def get_number_of_reinforcements(section: GenericSection) -> int:
     """
     geom = section.geometry
     n = len(geom.point_geometries)
-    return n
\ No newline at end of file
+    return n
+
+
+# Material parameters entering section_fingerprint (NaN where a material does not have them)
+_FINGERPRINT_PARAMETERS: tuple[str, ...] = ("fck", "fyk", "ftk", "Es", "epsuk")
+
+
+def _material_signature(material) -> bytes:
+    """
+    Returns the bytes identifying a material in section_fingerprint: name, constitutive law class, key
+    parameters, initial strain (prestress) and ultimate strains of the constitutive law
+    """
+    law = material.constitutive_law
+    values = [float(getattr(material, name, np.nan)) for name in _FINGERPRINT_PARAMETERS]
+    values.append(float(getattr(material, "initial_strain", None) or 0.0))
+    values.extend(float(eps) for eps in law.get_ultimate_strain())
+
+    return f"{material.name}|{type(law).__name__}|".encode("utf-8") + np.array(values, dtype=float).tobytes()
+
+
+def section_fingerprint(section: GenericSection) -> str:
+    """
+    Returns a short hash of the section geometry and materials (surface outlines, reinforcement positions and
+    diameters, material names, constitutive laws and key parameters, see _material_signature). Equal sections
+    have equal fingerprints, sections differing in any of these (e.g. only in prestress) different ones.
+    """
+    digest = hashlib.sha1()
+
+    geometry = section.geometry
+    surfaces = geometry.geometries if hasattr(geometry, "geometries") else [geometry]
+    for g in surfaces:
+        digest.update(g.polygon.wkb)
+        digest.update(_material_signature(g.material))
+
+    for pg in getattr(geometry, "point_geometries", []):
+        digest.update(np.array([pg.x, pg.y, pg.diameter], dtype=float).tobytes())
+        digest.update(_material_signature(pg.material))
+
+    return digest.hexdigest()[:16]
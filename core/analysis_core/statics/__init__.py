@@ -33,9 +33,19 @@ MAX_X_POSITIONS: Dict[str, float] = {
     "FIVE_SPAN": 5.0,     # Supports at 0, 1, 2, 3, 4, 5
 }
 
+# Number of equal spans of the continuous beam systems (CANTILEVER is not a continuous beam)
+NUMBER_OF_SPANS: Dict[str, int] = {
+    "SIMPLE_BEAM": 1,
+    "TWO_SPAN": 2,
+    "THREE_SPAN": 3,
+    "FOUR_SPAN": 4,
+    "FIVE_SPAN": 5,
+}
+
 # Lookup table for moment coefficients and x-positions
 # M = coefficient * w * L^2
 # x_position: location where max moment occurs
+# The coefficients are the equal-span special case of ContinuousBeam (verified in moment_data_verification.py)
 MOMENT_DATA: Dict[str, Dict[str, Dict[str, float]]] = {
     "CANTILEVER": {
         "MAX_POS_MOMENT": {
@@ -0,0 +1,163 @@
+import numpy as np
+from numpy.typing import ArrayLike
+from scipy.linalg import solve_banded
+
+
+class ContinuousBeam:
+    r"""
+    Linear-elastic continuous beam on pinned supports with any number of spans, solved with the
+    three-moment equations (tridiagonal system, O(n_spans)).
+
+    Spans may have different lengths and bending stiffnesses (constant within a span).
+
+    Position system (normalised, same as MOMENT_DATA):
+    - x = 0 at first (outer) support
+    - x = 1 at next support
+    - x = 2 at next support, etc.
+
+    #   |-> x
+    #   0      0.5      1      1.5      2
+    #
+    #   ====================================|...
+    #  /_\             /_\             /_\
+
+    Sign convention: sagging moments positive, hogging (support) moments negative,
+    shear positive when the left part is pushed upwards. Units are consistent with the input
+    (e.g. spans in m and loads in kN/m give kNm and kN).
+    """
+
+    def __init__(self, spans: ArrayLike, EI: ArrayLike = 1.0):
+        """
+        :param spans: Span lengths, one per span
+        :param EI: Bending stiffness per span (scalar for equal stiffness), only ratios matter
+        """
+        self.spans = np.atleast_1d(np.asarray(spans, dtype=float))
+        self.EI = np.broadcast_to(np.asarray(EI, dtype=float), self.spans.shape).copy()
+
+        if self.spans.ndim != 1 or len(self.spans) == 0:
+            raise ValueError("spans must be a non-empty one-dimensional sequence")
+        if np.any(self.spans <= 0) or np.any(self.EI <= 0):
+            raise ValueError("Span lengths and stiffnesses must be positive")
+
+        self._flexibility = self.spans / self.EI
+        self._ab = self._banded_matrix()
+
+    @property
+    def n_spans(self) -> int:
+        return len(self.spans)
+
+    def _banded_matrix(self) -> np.ndarray:
+        """
+        Returns the three-moment equation matrix of the interior supports in banded storage (3, n_spans - 1)
+        """
+        f = self._flexibility
+        n = self.n_spans - 1
+        ab = np.zeros((3, max(n, 0)))
+        if n > 0:
+            ab[0, 1:] = f[1:-1]                 # upper diagonal
+            ab[1, :] = 2 * (f[:-1] + f[1:])     # diagonal
+            ab[2, :-1] = f[1:-1]                # lower diagonal
+        return ab
+
+    def _support_moments_from_terms(self, phi_left: np.ndarray, phi_right: np.ndarray) -> np.ndarray:
+        """
+        Solves the three-moment equations for the given span load terms.
+
+        phi_left[j] / phi_right[j] is the load term 6 * A * x_bar / L of span j with respect to its left / right
+        support, shape (n_spans,) or (n_spans, k) for k load cases.
+
+        :return: Support moments, shape (n_spans + 1,) or (n_spans + 1, k), zero at the outer supports
+        """
+        shape = (self.n_spans + 1,) + phi_left.shape[1:]
+        moments = np.zeros(shape)
+
+        if self.n_spans > 1:
+            EI = self.EI.reshape((-1,) + (1,) * (phi_left.ndim - 1))
+            rhs = -(phi_right[:-1] / EI[:-1] + phi_left[1:] / EI[1:])
+            moments[1:-1] = solve_banded((1, 1), self._ab, rhs)
+
+        return moments
+
+    def _uniform_loads(self, w: ArrayLike) -> np.ndarray:
+        """
+        Returns the uniform loads per span, shape (n_spans,) or (n_spans, k)
+        """
+        w = np.asarray(w, dtype=float)
+        if w.ndim == 0:
+            return np.full(self.n_spans, float(w))
+        if w.shape[0] != self.n_spans:
+            raise ValueError(f"Expected {self.n_spans} span loads, received {w.shape[0]}")
+        return w
+
+    def _locate(self, x: ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns span index and local coordinate xi ∈ [0 ; 1] for normalised positions x
+        """
+        x = np.asarray(x, dtype=float)
+        if np.any(x < 0) or np.any(x > self.n_spans):
+            raise ValueError(f"Positions must be between 0 and {self.n_spans}.")
+        span = np.clip(np.floor(x).astype(int), 0, self.n_spans - 1)
+        return span, x - span
+
+    def support_moments(self, w: ArrayLike) -> np.ndarray:
+        """
+        Returns the support moments for uniform loads w (scalar, per span (n_spans,) or load cases (n_spans, k))
+        """
+        w = self._uniform_loads(w)
+        L = self.spans.reshape((-1,) + (1,) * (w.ndim - 1))
+        phi = w * L ** 3 / 4
+        return self._support_moments_from_terms(phi, phi)
+
+    def moments(self, x: ArrayLike, w: ArrayLike) -> np.ndarray:
+        """
+        Returns the bending moments at the normalised positions x for uniform loads w.
+
+        :return: Array of shape x.shape (+ (k,) for k load cases)
+        """
+        w = self._uniform_loads(w)
+        span, xi = self._locate(x)
+        Ms = self.support_moments(w)
+
+        extra = (slice(None),) * (w.ndim - 1)
+        expand = (...,) + (None,) * (w.ndim - 1)
+        L = self.spans[span][expand]
+        xi = xi[expand]
+
+        M_free = w[(span,) + extra] * L ** 2 * xi * (1 - xi) / 2
+        return M_free + Ms[(span,) + extra] * (1 - xi) + Ms[(span + 1,) + extra] * xi
+
+    def shears(self, x: ArrayLike, w: ArrayLike) -> np.ndarray:
+        """
+        Returns the shear forces at the normalised positions x for uniform loads w.
+        At an interior support the value just right of the support is returned.
+
+        :return: Array of shape x.shape (+ (k,) for k load cases)
+        """
+        w = self._uniform_loads(w)
+        span, xi = self._locate(x)
+        Ms = self.support_moments(w)
+
+        extra = (slice(None),) * (w.ndim - 1)
+        expand = (...,) + (None,) * (w.ndim - 1)
+        L = self.spans[span][expand]
+        xi = xi[expand]
+
+        V_free = w[(span,) + extra] * L * (0.5 - xi)
+        return V_free + (Ms[(span + 1,) + extra] - Ms[(span,) + extra]) / L
+
+    def reactions(self, w: ArrayLike) -> np.ndarray:
+        """
+        Returns the support reactions (positive upwards) for uniform loads w, shape (n_spans + 1,) (+ (k,))
+        """
+        w = self._uniform_loads(w)
+        Ms = self.support_moments(w)
+        L = self.spans.reshape((-1,) + (1,) * (w.ndim - 1))
+
+        dM = (Ms[1:] - Ms[:-1]) / L
+        V_left = w * L / 2 + dM      # shear at the left end of each span
+        V_right = -w * L / 2 + dM    # shear at the right end of each span
+
+        R = np.zeros_like(Ms)
+        R[:-1] += V_left
+        R[1:] -= V_right
+        return R
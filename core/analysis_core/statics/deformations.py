@@ -1 +1,158 @@
-#TODO
\ No newline at end of file
+from typing import Dict, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from slab_construction.slab_construction import SlabConstruction
+from slab_construction.slabs.one_way_slab import OneWaySlab
+from . import MAX_X_POSITIONS
+from .internal_forces import InternalForces
+from ..loads import Loads
+from ..moment_curvature_table import get_station_table
+from ...unit_core import m_to_mm, mm_to_m
+
+
+def _cumulative_trapezoid(y: np.ndarray, X: np.ndarray) -> np.ndarray:
+    """
+    Cumulative trapezoidal integral of y over X along the last axis, starting at 0
+    """
+    steps = (y[..., 1:] + y[..., :-1]) / 2 * np.diff(X)
+    return np.concatenate((np.zeros(y.shape[:-1] + (1,)), np.cumsum(steps, axis=-1)), axis=-1)
+
+
+class Deformations:
+    """
+    Utility class (not instantiable) providing methods to compute deflections of one-way slabs from the
+    nonlinear moment-curvature relation of their sections.
+
+    The moments are those of the linear-elastic analysis (InternalForces, no redistribution); the
+    curvature at each station follows from the cached moment-curvature table of the section at that
+    station (get_station_table) and is integrated twice along the span.
+
+    Position system:
+    - x = 0 at first (outer) support
+    - x = 1 at next support
+    - x = 2 at next support, etc.
+    """
+
+    @staticmethod
+    def stations(system: str = "SIMPLE_BEAM", stations_per_span: int = 21) -> np.ndarray:
+        """
+        Returns the normalised station grid of a system, stations_per_span equally spaced stations per span
+        (support stations shared by neighbouring spans)
+        """
+        system = system.strip().upper()
+
+        if system not in MAX_X_POSITIONS:
+            raise ValueError(
+                f"Invalid system '{system}'. Must be one of: {list(MAX_X_POSITIONS.keys())}"
+            )
+        if stations_per_span < 3:
+            raise ValueError("stations_per_span must be at least 3")
+
+        n_spans = int(MAX_X_POSITIONS[system])
+        return np.linspace(0.0, n_spans, n_spans * (stations_per_span - 1) + 1)
+
+    @staticmethod
+    def calculate_curvature(
+            slab: OneWaySlab,
+            x: np.ndarray,
+            moment: ArrayLike,
+            n: float = 0.0
+    ) -> np.ndarray:
+        """
+        Curvature at the stations x for the given moments
+
+        :param slab: One-way slab
+        :param x: Normalised station positions, shape (n_x,)
+        :param moment: Moments in kNm (sagging positive), shape (..., n_x), e.g. one row per load level
+        :param n: Axial force in N
+        :return: Curvatures in 1/m, same shape as moment (NaN beyond the moment capacity)
+        """
+        moment = np.asarray(moment, dtype=float)
+        kappa = np.empty_like(moment)
+
+        # equal spans: stations with the same position within their span share one curve
+        xi = np.where(x == np.floor(x), np.minimum(x, 1.0), x - np.floor(x))
+        for j, xi_j in enumerate(xi):
+            table = get_station_table(slab, xi_j, n)
+            # the hogging branch is only needed below the moment at zero curvature
+            if np.any(moment[..., j] < table.moments[0]):
+                table = get_station_table(slab, xi_j, n, hogging=True)
+            kappa[..., j] = table.curvature(moment[..., j])
+
+        return kappa
+
+    @staticmethod
+    def calculate_deflection(
+            slab_construction: SlabConstruction,
+            loads: Loads,
+            system: str = "SIMPLE_BEAM",
+            combination: str = "QUASI-PERMANENT",
+            load_factors: Optional[ArrayLike] = None,
+            n: float = 0.0,
+            stations_per_span: int = 21
+    ) -> Dict[str, np.ndarray]:
+        """
+        Deflection line of the slab under the uniform load of the combination on all spans
+
+        :param slab_construction: Slab construction object
+        :param loads: Loads object
+        :param system: Structural system type
+        :param combination: Load combination type
+        :param load_factors: Optional factors on the combination load, shape (k,), for a load-deflection curve.
+                             All load levels reuse the same station curves.
+        :param n: Axial force in N
+        :param stations_per_span: Number of integration stations per span
+        :return: Dictionary with 'x' (stations), 'moment' [kNm], 'curvature' [1/m] and 'deflection' [mm,
+                 downwards positive], shape (n_x,) or (k, n_x) for load factors
+        """
+        system = system.strip().upper()
+        slab = slab_construction.slab
+
+        x = Deformations.stations(system, stations_per_span)
+        moment = InternalForces.calculate_moment_diagram(slab_construction, loads, x, system, combination)
+        if load_factors is not None:
+            moment = np.asarray(load_factors, dtype=float)[:, None] * moment
+
+        kappa = Deformations.calculate_curvature(slab, x, moment, n)
+
+        # double integration of w'' = -κ
+        X = x * mm_to_m(slab.L)
+        w = -_cumulative_trapezoid(_cumulative_trapezoid(kappa, X), X)
+
+        if system != "CANTILEVER":
+            # w = 0 at both supports of every span: subtract the chord of each span
+            span = np.minimum(np.floor(x), MAX_X_POSITIONS[system] - 1).astype(int)
+            left, right = span * (stations_per_span - 1), (span + 1) * (stations_per_span - 1)
+            t = x - span
+            w = w - (w[..., left] * (1 - t) + w[..., right] * t)
+
+        return {
+            "x": x,
+            "moment": moment,
+            "curvature": kappa,
+            "deflection": m_to_mm(w),
+        }
+
+    @staticmethod
+    def calculate_max_deflection(
+            slab_construction: SlabConstruction,
+            loads: Loads,
+            system: str = "SIMPLE_BEAM",
+            combination: str = "QUASI-PERMANENT",
+            load_factors: Optional[ArrayLike] = None,
+            n: float = 0.0,
+            stations_per_span: int = 21
+    ) -> np.ndarray | float:
+        """
+        Deflection with the largest magnitude in mm (see calculate_deflection, downwards positive, negative for
+        an upward camber of a prestressed slab), one value per load factor
+        """
+        result = Deformations.calculate_deflection(
+            slab_construction, loads, system, combination, load_factors, n, stations_per_span
+        )
+        w = result["deflection"]
+        w_max = np.take_along_axis(w, np.argmax(np.abs(w), axis=-1)[..., None], axis=-1)[..., 0]
+
+        return w_max if load_factors is not None else float(w_max)
@@ -0,0 +1,185 @@
+from functools import lru_cache
+from typing import Dict
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .continuous_beam import ContinuousBeam
+
+
+class InfluenceLines:
+    """
+    Influence lines of moment and shear at fixed sections of a continuous beam.
+
+    The influence lines are computed once for a dense grid of unit load positions (one banded solve for
+    all positions) and stored as arrays (n_sections, n_grid). Point and patch loads are then evaluated by
+    projecting them onto the grid and taking a dot product, without a new statics solve per load position.
+
+    Positions are normalised (0 at first support, 1 at second support, etc.), loads act downwards,
+    sagging moments are positive (see ContinuousBeam).
+    """
+
+    def __init__(self, beam: ContinuousBeam, sections: ArrayLike, n_points_per_span: int = 200):
+        """
+        :param beam: Continuous beam (span lengths and stiffnesses)
+        :param sections: Normalised positions of the sections of interest
+        :param n_points_per_span: Number of load grid intervals per span
+        """
+        self.beam = beam
+        self.sections = np.atleast_1d(np.asarray(sections, dtype=float))
+
+        self._offsets = np.concatenate(([0.0], np.cumsum(beam.spans)))  # physical support coordinates
+
+        # load grid in physical coordinates, sections included so that the moment kink is represented exactly
+        grid = np.concatenate([
+            np.linspace(self._offsets[k], self._offsets[k + 1], n_points_per_span + 1) for k in range(beam.n_spans)
+        ] + [self._physical(self.sections)])
+        self.grid = np.unique(grid)
+
+        self._section_span, _ = beam._locate(self.sections)
+        self.moment, self.shear = self._compute()
+
+        for array in (self.grid, self.moment, self.shear):
+            array.flags.writeable = False
+
+    def _physical(self, x: ArrayLike) -> np.ndarray:
+        """
+        Returns physical coordinates for normalised positions
+        """
+        span, xi = self.beam._locate(x)
+        return self._offsets[span] + xi * self.beam.spans[span]
+
+    def _locate_physical(self, X: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns span index and distance from the left support of the span for physical coordinates
+        """
+        span = np.clip(np.searchsorted(self._offsets, X, side="right") - 1, 0, self.beam.n_spans - 1)
+        return span, X - self._offsets[span]
+
+    def _compute(self) -> tuple[np.ndarray, np.ndarray]:
+        beam = self.beam
+        load_span, a = self._locate_physical(self.grid)
+        L_load = beam.spans[load_span]
+        b = L_load - a
+
+        # three-moment load terms of a unit point load, all grid positions as separate load cases
+        phi_left = np.zeros((beam.n_spans, len(self.grid)))
+        phi_right = np.zeros_like(phi_left)
+        cols = np.arange(len(self.grid))
+        phi_left[load_span, cols] = b * (L_load ** 2 - b ** 2) / L_load
+        phi_right[load_span, cols] = a * (L_load ** 2 - a ** 2) / L_load
+
+        Ms = beam._support_moments_from_terms(phi_left, phi_right)      # (n_spans + 1, n_grid)
+
+        i = self._section_span[:, None]                                  # (n_sections, 1)
+        L = beam.spans[i]
+        c = self._physical(self.sections)[:, None] - self._offsets[i]    # distance of section from its left support
+        xi = c / L
+
+        same_span = load_span[None, :] == i
+        a_ = a[None, :]
+        M_free = np.where(c <= a_, (L - a_) * c / L, a_ * (L - c) / L)
+        moment = np.where(same_span, M_free, 0.0) + Ms[i, :][:, 0] * (1 - xi) + Ms[i + 1, :][:, 0] * xi
+
+        # the shear influence line jumps by 1 at the section; adding 1 for all load positions left of the section
+        # gives a continuous line that interpolates accurately, the step is subtracted again in the evaluation
+        V_free = np.where(c <= a_, (L - a_) / L, -a_ / L)
+        shear = np.where(same_span, V_free, 0.0) + (Ms[i + 1, :][:, 0] - Ms[i, :][:, 0]) / L
+        shear = shear + (self.grid[None, :] < self._physical(self.sections)[:, None])
+
+        return moment, shear
+
+    # -----------------------------------------------------------------------
+    # Evaluation
+    # -----------------------------------------------------------------------
+
+    def _step(self, X: np.ndarray) -> np.ndarray:
+        """
+        Shear step of unit loads at physical positions X: -1 where the load lies left of the section.
+        Returns (n_sections, n_loads).
+        """
+        return -(X[None, :] < self._physical(self.sections)[:, None]).astype(float)
+
+    def point_loads(self, positions: ArrayLike, forces: ArrayLike) -> Dict[str, np.ndarray]:
+        """
+        Moments and shears at the sections due to point loads
+
+        :param positions: Normalised load positions, shape (n_loads,)
+        :param forces: Load values (downwards), shape (n_loads,) or (n_loads, k) for k load sets
+        :return: Dictionary with 'moment' and 'shear', shape (n_sections,) or (n_sections, k)
+        """
+        X = self._physical(np.atleast_1d(positions))
+        forces = np.asarray(forces, dtype=float)
+        F = forces.reshape(len(X), -1)
+
+        # project the loads linearly onto the two neighbouring grid points
+        k = np.clip(np.searchsorted(self.grid, X, side="right") - 1, 0, len(self.grid) - 2)
+        t = (X - self.grid[k]) / (self.grid[k + 1] - self.grid[k])
+        G = np.zeros((len(self.grid), F.shape[1]))
+        np.add.at(G, k, (1 - t)[:, None] * F)
+        np.add.at(G, k + 1, t[:, None] * F)
+
+        moment = self.moment @ G
+        shear = self.shear @ G + self._step(X) @ F
+
+        if forces.ndim <= 1:
+            return {"moment": moment[:, 0], "shear": shear[:, 0]}
+        return {"moment": moment, "shear": shear}
+
+    def patch_loads(self, starts: ArrayLike, ends: ArrayLike, intensities: ArrayLike) -> Dict[str, np.ndarray]:
+        """
+        Moments and shears at the sections due to uniform patch loads
+
+        :param starts: Normalised start positions, shape (n_loads,)
+        :param ends: Normalised end positions, shape (n_loads,)
+        :param intensities: Load intensities (downwards, per unit length), shape (n_loads,) or (n_loads, k)
+        :return: Dictionary with 'moment' and 'shear', shape (n_sections,) or (n_sections, k)
+        """
+        X1 = self._physical(np.atleast_1d(starts))
+        X2 = self._physical(np.atleast_1d(ends))
+        X1, X2 = np.minimum(X1, X2), np.maximum(X1, X2)
+        intensities = np.asarray(intensities, dtype=float)
+        q = intensities.reshape(len(X1), -1)
+
+        # exact integral of the piecewise linear influence line: equivalent nodal loads of every grid segment
+        g0, g1 = self.grid[:-1, None], self.grid[1:, None]
+        h = g1 - g0
+        u = np.clip(X1[None, :], g0, g1)
+        v = np.clip(X2[None, :], g0, g1)
+        w_right = ((v - g0) ** 2 - (u - g0) ** 2) / (2 * h)          # (n_seg, n_loads)
+        w_left = (v - u) - w_right
+
+        G = np.zeros((len(self.grid), q.shape[1]))
+        G[:-1] += w_left @ q
+        G[1:] += w_right @ q
+
+        # shear step: loaded length left of the section
+        X_section = self._physical(self.sections)[:, None]
+        step = -np.clip(np.minimum(X2[None, :], X_section) - X1[None, :], 0.0, None)
+
+        moment = self.moment @ G
+        shear = self.shear @ G + step @ q
+
+        if intensities.ndim <= 1:
+            return {"moment": moment[:, 0], "shear": shear[:, 0]}
+        return {"moment": moment, "shear": shear}
+
+
+@lru_cache(maxsize=64)
+def _cached_influence_lines(spans: tuple, EI: tuple, sections: tuple, n_points_per_span: int) -> InfluenceLines:
+    return InfluenceLines(ContinuousBeam(spans, EI), sections, n_points_per_span)
+
+
+def get_influence_lines(spans: ArrayLike, sections: ArrayLike, EI: ArrayLike = 1.0,
+                        n_points_per_span: int = 200) -> InfluenceLines:
+    """
+    Returns the (cached) influence lines for a span and stiffness layout and a set of sections.
+    Repeated calls with the same layout reuse the arrays computed by the first call.
+    """
+    spans = np.atleast_1d(np.asarray(spans, dtype=float))
+    EI = np.broadcast_to(np.asarray(EI, dtype=float), spans.shape)
+    sections = np.atleast_1d(np.asarray(sections, dtype=float))
+
+    return _cached_influence_lines(
+        tuple(spans.tolist()), tuple(EI.tolist()), tuple(sections.tolist()), int(n_points_per_span)
+    )
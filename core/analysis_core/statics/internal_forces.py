@@ -1,10 +1,18 @@
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike
 
 from slab_construction.slab_construction import SlabConstruction
-from . import MOMENT_DATA, MAX_X_POSITIONS  # Relative import from the package
+from . import MOMENT_DATA, MAX_X_POSITIONS, NUMBER_OF_SPANS  # Relative import from the package
+from .continuous_beam import ContinuousBeam
 from ..loads import Loads
 from ...unit_core import *
 
+# Largest load effect matrix (stations x combinations x patterns) formed when enveloping all patterns explicitly
+MAX_ENVELOPE_ENTRIES: int = 2 ** 22
+
 
 class InternalForces:
     """
@@ -36,22 +44,36 @@ class InternalForces:
         width = mm_to_m(slab_construction.slab.B)
 
         # for easier user behavior: accepts "FUNDAMENTAL", "fundamental" or "  Fundamental  "
-        combination = combination.strip().upper()
+        combination = loads.normalize_combination(combination)
 
         if combination == "FUNDAMENTAL":
             w = loads.fundamental_combination(slab_construction)  # kN/m2
+        elif combination == "CHARACTERISTIC":
+            w = loads.characteristic_combination(slab_construction)  # kN/m2
         elif combination == "FREQUENT":
             w = loads.frequent_combination(slab_construction)  # kN/m2
-        elif combination in ("QUASI-PERMANENT", "QUASI_PERMANENT", "QUASI PERMANENT"):
-            w = loads.quasi_permanent_combination(slab_construction)  # kN/m2
         else:
-            raise ValueError(
-                "Invalid combination. Must be one of: 'FUNDAMENTAL', 'FREQUENT', 'QUASI-PERMANENT'."
-            )
+            w = loads.quasi_permanent_combination(slab_construction)  # kN/m2
 
         # Convert surface load [kN/m2] to line load [kN/m] using slab width
         return w * width
 
+    @staticmethod
+    def _calculate_line_load_parts(
+            slab_construction: SlabConstruction,
+            loads: Loads,
+            combination: str = "FUNDAMENTAL"
+    ) -> tuple[float, float]:
+        """
+        Helper method to calculate the permanent and variable line load from surface loads
+
+        :return: (permanent, variable) line load in kN/m
+        """
+        width = mm_to_m(slab_construction.slab.B)
+        g, q = loads.combination_parts(slab_construction, combination)  # kN/m2
+
+        return g * width, q * width
+
     @staticmethod
     def validate_x_position(system: str, x_position: float) -> None:
         """
@@ -137,4 +159,235 @@ class InternalForces:
         # Calculate moment: M = coefficient * w * L^2
         moment = coefficient * w_line * span ** 2
 
-        return moment
\ No newline at end of file
+        return moment
+
+    @staticmethod
+    def get_continuous_beam(system: str, span: float, EI: ArrayLike = 1.0) -> ContinuousBeam:
+        """
+        Returns the equal-span continuous beam of a structural system
+
+        :param system: Structural system type (SIMPLE_BEAM ... FIVE_SPAN)
+        :param span: Span length in m
+        :param EI: Bending stiffness per span (scalar for equal stiffness)
+        :return: ContinuousBeam
+        """
+        system = system.strip().upper()
+
+        if system not in NUMBER_OF_SPANS:
+            raise ValueError(
+                f"Invalid system '{system}'. Must be one of: {list(NUMBER_OF_SPANS.keys())}"
+            )
+
+        return ContinuousBeam([span] * NUMBER_OF_SPANS[system], EI)
+
+    @staticmethod
+    def calculate_continuous_beam(
+            slab_construction: SlabConstruction,
+            loads: Loads,
+            x: ArrayLike,
+            spans: int | Sequence[float],
+            EI: ArrayLike = 1.0,
+            combination: str = "FUNDAMENTAL"
+    ) -> Dict[str, np.ndarray]:
+        """
+        Internal forces of a continuous beam with any number of (unequal) spans under the uniform line load
+        of the given combination on all spans
+
+        :param slab_construction: Slab construction object
+        :param loads: Loads object
+        :param x: Normalised positions (0 at first support, 1 at second support, etc.)
+        :param spans: Number of equal spans of length slab.L, or the span lengths in m
+        :param EI: Bending stiffness per span (scalar for equal stiffness)
+        :param combination: Load combination type
+        :return: Dictionary with 'moment' [kNm] and 'shear' [kN] at x and 'reactions' [kN] at the supports
+        """
+        if isinstance(spans, (int, np.integer)):
+            spans = [mm_to_m(slab_construction.slab.L)] * int(spans)
+
+        beam = ContinuousBeam(spans, EI)
+        w_line = InternalForces._calculate_line_load(slab_construction, loads, combination)
+
+        return {
+            "moment": beam.moments(x, w_line),
+            "shear": beam.shears(x, w_line),
+            "reactions": beam.reactions(w_line),
+        }
+
+    @staticmethod
+    def load_patterns(n_spans: int) -> np.ndarray:
+        """
+        Returns all 2^n_spans live load patterns as 0/1 matrix (2^n_spans, n_spans),
+        row p has the variable load on span j if bit j of p is set
+        """
+        return ((np.arange(2 ** n_spans)[:, None] >> np.arange(n_spans)[None, :]) & 1).astype(float)
+
+    @staticmethod
+    def calculate_envelope(
+            slab_construction: SlabConstruction,
+            loads: Loads,
+            x: ArrayLike,
+            spans: int | Sequence[float],
+            EI: ArrayLike = 1.0,
+            combinations: Sequence[str] = ("FUNDAMENTAL",),
+            max_patterns: int = 2 ** 6,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Moment and shear envelopes for pattern loading (EC0): the permanent load acts on all spans, the
+        variable load of each combination on every subset of spans.
+
+        The unit load case of each span is solved once; all patterns and combinations are then assembled
+        as one matrix product of the unit-case results with the (span x case) load matrix.
+
+        :param slab_construction: Slab construction object
+        :param loads: Loads object
+        :param x: Normalised positions (0 at first support, 1 at second support, etc.)
+        :param spans: Number of equal spans of length slab.L, or the span lengths in m
+        :param EI: Bending stiffness per span (scalar for equal stiffness)
+        :param combinations: Load combination types to envelope
+        :param max_patterns: Above this number of patterns (2^n_spans), or if the effects of all patterns at all
+                             stations would exceed MAX_ENVELOPE_ENTRIES values, only the governing pattern of each
+                             station is formed, which gives the same envelope (the effects are linear in the span loads)
+        :return: Dictionary with 'moment_max', 'moment_min' [kNm], 'shear_max', 'shear_min' [kN] at x and the
+                 governing 'combination' and 'pattern' indices for each of them (keys '<envelope>_combination',
+                 '<envelope>_pattern', pattern bits as in load_patterns)
+        """
+        if isinstance(spans, (int, np.integer)):
+            spans = [mm_to_m(slab_construction.slab.L)] * int(spans)
+
+        beam = ContinuousBeam(spans, EI)
+        n = beam.n_spans
+        x = np.asarray(x, dtype=float)
+
+        # unit load case per span, (n_x, n_spans)
+        unit = np.eye(n)
+        unit_effects = {"moment": beam.moments(x, unit), "shear": beam.shears(x, unit)}
+
+        parts = np.array([
+            InternalForces._calculate_line_load_parts(slab_construction, loads, c) for c in combinations
+        ])  # (n_combinations, 2)
+
+        result: Dict[str, np.ndarray] = {}
+        explicit = 2 ** n <= max_patterns and x.size * len(parts) * 2 ** n <= MAX_ENVELOPE_ENTRIES
+
+        for effect, U in unit_effects.items():
+            if explicit:
+                patterns = InternalForces.load_patterns(n)                                    # (n_p, n)
+                # load matrix (n_spans, n_combinations * n_patterns)
+                W = (parts[:, 0, None, None] + parts[:, 1, None, None] * patterns[None, :, :]).reshape(-1, n).T
+                E = U @ W                                                                     # (n_x, n_c * n_p)
+
+                for bound, arg in (("max", np.argmax), ("min", np.argmin)):
+                    idx = arg(E, axis=-1)
+                    result[f"{effect}_{bound}"] = np.take_along_axis(E, idx[..., None], axis=-1)[..., 0]
+                    result[f"{effect}_{bound}_combination"], result[f"{effect}_{bound}_pattern"] = (
+                        np.divmod(idx, len(patterns))
+                    )
+            else:
+                bits = 2 ** np.arange(n)
+                for bound, sign in (("max", 1.0), ("min", -1.0)):
+                    # the governing pattern loads exactly the spans with a (un)favourable unit effect
+                    loaded = sign * U > 0
+                    E = parts[:, 0] * U.sum(axis=-1, keepdims=True) + parts[:, 1] * (U * loaded).sum(
+                        axis=-1, keepdims=True)                                                   # (n_x, n_c)
+                    c = np.argmax(sign * E, axis=-1)
+                    result[f"{effect}_{bound}"] = np.take_along_axis(E, c[..., None], axis=-1)[..., 0]
+                    result[f"{effect}_{bound}_combination"] = c
+                    result[f"{effect}_{bound}_pattern"] = (loaded * bits).sum(axis=-1)
+
+        return result
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _unit_support_moments(system: str) -> np.ndarray:
+        """
+        Support moment coefficients (M / (w * L^2)) of an equal-span system, solved once per system
+        """
+        return InternalForces.get_continuous_beam(system, 1.0).support_moments(1.0)
+
+    @staticmethod
+    def _diagram(
+            slab_construction: SlabConstruction,
+            loads: Loads,
+            x: ArrayLike,
+            system: str,
+            combination: str | Sequence[str],
+            effect: str,
+    ) -> np.ndarray:
+        """
+        Helper method evaluating the moment or shear diagram at all stations in one broadcast expression
+        """
+        system = system.strip().upper()
+        x = np.asarray(x, dtype=float)
+
+        if system not in MAX_X_POSITIONS:
+            raise ValueError(
+                f"Invalid system '{system}'. Must be one of: {list(MAX_X_POSITIONS.keys())}"
+            )
+        max_x = MAX_X_POSITIONS[system]
+        if np.any(x < 0) or np.any(x > max_x):
+            raise ValueError(
+                f"Invalid x-positions for system '{system}'. Must be between 0 and {max_x}."
+            )
+
+        span = mm_to_m(slab_construction.slab.L)
+        if isinstance(combination, str):
+            w = InternalForces._calculate_line_load(slab_construction, loads, combination)
+        else:
+            w = np.array([
+                InternalForces._calculate_line_load(slab_construction, loads, c) for c in combination
+            ]).reshape((-1,) + (1,) * x.ndim)
+
+        if system == "CANTILEVER":
+            # fixed at x = 0, free end at x = 1
+            if effect == "moment":
+                return -w * span ** 2 * (1 - x) ** 2 / 2
+            return w * span * (1 - x)
+
+        c = InternalForces._unit_support_moments(system)
+        i = np.clip(np.floor(x).astype(int), 0, NUMBER_OF_SPANS[system] - 1)
+        xi = x - i
+
+        if effect == "moment":
+            return w * span ** 2 * (xi * (1 - xi) / 2 + c[i] * (1 - xi) + c[i + 1] * xi)
+        return w * span * ((0.5 - xi) + (c[i + 1] - c[i]))
+
+    @staticmethod
+    def calculate_moment_diagram(
+            slab_construction: SlabConstruction,
+            loads: Loads,
+            x: ArrayLike,
+            system: str = "SIMPLE_BEAM",
+            combination: str | Sequence[str] = "FUNDAMENTAL"
+    ) -> np.ndarray:
+        """
+        Moment diagram M(x) for any system under the uniform load of the combination on all spans
+
+        :param slab_construction: Slab construction object
+        :param loads: Loads object
+        :param x: Array of normalised positions (0 at first support, 1 at second support, etc.)
+        :param system: Structural system type
+        :param combination: Load combination type, or a sequence of them
+        :return: Moments in kNm, shape x.shape (or (n_combinations, *x.shape) for a sequence of combinations)
+        """
+        return InternalForces._diagram(slab_construction, loads, x, system, combination, "moment")
+
+    @staticmethod
+    def calculate_shear_diagram(
+            slab_construction: SlabConstruction,
+            loads: Loads,
+            x: ArrayLike,
+            system: str = "SIMPLE_BEAM",
+            combination: str | Sequence[str] = "FUNDAMENTAL"
+    ) -> np.ndarray:
+        """
+        Shear diagram V(x) for any system under the uniform load of the combination on all spans.
+        At an interior support the value just right of the support is returned.
+
+        :param slab_construction: Slab construction object
+        :param loads: Loads object
+        :param x: Array of normalised positions (0 at first support, 1 at second support, etc.)
+        :param system: Structural system type
+        :param combination: Load combination type, or a sequence of them
+        :return: Shear forces in kN, shape x.shape (or (n_combinations, *x.shape) for a sequence of combinations)
+        """
+        return InternalForces._diagram(slab_construction, loads, x, system, combination, "shear")
@@ -0,0 +1,396 @@
+from typing import Callable, Dict, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+from scipy.linalg import solve_banded
+
+from slab_construction.slab_construction import SlabConstruction
+from slab_construction.slabs.one_way_slab import OneWaySlab
+from . import NUMBER_OF_SPANS
+from .internal_forces import InternalForces
+from ..loads import Loads
+from ..moment_curvature_table import MomentCurvatureTable, get_station_table
+from ...unit_core import m_to_mm, mm_to_m
+
+# Two-point Gauss rule on [0 ; 1]
+_GAUSS_XI = np.array([0.5 - 0.5 / np.sqrt(3), 0.5 + 0.5 / np.sqrt(3)])
+_GAUSS_WEIGHTS = np.array([0.5, 0.5])
+
+# Half bandwidth of the stiffness matrix (nodal dofs w, θ; an element couples 4 consecutive dofs)
+BANDWIDTH = 3
+
+
+class NonlinearBeam:
+    r"""
+    Continuous beam on pinned supports with nonlinear bending stiffness from section moment-curvature tables,
+    solved with Newton-Raphson on a finite-element discretisation (cubic Hermite beam elements, dofs w and θ
+    per node, two Gauss points per element).
+
+    The moment-curvature relation of each Gauss point is interpolated linearly between the two neighbouring
+    stations of its span (stations_per_span equally spaced stations, same stations in every span). The tangent
+    stiffness matrix is banded and solved with a banded solver, O(n_elements) per iteration.
+
+    Position system (normalised, same as ContinuousBeam):
+    - x = 0 at first (outer) support
+    - x = 1 at next support
+    - x = 2 at next support, etc.
+
+    Sign convention: loads and deflections downwards positive, sagging moments and curvatures positive.
+    Units: spans in m, loads in kN/m, moments in kNm, curvatures in 1/m.
+    """
+
+    def __init__(
+            self,
+            spans: ArrayLike,
+            table_at: Callable[[float, bool], MomentCurvatureTable],
+            elements_per_span: int = 40,
+            stations_per_span: int = 11,
+    ):
+        """
+        :param spans: Span lengths in m
+        :param table_at: Returns the moment-curvature table at a station xi ∈ [0 ; 1] of a span, with the hogging
+                         branch if the second argument is True (e.g. get_station_table of a slab)
+        :param elements_per_span: Number of beam elements per span
+        :param stations_per_span: Number of stations with a moment-curvature table per span
+        """
+        self.spans = np.atleast_1d(np.asarray(spans, dtype=float))
+        if self.spans.ndim != 1 or len(self.spans) == 0 or np.any(self.spans <= 0):
+            raise ValueError("spans must be a non-empty sequence of positive lengths")
+        if elements_per_span < 1 or stations_per_span < 2:
+            raise ValueError("At least one element and two stations per span are required")
+
+        self.table_at = table_at
+        self.elements_per_span = elements_per_span
+        self.stations = np.linspace(0.0, 1.0, stations_per_span)
+        self._tables: list[Optional[MomentCurvatureTable]] = [None] * stations_per_span
+        self._hogging = np.zeros(stations_per_span, dtype=bool)
+
+        n_spans = len(self.spans)
+        self.n_elements = n_spans * elements_per_span
+        self.n_nodes = self.n_elements + 1
+        self.n_dofs = 2 * self.n_nodes
+
+        # element geometry
+        self._element_span = np.repeat(np.arange(n_spans), elements_per_span)
+        self._h = self.spans[self._element_span] / elements_per_span
+        self.x = np.concatenate(([0.0], np.arange(1, self.n_elements + 1) / elements_per_span))  # node positions
+        self.X = np.concatenate(([0.0], np.cumsum(self._h)))                                      # physical [m]
+
+        # Gauss points: position within the span and interpolation between stations
+        local = (np.arange(self.n_elements) % elements_per_span)[:, None] + _GAUSS_XI[None, :]
+        xi_gauss = local / elements_per_span                                               # (n_elements, 2)
+        s = np.clip(np.searchsorted(self.stations, xi_gauss, side="right") - 1, 0, stations_per_span - 2)
+        self._station = s
+        self._t = (xi_gauss - self.stations[s]) / (self.stations[s + 1] - self.stations[s])
+
+        # curvature-displacement matrices of the Gauss points, κ = B @ d_e (n_elements, 2, 4)
+        h = self._h[:, None]
+        g = _GAUSS_XI[None, :]
+        self._B = -np.stack((
+            (-6 + 12 * g) / h ** 2,
+            (-4 + 6 * g) / h,
+            (6 - 12 * g) / h ** 2,
+            (-2 + 6 * g) / h,
+        ), axis=-1)
+        self._dofs = 2 * np.arange(self.n_elements)[:, None] + np.arange(4)[None, :]        # (n_elements, 4)
+
+        # pinned supports: w = 0 at every support node
+        self.support_nodes = np.arange(n_spans + 1) * elements_per_span
+        self.fixed_dofs = 2 * self.support_nodes
+
+    @classmethod
+    def from_slab(
+            cls,
+            slab: OneWaySlab,
+            n_spans: int,
+            n: float = 0.0,
+            elements_per_span: int = 40,
+            stations_per_span: int = 11,
+    ) -> "NonlinearBeam":
+        """
+        Returns the beam of n_spans equal spans of a one-way slab, using the cached station tables of the slab
+        """
+        return cls(
+            [mm_to_m(slab.L)] * n_spans,
+            lambda xi, hogging: get_station_table(slab, xi, n, hogging),
+            elements_per_span,
+            stations_per_span,
+        )
+
+    def linearized(self, offset: bool = True) -> "NonlinearBeam":
+        """
+        Returns the beam with the linear-elastic station tables (see MomentCurvatureTable.linearized): same
+        discretisation, initial stiffness of each station and, with offset, its moment at zero curvature
+        """
+        return NonlinearBeam(
+            self.spans,
+            lambda xi, hogging: self.table_at(xi, False).linearized(offset),
+            self.elements_per_span,
+            len(self.stations),
+        )
+
+    # -----------------------------------------------------------------------
+    # Section response
+    # -----------------------------------------------------------------------
+
+    def _table(self, i: int, kappa: np.ndarray) -> MomentCurvatureTable:
+        """
+        Returns the table of station i, switching to the table with hogging branch when curvatures below its
+        range occur
+        """
+        if self._tables[i] is None:
+            self._tables[i] = self.table_at(float(self.stations[i]), False)
+        if not self._hogging[i] and kappa.size and np.min(kappa) < self._tables[i].curvatures[0]:
+            self._tables[i] = self.table_at(float(self.stations[i]), True)
+            self._hogging[i] = True
+        return self._tables[i]
+
+    def section_response(self, kappa: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns moments [kNm] and tangent stiffnesses [kNm²] at the Gauss points for curvatures κ (n_elements, 2),
+        NaN beyond the curvature range of the tables
+        """
+        M = np.zeros_like(kappa)
+        EI = np.zeros_like(kappa)
+
+        for i in range(len(self.stations)):
+            for weight, mask in ((1 - self._t, self._station == i), (self._t, self._station == i - 1)):
+                if not np.any(mask):
+                    continue
+                table = self._table(i, kappa[mask])
+                M[mask] += weight[mask] * table.moment(kappa[mask])
+                EI[mask] += weight[mask] * table.tangent_stiffness(kappa[mask])
+
+        return M, EI
+
+    # -----------------------------------------------------------------------
+    # Assembly
+    # -----------------------------------------------------------------------
+
+    def load_vector(self, w: ArrayLike) -> np.ndarray:
+        """
+        Returns the consistent nodal load vector of uniform loads w [kN/m] (scalar or one value per span)
+        """
+        q = np.broadcast_to(np.asarray(w, dtype=float), self.spans.shape)[self._element_span]
+        h = self._h
+        f_e = np.stack((q * h / 2, q * h ** 2 / 12, q * h / 2, -q * h ** 2 / 12), axis=-1)
+
+        f = np.zeros(self.n_dofs)
+        np.add.at(f, self._dofs, f_e)
+        return f
+
+    def curvatures(self, d: np.ndarray) -> np.ndarray:
+        """
+        Returns the curvatures at the Gauss points (n_elements, 2) for the displacement vector d
+        """
+        return np.einsum("egk,ek->eg", self._B, d[self._dofs])
+
+    def assemble(self, d: np.ndarray) -> tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Returns the internal force vector, the tangent stiffness matrix in banded storage (7, n_dofs) for
+        solve_banded((3, 3), ...) and the Gauss point state ('curvature', 'moment', 'stiffness') for the
+        displacement vector d. Support conditions are not applied.
+        """
+        kappa = self.curvatures(d)
+        M, EI = self.section_response(kappa)
+
+        weights = _GAUSS_WEIGHTS[None, :] * self._h[:, None]                                # (n_elements, 2)
+        f_e = np.einsum("eg,egk->ek", weights * M, self._B)
+        K_e = np.einsum("eg,egi,egj->eij", weights * EI, self._B, self._B)
+
+        f = np.zeros(self.n_dofs)
+        np.add.at(f, self._dofs, f_e)
+
+        ab = np.zeros((2 * BANDWIDTH + 1, self.n_dofs))
+        rows = np.broadcast_to(self._dofs[:, :, None], K_e.shape)
+        cols = np.broadcast_to(self._dofs[:, None, :], K_e.shape)
+        np.add.at(ab, (BANDWIDTH + rows - cols, cols), K_e)
+
+        return f, ab, {"curvature": kappa, "moment": M, "stiffness": EI}
+
+    def apply_supports(self, ab: np.ndarray, r: Optional[np.ndarray] = None) -> None:
+        """
+        Applies w = 0 at the supports in place: identity rows and columns in the banded matrix, zero residual
+        """
+        for dof in self.fixed_dofs:
+            lo, hi = max(dof - BANDWIDTH, 0), min(dof + BANDWIDTH, self.n_dofs - 1)
+            j = np.arange(lo, hi + 1)
+            ab[BANDWIDTH + dof - j, j] = 0.0       # row
+            ab[BANDWIDTH + j - dof, dof] = 0.0     # column
+            ab[BANDWIDTH, dof] = 1.0
+        if r is not None:
+            r[self.fixed_dofs] = 0.0
+
+    # -----------------------------------------------------------------------
+    # Solution
+    # -----------------------------------------------------------------------
+
+    def solve(
+            self,
+            w: ArrayLike,
+            d0: Optional[np.ndarray] = None,
+            tolerance: float = 1e-8,
+            max_iterations: int = 30,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Solves the beam for uniform loads w with Newton-Raphson
+
+        :param w: Uniform loads in kN/m, scalar or one value per span
+        :param d0: Start displacement vector, e.g. the solution of a lower load level
+        :param tolerance: Convergence tolerance on the residual norm, relative to the load vector
+        :param max_iterations: Maximum number of Newton iterations
+        :return: Dictionary with the node positions 'x', 'deflection' [mm], 'moment' [kNm] at the nodes
+                 (from equilibrium with the support reactions), 'reactions' [kN], 'support_moments' [kNm],
+                 the Gauss point state ('curvature', 'gauss_moment', 'stiffness'), the displacement vector 'd',
+                 'iterations' and 'converged' (False if not converged or beyond the moment capacity)
+        """
+        f_ext = self.load_vector(w)
+        d = np.zeros(self.n_dofs) if d0 is None else np.array(d0, dtype=float)
+        scale = max(np.linalg.norm(np.delete(f_ext, self.fixed_dofs)), 1e-12)
+
+        converged = False
+        iterations = 0
+        f_int, ab, state, r = self.residual(d, f_ext)
+
+        while iterations < max_iterations and np.all(np.isfinite(r)):
+            norm = np.linalg.norm(r)
+            if norm <= tolerance * scale:
+                converged = True
+                break
+
+            delta = solve_banded((BANDWIDTH, BANDWIDTH), ab, r)
+            iterations += 1
+
+            step, (f_int, ab, state, r) = self._line_search(d, delta, r, f_ext)
+            d = d + step * delta
+
+        return self.results(d, f_int if converged else None, f_ext, w, state, iterations, converged)
+
+    def residual(self, d: np.ndarray, f_ext: np.ndarray) -> tuple:
+        """
+        Returns (f_int, ab, state, residual) at d, with the support conditions applied
+        """
+        f_int, ab, state = self.assemble(d)
+        r = f_ext - f_int
+        self.apply_supports(ab, r)
+        return f_int, ab, state, r
+
+    def _line_search(self, d: np.ndarray, delta: np.ndarray, r: np.ndarray, f_ext: np.ndarray,
+                     max_steps: int = 6) -> tuple[float, tuple]:
+        """
+        Line search on the out-of-balance energy g(s) = delta · r(d + s * delta). The tangent of the piecewise
+        linear tables changes between segments, so a full Newton step can overshoot and cycle; the step is then
+        reduced by regula falsi until |g(s)| <= 0.5 g(0). Returns the step and the trial state (f_int, ab, state, r).
+        """
+        g_0 = delta @ r
+        trial = self.residual(d + delta, f_ext)
+        g = delta @ trial[3]
+        if np.isfinite(g) and (g >= 0 or abs(g) <= 0.5 * g_0):
+            return 1.0, trial
+
+        lo, g_lo, hi, g_hi = 0.0, g_0, 1.0, g
+        step = 1.0
+        for _ in range(max_steps):
+            # bisection while the upper bound is beyond the tables (non-finite residual)
+            step = (lo + hi) / 2 if not np.isfinite(g_hi) else hi - g_hi * (hi - lo) / (g_hi - g_lo)
+            trial = self.residual(d + step * delta, f_ext)
+            g = delta @ trial[3]
+            if np.isfinite(g) and abs(g) <= 0.5 * g_0:
+                break
+            if np.isfinite(g) and g > 0:
+                lo, g_lo = step, g
+            else:
+                hi, g_hi = step, g
+
+        return step, trial
+
+    def results(
+            self,
+            d: np.ndarray,
+            f_int: Optional[np.ndarray],
+            f_ext: np.ndarray,
+            w: ArrayLike,
+            state: Dict[str, np.ndarray],
+            iterations: int,
+            converged: bool,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Collects the results of a solution (see solve), f_int is None if the solution is not in equilibrium
+        """
+        if f_int is None:
+            f_int = np.full(self.n_dofs, np.nan)
+        reactions = (f_ext - f_int)[self.fixed_dofs]
+
+        # statically admissible moment diagram from the reactions: M(X) = Σ R_i (X - X_i) - ∫ q (X - s) ds
+        q = np.broadcast_to(np.asarray(w, dtype=float), self.spans.shape)
+        X_support = self.X[self.support_nodes]
+        lever = np.clip(self.X[:, None] - X_support[None, :], 0.0, None)
+        load_lever = np.clip(self.X[:, None] - X_support[None, :-1], 0.0, None) ** 2 / 2 - \
+            np.clip(self.X[:, None] - X_support[None, 1:], 0.0, None) ** 2 / 2
+        moment = lever @ reactions - load_lever @ q
+
+        return {
+            "x": self.x,
+            "deflection": m_to_mm(d[0::2]),
+            "moment": moment,
+            "reactions": reactions,
+            "support_moments": moment[self.support_nodes],
+            "curvature": state["curvature"],
+            "gauss_moment": state["moment"],
+            "stiffness": state["stiffness"],
+            "d": d,
+            "iterations": iterations,
+            "converged": converged,
+        }
+
+
+def calculate_nonlinear_internal_forces(
+        slab_construction: SlabConstruction,
+        loads: Loads,
+        system: str = "FIVE_SPAN",
+        combination: str = "FUNDAMENTAL",
+        n: float = 0.0,
+        elements_per_span: int = 40,
+        stations_per_span: int = 11,
+) -> Dict[str, np.ndarray]:
+    """
+    Internal forces of an equal-span system with moment redistribution from the nonlinear section stiffness
+    (NonlinearBeam with the cached SLS moment-curvature tables of the slab) under the uniform load of the
+    combination on all spans
+
+    :param slab_construction: Slab construction object
+    :param loads: Loads object
+    :param system: Structural system type (SIMPLE_BEAM ... FIVE_SPAN)
+    :param combination: Load combination type
+    :param n: Axial force in N
+    :param elements_per_span: Number of beam elements per span
+    :param stations_per_span: Number of stations with a moment-curvature table per span
+    :return: Results of NonlinearBeam.solve plus the support moments [kNm] of the linear-elastic beam with the
+             initial stiffness of the tables, 'elastic_support_moments' including the secondary moments of the
+             prestress (moment at zero curvature) and 'secondary_support_moments' (their prestress part), and the
+             'redistribution' ratio of the support moments (nonlinear / elastic, NaN at the outer supports)
+    """
+    system = system.strip().upper()
+
+    if system not in NUMBER_OF_SPANS:
+        raise ValueError(
+            f"Invalid system '{system}'. Must be one of: {list(NUMBER_OF_SPANS.keys())}"
+        )
+
+    slab = slab_construction.slab
+    beam = NonlinearBeam.from_slab(slab, NUMBER_OF_SPANS[system], n, elements_per_span, stations_per_span)
+    w_line = InternalForces._calculate_line_load(slab_construction, loads, combination)
+
+    result = beam.solve(w_line)
+
+    # elastic reference with the same prestress, so that the ratio measures only the redistribution
+    elastic = beam.linearized().solve(w_line)["support_moments"]
+    primary = beam.linearized(offset=False).solve(w_line)["support_moments"]
+    # the outer support moments vanish up to round-off
+    inner = np.abs(elastic) > 1e-9 * np.max(np.abs(elastic), initial=0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result["redistribution"] = np.where(inner, result["support_moments"] / elastic, np.nan)
+    result["elastic_support_moments"] = elastic
+    result["secondary_support_moments"] = elastic - primary
+
+    return result
@@ -0,0 +1,268 @@
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+from scipy.linalg.lapack import dgbtrf, dgbtrs
+
+from core.ioh_core.snapshots import SnapshotWriter
+from slab_construction.slab_construction import SlabConstruction
+from . import NUMBER_OF_SPANS
+from .internal_forces import InternalForces
+from .nonlinear_beam import BANDWIDTH, NonlinearBeam
+from ..loads import Loads
+from ...unit_core import m_to_mm
+
+# Leading values of every snapshot record, followed by the displacement vector of the beam
+SNAPSHOT_COLUMNS: tuple[str, ...] = ("step", "load_factor", "max_deflection", "iterations")
+
+
+class Pushover:
+    """
+    Load-deflection path of a NonlinearBeam up to failure.
+
+    The permanent load is applied first, then the variable load is scaled with the load factor λ, which is
+    controlled by a cylindrical arc-length method (Crisfield), so the path can pass limit points. The corrector
+    is a modified Newton iteration: the banded tangent matrix is factorised (LAPACK gbtrf) at the start of an
+    increment and reused (gbtrs) for all iterations, it is only refactorised every refactor_every iterations.
+
+    Every converged increment is appended to a snapshot file (see SNAPSHOT_COLUMNS and read_snapshots); only
+    the load factor and maximum deflection of each increment are kept in memory.
+    """
+
+    def __init__(self, beam: NonlinearBeam, w_permanent: ArrayLike, w_variable: ArrayLike):
+        """
+        :param beam: Nonlinear beam
+        :param w_permanent: Permanent uniform load in kN/m (scalar or per span), not scaled
+        :param w_variable: Reference variable uniform load in kN/m (scalar or per span), scaled with λ
+        """
+        self.beam = beam
+        self.w_permanent = w_permanent
+        self.f_permanent = beam.load_vector(w_permanent)
+        self.f_variable = beam.load_vector(w_variable)
+        self.f_variable[beam.fixed_dofs] = 0.0
+        self.factorizations = 0
+
+        if not np.any(self.f_variable):
+            raise ValueError("The variable load must not be zero")
+
+    def _factorize(self, ab: np.ndarray) -> Optional[tuple[np.ndarray, np.ndarray]]:
+        """
+        Returns the banded LU factorisation of the tangent matrix, None if it is singular or not finite
+        """
+        if not np.all(np.isfinite(ab)):
+            return None
+        lu = np.zeros((3 * BANDWIDTH + 1, ab.shape[1]))
+        lu[BANDWIDTH:] = ab
+        lu, piv, info = dgbtrf(lu, BANDWIDTH, BANDWIDTH, overwrite_ab=1)
+        self.factorizations += 1
+        return (lu, piv) if info == 0 else None
+
+    @staticmethod
+    def _solve(factor: tuple[np.ndarray, np.ndarray], b: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Solves with the banded LU factorisation, None if LAPACK reports an error or the solution is not finite
+        """
+        x, info = dgbtrs(factor[0], BANDWIDTH, BANDWIDTH, b, factor[1])
+        return x if info == 0 and np.all(np.isfinite(x)) else None
+
+    @staticmethod
+    def _max_deflection(d: np.ndarray) -> float:
+        """
+        Nodal deflection with the largest magnitude in mm (downwards positive, negative for an upward camber)
+        """
+        w = d[0::2]
+        return float(m_to_mm(w[np.argmax(np.abs(w))]))
+
+    def _increment(
+            self,
+            d: np.ndarray,
+            load_factor: float,
+            arc_length: float,
+            previous: Optional[np.ndarray],
+            tolerance: float,
+            max_iterations: int,
+            refactor_every: int,
+    ) -> Optional[tuple[np.ndarray, float, int]]:
+        """
+        One arc-length increment from the converged state (d, λ). Returns the new state and the number of
+        iterations, None if the increment does not converge
+        """
+        beam = self.beam
+        f_int, ab, state, r = beam.residual(d, self.f_permanent + load_factor * self.f_variable)
+        factor = self._factorize(ab)
+        if factor is None:
+            return None
+
+        # predictor along the tangent, in the direction of the previous increment
+        d_q = self._solve(factor, self.f_variable)
+        if d_q is None:
+            return None
+        sign = 1.0 if previous is None else (np.sign(previous @ d_q) or 1.0)
+        delta_lambda = sign * arc_length / np.linalg.norm(d_q)
+        delta_d = delta_lambda * d_q
+
+        for iteration in range(1, max_iterations + 1):
+            f_ext = self.f_permanent + (load_factor + delta_lambda) * self.f_variable
+            f_int, ab, state, r = beam.residual(d + delta_d, f_ext)
+            if not np.all(np.isfinite(r)):
+                return None
+
+            if np.linalg.norm(r) <= tolerance * max(np.linalg.norm(f_ext), 1e-12):
+                return d + delta_d, load_factor + delta_lambda, iteration
+
+            if iteration % refactor_every == 0:
+                factor = self._factorize(ab)
+                if factor is None:
+                    return None
+
+            # both right-hand sides with the same factorisation
+            solution = self._solve(factor, np.column_stack((r, self.f_variable)))
+            if solution is None:
+                return None
+            d_r, d_q = solution[:, 0], solution[:, 1]
+
+            # cylindrical constraint |delta_d + δd|² = arc_length², smaller root closest to the previous direction
+            a = d_q @ d_q
+            b = 2 * (delta_d + d_r) @ d_q
+            c = (delta_d + d_r) @ (delta_d + d_r) - arc_length ** 2
+            disc = b ** 2 - 4 * a * c
+            if disc < 0:
+                return None
+            roots = (-b + np.array([1.0, -1.0]) * np.sqrt(disc)) / (2 * a)
+            candidates = [delta_d + d_r + root * d_q for root in roots]
+            best = int(np.argmax([candidate @ delta_d for candidate in candidates]))
+
+            delta_d = candidates[best]
+            delta_lambda += roots[best]
+
+        return None
+
+    def run(
+            self,
+            path,
+            initial_increment: float = 0.1,
+            max_load_factor: float = 50.0,
+            max_steps: int = 500,
+            tolerance: float = 1e-6,
+            max_iterations: int = 30,
+            refactor_every: int = 10,
+            target_iterations: int = 5,
+            min_arc_length_ratio: float = 1e-4,
+            post_peak_drop: float = 0.2,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Follows the load-deflection path until failure and streams the increments to path
+
+        :param path: Snapshot file (see read_snapshots, SNAPSHOT_COLUMNS)
+        :param initial_increment: Load factor increment of the first step (sets the initial arc length)
+        :param max_load_factor: Stop when λ exceeds this value
+        :param max_steps: Maximum number of increments
+        :param tolerance: Convergence tolerance on the residual norm, relative to the load vector
+        :param max_iterations: Maximum number of corrector iterations per increment
+        :param refactor_every: Refactorise the tangent matrix after this many iterations of an increment
+        :param target_iterations: The arc length is adapted to reach convergence in about this many iterations
+        :param min_arc_length_ratio: Failure when the arc length has to be cut below this fraction of the initial one
+        :param post_peak_drop: Stop when λ has dropped by this fraction below its peak (past a limit point)
+        :return: Dictionary with 'load_factor' and 'max_deflection' [mm, nodal deflection with the largest magnitude]
+                 of every increment, 'failure_load_factor' (peak λ), 'failed' (False if stopped by max_load_factor
+                 or max_steps), 'steps', 'factorizations' and the snapshot 'path'
+        """
+        beam = self.beam
+        permanent = beam.solve(self.w_permanent, tolerance=tolerance)
+        d = permanent["d"]
+        load_factor = 0.0
+
+        load_factors = [0.0]
+        deflections = [self._max_deflection(d)]
+        failed = not permanent["converged"]
+
+        with SnapshotWriter(path, len(SNAPSHOT_COLUMNS) + beam.n_dofs) as writer:
+            writer.write(np.concatenate(([0, 0.0, deflections[0], permanent["iterations"]], d)))
+
+            arc_length = None
+            previous = None
+            step = 0
+            while not failed and step < max_steps and load_factor < max_load_factor:
+                if arc_length is None:
+                    factor = self._factorize(beam.residual(d, self.f_permanent)[1])
+                    d_q = None if factor is None else self._solve(factor, self.f_variable)
+                    if d_q is None:
+                        failed = True
+                        break
+                    arc_length = initial_increment * np.linalg.norm(d_q)
+                    min_arc_length = min_arc_length_ratio * arc_length
+
+                result = self._increment(d, load_factor, arc_length, previous, tolerance, max_iterations,
+                                         refactor_every)
+                if result is None:
+                    arc_length /= 2
+                    failed = arc_length < min_arc_length
+                    continue
+
+                d_new, load_factor, iterations = result
+                previous = d_new - d
+                d = d_new
+                step += 1
+
+                w_max = self._max_deflection(d)
+                load_factors.append(load_factor)
+                deflections.append(w_max)
+                writer.write(np.concatenate(([step, load_factor, w_max, iterations], d)))
+
+                if load_factor < (1 - post_peak_drop) * max(load_factors):
+                    failed = True
+                    break
+
+                arc_length *= float(np.clip(np.sqrt(target_iterations / iterations), 0.5, 2.0))
+
+        return {
+            "load_factor": np.array(load_factors),
+            "max_deflection": np.array(deflections),
+            "failure_load_factor": max(load_factors),
+            "failed": failed,
+            "steps": len(load_factors) - 1,
+            "factorizations": self.factorizations,
+            "path": Path(path),
+        }
+
+
+def calculate_pushover(
+        slab_construction: SlabConstruction,
+        loads: Loads,
+        path,
+        system: str = "SIMPLE_BEAM",
+        combination: str = "FUNDAMENTAL",
+        n: float = 0.0,
+        elements_per_span: int = 40,
+        stations_per_span: int = 11,
+        **options,
+) -> Dict[str, np.ndarray]:
+    """
+    Pushover of an equal-span system: the permanent part of the combination acts on all spans, the variable part
+    is scaled with the load factor λ until failure (λ = 1 is the combination itself)
+
+    :param slab_construction: Slab construction object
+    :param loads: Loads object
+    :param path: Snapshot file
+    :param system: Structural system type (SIMPLE_BEAM ... FIVE_SPAN)
+    :param combination: Load combination type
+    :param n: Axial force in N
+    :param elements_per_span: Number of beam elements per span
+    :param stations_per_span: Number of stations with a moment-curvature table per span
+    :param options: Further options of Pushover.run
+    :return: Results of Pushover.run
+    """
+    system = system.strip().upper()
+
+    if system not in NUMBER_OF_SPANS:
+        raise ValueError(
+            f"Invalid system '{system}'. Must be one of: {list(NUMBER_OF_SPANS.keys())}"
+        )
+
+    beam = NonlinearBeam.from_slab(
+        slab_construction.slab, NUMBER_OF_SPANS[system], n, elements_per_span, stations_per_span
+    )
+    g, q = InternalForces._calculate_line_load_parts(slab_construction, loads, combination)
+
+    return Pushover(beam, g, q).run(path, **options)
@@ -0,0 +1,301 @@
+"""
+3D mesh export of HP shells and their tendons.
+
+The closed shell surface (top, bottom and the four edges) is generated on an nx × ny grid in plan and
+written in chunks of grid rows directly to a binary file handle, so a whole floor of slabs with millions
+of triangles is never held in memory at once.
+
+Formats:
+    - STL (binary): shell surface only, STL has no line primitive for tendons
+    - PLY (binary little endian): shell surface and tendons as edge elements
+    - OBJ (text, there is no binary OBJ): shell surface and tendons as line elements
+
+The top and bottom surfaces are offset by ± t/2 from the mid-surface along the normal in the (y, z) plane,
+the same convention as HPGeometry.polygon_section_at, so the mesh matches the analysed cross-sections.
+All coordinates are in mm.
+"""
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+import numpy as np
+
+from slab_construction.slabs.hp_slab.model.hp_geometry import HPGeometry
+
+MESH_FORMATS = ("stl", "ply", "obj")
+
+# (geometry, offset of the local origin (x, y, z) in mm)
+ShellPlacement = tuple[HPGeometry, tuple[float, float, float]]
+
+_STL_TRIANGLE = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("vertices", "<f4", (3, 3)),
+    ("attribute", "<u2"),
+])
+
+
+# ---------------------------------------------------------------------------
+# Mesh generation
+# ---------------------------------------------------------------------------
+
+def _grid_vertices(geometry: HPGeometry, xs: np.ndarray, ys: np.ndarray, offset) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns top and bottom surface vertices, each as array (len(xs), len(ys), 3)
+    """
+    a, b = geometry._a(), geometry._b()
+    X, Y = np.meshgrid(xs, ys, indexing="ij")
+    Z = Y ** 2 / b ** 2 - X ** 2 / a ** 2
+
+    # unit normal in the (y, z) plane, see HPGeometry.polygon_section_at
+    dzdy = 2 * Y / b ** 2
+    length = np.sqrt(dzdy ** 2 + 1)
+    ny, nz = -dzdy / length, 1 / length
+
+    t2 = geometry.t / 2
+    top = np.stack((X, Y + ny * t2, Z + nz * t2), axis=-1) + offset
+    bottom = np.stack((X, Y - ny * t2, Z - nz * t2), axis=-1) + offset
+    return top, bottom
+
+
+def _grid_faces(i0: int, i1: int, nx: int, ny: int, row0: int, n_rows: int) -> np.ndarray:
+    """
+    Returns the triangles (m, 3) of the closed shell surface between grid rows i0 and i1 (i1 included).
+
+    Vertex indices follow the layout [top rows row0 .. row0 + n_rows - 1, bottom rows row0 .. row0 + n_rows - 1],
+    each row holding ny vertices. All triangles are oriented with outward normals.
+    """
+    def top(i, j):
+        return (i - row0) * ny + j
+
+    def bot(i, j):
+        return n_rows * ny + (i - row0) * ny + j
+
+    def quads(v00, v10, v11, v01):
+        # two triangles per quad, counter-clockwise seen from the outward side
+        v00, v10, v11, v01 = (np.ravel(v) for v in (v00, v10, v11, v01))
+        return np.concatenate((
+            np.stack((v00, v10, v11), axis=-1),
+            np.stack((v00, v11, v01), axis=-1),
+        ))
+
+    I, J = np.meshgrid(np.arange(i0, i1), np.arange(ny - 1), indexing="ij")
+    i = np.arange(i0, i1)
+    j = np.arange(ny - 1)
+
+    faces = [
+        quads(top(I, J), top(I + 1, J), top(I + 1, J + 1), top(I, J + 1)),          # top, normal +z
+        quads(bot(I, J), bot(I, J + 1), bot(I + 1, J + 1), bot(I + 1, J)),          # bottom, normal -z
+        quads(top(i, 0), bot(i, 0), bot(i + 1, 0), top(i + 1, 0)),                  # edge y = -B/2
+        quads(top(i, ny - 1), top(i + 1, ny - 1), bot(i + 1, ny - 1), bot(i, ny - 1)),  # edge y = +B/2
+    ]
+    if i0 == 0:
+        faces.append(quads(top(0, j), top(0, j + 1), bot(0, j + 1), bot(0, j)))                  # edge x = -L/2
+    if i1 == nx - 1:
+        faces.append(quads(top(nx - 1, j), bot(nx - 1, j), bot(nx - 1, j + 1), top(nx - 1, j + 1)))  # edge x = +L/2
+
+    return np.concatenate(faces)
+
+
+def _grid_axes(geometry: HPGeometry, nx: int, ny: int) -> tuple[np.ndarray, np.ndarray]:
+    if nx < 2 or ny < 2:
+        raise ValueError("nx and ny must be at least 2")
+    return (np.linspace(-geometry.L / 2, geometry.L / 2, nx),
+            np.linspace(-geometry.B / 2, geometry.B / 2, ny))
+
+
+def _row_chunks(nx: int, chunk_rows: int) -> Iterator[tuple[int, int]]:
+    """
+    Yields quad row ranges (i0, i1) covering the grid rows 0 .. nx - 1
+    """
+    for i0 in range(0, nx - 1, chunk_rows):
+        yield i0, min(i0 + chunk_rows, nx - 1)
+
+
+def n_shell_vertices(nx: int, ny: int) -> int:
+    return 2 * nx * ny
+
+
+def n_shell_triangles(nx: int, ny: int) -> int:
+    return 4 * (nx - 1) * (ny - 1) + 4 * (nx - 1) + 4 * (ny - 1)
+
+
+def shell_triangle_chunks(geometry: HPGeometry, nx: int = 200, ny: int = 60, chunk_rows: int = 64,
+                          offset=(0.0, 0.0, 0.0)) -> Iterator[np.ndarray]:
+    """
+    Yields the shell triangles as coordinate arrays (m, 3, 3), chunk_rows grid rows at a time
+    """
+    xs, ys = _grid_axes(geometry, nx, ny)
+    for i0, i1 in _row_chunks(nx, chunk_rows):
+        top, bottom = _grid_vertices(geometry, xs[i0:i1 + 1], ys, offset)
+        vertices = np.concatenate((top.reshape(-1, 3), bottom.reshape(-1, 3)))
+        yield vertices[_grid_faces(i0, i1, nx, ny, row0=i0, n_rows=i1 - i0 + 1)]
+
+
+def tendon_polylines(geometry: HPGeometry, offset=(0.0, 0.0, 0.0)) -> np.ndarray:
+    """
+    Returns the tendons as array (2 * nt, 2, 3) of start and end points
+    """
+    return np.asarray(geometry.tendons(), dtype=float).reshape(-1, 2, 3) + np.asarray(offset, dtype=float)
+
+
+# ---------------------------------------------------------------------------
+# Writers
+# ---------------------------------------------------------------------------
+
+def _placements(shells) -> list[ShellPlacement]:
+    if isinstance(shells, HPGeometry):
+        return [(shells, (0.0, 0.0, 0.0))]
+    return [(geometry, tuple(offset)) for geometry, offset in shells]
+
+
+def write_stl(f: BinaryIO, shells: HPGeometry | Iterable[ShellPlacement], nx: int = 200, ny: int = 60,
+              chunk_rows: int = 64) -> int:
+    """
+    Writes the shell surfaces as binary STL to the open file handle f and returns the number of triangles
+    """
+    shells = _placements(shells)
+    n_triangles = len(shells) * n_shell_triangles(nx, ny)
+
+    f.write(b"HP shell mesh [mm]".ljust(80, b" "))
+    f.write(np.uint32(n_triangles).tobytes())
+
+    for geometry, offset in shells:
+        for triangles in shell_triangle_chunks(geometry, nx, ny, chunk_rows, offset):
+            normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+            normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+
+            records = np.zeros(len(triangles), dtype=_STL_TRIANGLE)
+            records["normal"] = normals
+            records["vertices"] = triangles
+            f.write(records.tobytes())
+
+    return n_triangles
+
+
+def write_ply(f: BinaryIO, shells: HPGeometry | Iterable[ShellPlacement], nx: int = 200, ny: int = 60,
+              chunk_rows: int = 64, include_tendons: bool = True) -> int:
+    """
+    Writes the shell surfaces (and tendons as edges) as binary little endian PLY to the open file handle f
+    and returns the number of triangles
+    """
+    shells = _placements(shells)
+    tendons = [tendon_polylines(g, o) for g, o in shells] if include_tendons else []
+    n_edges = sum(len(t) for t in tendons)
+    n_shell = n_shell_vertices(nx, ny)
+    n_vertices = len(shells) * n_shell + 2 * n_edges
+    n_triangles = len(shells) * n_shell_triangles(nx, ny)
+
+    header = [
+        "ply",
+        "format binary_little_endian 1.0",
+        "comment HP shell mesh [mm]",
+        f"element vertex {n_vertices}",
+        "property float x",
+        "property float y",
+        "property float z",
+        f"element face {n_triangles}",
+        "property list uchar int vertex_indices",
+    ]
+    if n_edges:
+        header += [f"element edge {n_edges}", "property int vertex1", "property int vertex2"]
+    f.write(("\n".join(header) + "\nend_header\n").encode("ascii"))
+
+    # vertices: all shells row by row, then the tendon end points
+    for geometry, offset in shells:
+        xs, ys = _grid_axes(geometry, nx, ny)
+        for part in (0, 1):
+            for i0, i1 in _row_chunks(nx + 1, chunk_rows):
+                top, bottom = _grid_vertices(geometry, xs[i0:i1], ys, offset)
+                f.write(np.ascontiguousarray((top, bottom)[part], dtype="<f4").tobytes())
+    for t in tendons:
+        f.write(np.ascontiguousarray(t, dtype="<f4").tobytes())
+
+    # faces
+    face_dtype = np.dtype([("n", "u1"), ("v", "<i4", (3,))])
+    for k in range(len(shells)):
+        for i0, i1 in _row_chunks(nx, chunk_rows):
+            faces = _grid_faces(i0, i1, nx, ny, row0=0, n_rows=nx) + k * n_shell
+            records = np.empty(len(faces), dtype=face_dtype)
+            records["n"] = 3
+            records["v"] = faces
+            f.write(records.tobytes())
+
+    # tendon edges
+    if n_edges:
+        first = len(shells) * n_shell
+        edges = first + np.arange(2 * n_edges, dtype="<i4").reshape(-1, 2)
+        f.write(edges.tobytes())
+
+    return n_triangles
+
+
+def write_obj(f: BinaryIO, shells: HPGeometry | Iterable[ShellPlacement], nx: int = 200, ny: int = 60,
+              chunk_rows: int = 64, include_tendons: bool = True) -> int:
+    """
+    Writes the shell surfaces (and tendons as lines) as Wavefront OBJ text to the open binary file handle f
+    and returns the number of triangles
+    """
+    shells = _placements(shells)
+    n_shell = n_shell_vertices(nx, ny)
+    n_triangles = 0
+
+    f.write(b"# HP shell mesh [mm]\n")
+    for k, (geometry, offset) in enumerate(shells):
+        first = k * n_shell + 1   # OBJ indices are 1-based
+        f.write(f"o hp_shell_{k}\n".encode("ascii"))
+
+        xs, ys = _grid_axes(geometry, nx, ny)
+        for part in (0, 1):
+            for i0, i1 in _row_chunks(nx + 1, chunk_rows):
+                vertices = _grid_vertices(geometry, xs[i0:i1], ys, offset)[part].reshape(-1, 3)
+                f.write(_format_rows("v %.6f %.6f %.6f", vertices))
+
+        for i0, i1 in _row_chunks(nx, chunk_rows):
+            faces = _grid_faces(i0, i1, nx, ny, row0=0, n_rows=nx) + first
+            f.write(_format_rows("f %d %d %d", faces))
+            n_triangles += len(faces)
+
+    if include_tendons:
+        first = len(shells) * n_shell + 1
+        f.write(b"o tendons\n")
+        for geometry, offset in shells:
+            t = tendon_polylines(geometry, offset)
+            f.write(_format_rows("v %.6f %.6f %.6f", t.reshape(-1, 3)))
+            f.write(_format_rows("l %d %d", first + np.arange(2 * len(t)).reshape(-1, 2)))
+            first += 2 * len(t)
+
+    return n_triangles
+
+
+def _format_rows(fmt: str, rows: np.ndarray) -> bytes:
+    fmt = fmt + "\n"
+    return "".join(fmt % tuple(row) for row in rows.tolist()).encode("ascii")
+
+
+def export_hp_shells(path, shells: HPGeometry | Iterable[ShellPlacement], file_format: Optional[str] = None,
+                     nx: int = 200, ny: int = 60, chunk_rows: int = 64, include_tendons: Optional[bool] = None) -> int:
+    """
+    Exports one or more HP shells to path and returns the number of triangles written
+
+    :param path: Output file
+    :param shells: A single HPGeometry or an iterable of (HPGeometry, (x0, y0, z0)) placements in mm
+    :param file_format: 'stl', 'ply' or 'obj', by default taken from the file suffix
+    :param nx: Number of grid points along the span (x)
+    :param ny: Number of grid points across the width (y)
+    :param chunk_rows: Number of grid rows generated and written at a time
+    :param include_tendons: Export tendons (default: True for PLY and OBJ, not supported for STL)
+    """
+    path = Path(path)
+    file_format = (file_format or path.suffix.lstrip(".")).lower()
+
+    if file_format not in MESH_FORMATS:
+        raise ValueError(f"Invalid mesh format '{file_format}'. Must be one of: {list(MESH_FORMATS)}")
+
+    if file_format == "stl" and include_tendons:
+        raise ValueError("STL cannot store tendon polylines, use PLY or OBJ")
+
+    with path.open("wb") as f:
+        if file_format == "stl":
+            return write_stl(f, shells, nx, ny, chunk_rows)
+        if file_format == "ply":
+            return write_ply(f, shells, nx, ny, chunk_rows, include_tendons is not False)
+        return write_obj(f, shells, nx, ny, chunk_rows, include_tendons is not False)
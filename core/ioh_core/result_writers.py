@@ -0,0 +1,202 @@
+"""
+Streaming result writers for batch runs (parameter sweeps, portfolio checks).
+
+Rows are buffered in small batches and appended to the output file, so memory stays bounded no matter
+how many designs are evaluated. Re-opening an existing file lets a run resume by skipping the keys
+that are already written.
+"""
+import csv
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+class ResultWriter(ABC):
+    """
+    Base class for row-wise result writers.
+
+    :param path: Output file
+    :param fieldnames: Column names, in output order
+    :param key: Column that uniquely identifies a row (used for resuming)
+    :param batch_size: Number of rows buffered before they are flushed to disk
+    """
+
+    def __init__(self, path, fieldnames: Iterable[str], key: str = "design_id", batch_size: int = 256):
+        self.path = Path(path)
+        self.fieldnames = list(fieldnames)
+        self.key = key
+        self.batch_size = int(batch_size)
+        self._buffer: list[dict] = []
+
+        if self.key not in self.fieldnames:
+            raise ValueError(f"Key column '{self.key}' must be one of the fieldnames")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @abstractmethod
+    def completed_keys(self, error_column: Optional[str] = None) -> set[str]:
+        """
+        Returns the keys of all rows that are already stored in the output file
+
+        :param error_column: Rows with a non-empty value in this column do not count as completed, so their keys
+                             are evaluated again on resume (the new row is appended, the last row of a key is current)
+        """
+        raise NotImplementedError
+
+    def write_row(self, row: dict) -> None:
+        """
+        Buffers a row, missing columns are written empty and unknown columns are rejected
+        """
+        unknown = set(row) - set(self.fieldnames)
+        if unknown:
+            raise ValueError(f"Unknown result columns: {sorted(unknown)}")
+
+        self._buffer.append(row)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    @abstractmethod
+    def flush(self) -> None:
+        """
+        Writes all buffered rows to disk
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        self.flush()
+
+
+class CsvResultWriter(ResultWriter):
+    """
+    Appends rows to a CSV file. The header is written once when the file is created.
+    """
+
+    def completed_keys(self, error_column: Optional[str] = None) -> set[str]:
+        if not self.path.exists():
+            return set()
+
+        self._truncate_partial_line()
+        if self.path.stat().st_size == 0:
+            return set()
+
+        with self.path.open(newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            if reader.fieldnames != self.fieldnames:
+                raise ValueError(
+                    f"Existing file {self.path} has columns {reader.fieldnames}, expected {self.fieldnames}"
+                )
+            # rows with missing trailing columns are incomplete and will be recomputed
+            return {
+                row[self.key] for row in reader
+                if row.get(self.fieldnames[-1]) is not None and not (error_column and row.get(error_column))
+            }
+
+    def _truncate_partial_line(self) -> None:
+        """
+        Removes a trailing row that was cut off by an interruption (no closing newline)
+        """
+        with self.path.open("rb+") as f:
+            end = f.seek(0, os.SEEK_END)
+            pos = end
+            # scan backwards in blocks for the last newline, the file itself may be large
+            while pos > 0:
+                step = min(4096, pos)
+                pos -= step
+                f.seek(pos)
+                block = f.read(step)
+                if pos + step == end and block.endswith(b"\n"):
+                    return
+                idx = block.rfind(b"\n")
+                if idx >= 0:
+                    f.truncate(pos + idx + 1)
+                    return
+            f.truncate(0)
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+
+        write_header = not self.path.exists() or self.path.stat().st_size == 0
+
+        with self.path.open("a", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=self.fieldnames)
+            if write_header:
+                writer.writeheader()
+            writer.writerows(self._buffer)
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._buffer.clear()
+
+
+class ParquetResultWriter(ResultWriter):
+    """
+    Appends rows to a Parquet dataset directory, one part file per flushed batch.
+    Requires the optional dependency pyarrow.
+    """
+
+    def __init__(self, path, fieldnames: Iterable[str], key: str = "design_id", batch_size: int = 1024):
+        super().__init__(path, fieldnames, key, batch_size)
+        self._pq, self._pa = _import_pyarrow()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._part = len(self._parts())
+
+    def _parts(self) -> list[Path]:
+        return sorted(self.path.glob("part-*.parquet"))
+
+    def completed_keys(self, error_column: Optional[str] = None) -> set[str]:
+        keys: set[str] = set()
+        for part in self._parts():
+            if error_column is None:
+                table = self._pq.read_table(part, columns=[self.key])
+                keys.update(str(k) for k in table.column(self.key).to_pylist())
+                continue
+
+            table = self._pq.read_table(part, columns=[self.key, error_column])
+            keys.update(str(k) for k, error in zip(table.column(self.key).to_pylist(),
+                                                    table.column(error_column).to_pylist()) if not error)
+        return keys
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+
+        columns = {name: [row.get(name) for row in self._buffer] for name in self.fieldnames}
+        table = self._pa.table(columns)
+
+        # write to a temporary name first, so an interrupted write never leaves a broken part behind
+        final = self.path / f"part-{self._part:06d}.parquet"
+        tmp = final.with_suffix(".tmp")
+        self._pq.write_table(table, tmp)
+        os.replace(tmp, final)
+
+        self._part += 1
+        self._buffer.clear()
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("Parquet output requires pyarrow (pip install pyarrow)") from exc
+    return pq, pa
+
+
+def open_result_writer(path, fieldnames: Iterable[str], key: str = "design_id",
+                       batch_size: Optional[int] = None) -> ResultWriter:
+    """
+    Returns a CSV writer for paths ending in '.csv' and a Parquet writer otherwise
+    ('.parquet' or a directory).
+    """
+    path = Path(path)
+    writer_cls = CsvResultWriter if path.suffix.lower() == ".csv" else ParquetResultWriter
+
+    if batch_size is None:
+        return writer_cls(path, fieldnames, key)
+    return writer_cls(path, fieldnames, key, batch_size)
@@ -0,0 +1,79 @@
+"""
+Binary snapshot files for incremental analyses (e.g. pushover).
+
+A snapshot file is a small header followed by fixed-length float64 records that are appended one at a time,
+so a long analysis keeps only the current state in memory. Reading memory-maps the records as one array
+(n_records, record_length) without loading the file.
+"""
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+_MAGIC = b"SNAP0001"
+_HEADER_SIZE = len(_MAGIC) + 8      # magic + record length (int64)
+
+
+class SnapshotWriter:
+    """
+    Appends fixed-length float64 records to a snapshot file. An existing file is overwritten.
+
+    :param path: Output file
+    :param record_length: Number of values per record
+    """
+
+    def __init__(self, path, record_length: int):
+        self.path = Path(path)
+        self.record_length = int(record_length)
+        if self.record_length < 1:
+            raise ValueError("record_length must be at least 1")
+
+        self._file = open(self.path, "wb")
+        self._file.write(_MAGIC + np.int64(self.record_length).tobytes())
+        self.n_records = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write(self, record: ArrayLike) -> None:
+        """
+        Appends one record and flushes it, so the file is readable while the analysis is running
+        """
+        record = np.asarray(record, dtype="<f8").ravel()
+        if len(record) != self.record_length:
+            raise ValueError(f"Expected a record of length {self.record_length}, received {len(record)}")
+
+        self._file.write(record.tobytes())
+        self._file.flush()
+        self.n_records += 1
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+
+def read_snapshots(path, mmap: bool = True) -> np.ndarray:
+    """
+    Returns all complete records of a snapshot file as array (n_records, record_length),
+    memory-mapped (read-only) by default
+    """
+    path = Path(path)
+    with open(path, "rb") as f:
+        header = f.read(_HEADER_SIZE)
+    if len(header) != _HEADER_SIZE or header[:len(_MAGIC)] != _MAGIC:
+        raise ValueError(f"{path} is not a snapshot file")
+
+    record_length = int(np.frombuffer(header[len(_MAGIC):], dtype="<i8")[0])
+    # a record cut off by an interrupted run is ignored
+    n_records = (path.stat().st_size - _HEADER_SIZE) // (8 * record_length)
+    if n_records == 0:
+        return np.empty((0, record_length))
+
+    if mmap:
+        return np.memmap(path, dtype="<f8", mode="r", offset=_HEADER_SIZE, shape=(n_records, record_length))
+    return np.fromfile(path, dtype="<f8", count=n_records * record_length, offset=_HEADER_SIZE).reshape(
+        n_records, record_length
+    )
@@ -36,3 +36,17 @@ def N_to_kN(x: float) -> float:
     Returns a force in [kN] given a force in [N]
     """
     return x * 1e-3
+
+
+def m_to_mm(x: float) -> float:
+    """
+    Returns a length in [mm] given a length in [m]
+    """
+    return x * 1e3
+
+
+def per_mm_to_per_m(x: float) -> float:
+    """
+    Returns a curvature in [1/m] given a curvature in [1/mm]
+    """
+    return x * 1e3
@@ -0,0 +1,134 @@
+"""
+Headless PDF reports of the sections of many slabs.
+
+Every station of a slab gets one page with the cross-section, the moment-curvature diagram and the strain profile
+at the bending strength (SLS). The slabs are rendered in a process pool with the Agg backend, one PDF per slab.
+A worker draws all its pages on one figure that is created once per process and only cleared between pages, and
+PdfPages writes each page to the file as soon as it is drawn, so a worker holds one page in memory regardless of
+the number of slabs and stations.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Mapping, Optional, Sequence
+
+import matplotlib
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+
+from core.analysis_core.section_methods import calculate_bending_strength_sls, calculate_moment_curvature_sls
+from core.visualization_core.visualization import plot_cross_section, plot_moment_curvature, plot_strain_profile
+from slab_construction.slabs.one_way_slab import OneWaySlab
+
+# Stations xi ∈ [0 ; 1] reported by default
+REPORT_STATIONS: tuple[float, ...] = (0.0, 0.25, 0.5)
+
+# A4 landscape [in]
+PAGE_SIZE: tuple[float, float] = (11.69, 8.27)
+
+# Figure and axes of the current process, reused for every page
+_PAGE: Optional[tuple[Figure, tuple[Axes, ...]]] = None
+
+
+def _init_worker() -> None:
+    matplotlib.use("Agg")
+
+
+def _page() -> tuple[Figure, tuple[Axes, ...]]:
+    """
+    Returns the report page of this process, created on first use. The figure is not registered with pyplot,
+    so it is neither shown nor kept alive by the pyplot figure manager.
+    """
+    global _PAGE
+    if _PAGE is None:
+        fig = Figure(figsize=PAGE_SIZE, layout="constrained")
+        axes = fig.subplots(1, 3, gridspec_kw={"width_ratios": (1.4, 1.0, 0.8)})
+        _PAGE = fig, tuple(axes)
+    return _PAGE
+
+
+def _clear(axes: Sequence[Axes]) -> None:
+    for ax in axes:
+        ax.clear()
+        ax.set_aspect("auto")
+        # plot_cross_section hides the frame
+        for spine in ax.spines.values():
+            spine.set_visible(True)
+
+
+def draw_station_page(fig: Figure, axes: Sequence[Axes], slab: OneWaySlab, xi: float, n: float = 0.0,
+                      title: str = "") -> None:
+    """
+    Draws the page of station xi on the (cleared) axes: cross-section, M-K diagram and strain profile at the
+    bending strength (SLS)
+    """
+    section = slab.section_at(xi)
+
+    _clear(axes)
+    plot_cross_section(section, ax=axes[0], x=xi)
+    plot_moment_curvature(calculate_moment_curvature_sls(section, n), x=xi, ax=axes[1])
+    plot_strain_profile(calculate_bending_strength_sls(section, n), ax=axes[2])
+    fig.suptitle(f"{title} - x = {xi} * L" if title else f"x = {xi} * L")
+
+
+def render_slab_report(
+        name: str,
+        slab: OneWaySlab,
+        path,
+        stations: Sequence[float] = REPORT_STATIONS,
+        n: float = 0.0
+) -> Path:
+    """
+    Writes the report of one slab, one page per station
+
+    :param name: Name of the slab (page titles and PDF metadata)
+    :param slab: Slab
+    :param path: Output PDF
+    :param stations: Stations xi ∈ [0 ; 1]
+    :param n: Axial force in N
+    :return: Path of the PDF
+    """
+    if not stations:
+        raise ValueError(f"Report of slab '{name}' needs at least one station")
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fig, axes = _page()
+
+    with PdfPages(path, metadata={"Title": f"Sections of {name}"}) as pdf:
+        for xi in stations:
+            draw_station_page(fig, axes, slab, xi, n, title=name)
+            pdf.savefig(fig)
+
+    return path
+
+
+def _render_job(job: tuple) -> Path:
+    return render_slab_report(*job)
+
+
+def render_reports(
+        slabs: Mapping[str, OneWaySlab],
+        directory,
+        stations: Sequence[float] = REPORT_STATIONS,
+        n: float = 0.0,
+        max_workers: Optional[int] = None
+) -> dict[str, Path]:
+    """
+    Writes one PDF report '<name>.pdf' per slab to directory
+
+    :param slabs: Slabs by name
+    :param directory: Output directory
+    :param stations: Stations xi ∈ [0 ; 1] of every report
+    :param n: Axial force in N
+    :param max_workers: Number of worker processes, 1 renders in the current process
+    :return: Path of the PDF per slab name
+    """
+    directory = Path(directory)
+    jobs = [(name, slab, directory / f"{name}.pdf", tuple(stations), n) for name, slab in slabs.items()]
+
+    if max_workers == 1:
+        return {job[0]: _render_job(job) for job in jobs}
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+        return {job[0]: path for job, path in zip(jobs, executor.map(_render_job, jobs))}
@@ -376,10 +376,13 @@ def plot_mesh_with_triangles(triangulated_data):
     ax.set_title("Triangulated mesh")
 
 
-def plot_strain_profile(results: dict):
+def plot_strain_profile(results: dict, ax=None):
     """
     Author: Elliot Melcer
     Plots Strain Profile for Moment Calculation Results
+
+    ax : matplotlib.axes.Axes, optional
+        Axis to draw on (e.g. a reused report page). If None, a new figure is created.
     """
 
     section = results['section']
@@ -416,7 +419,8 @@ def plot_strain_profile(results: dict):
     # ------------------------------------------------------------------
     # Plot
     # ------------------------------------------------------------------
-    fig, ax = plt.subplots(figsize=(6, 8))
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(6, 8))
 
     # Thick vertical extent line
     ax.vlines(
@@ -514,5 +518,5 @@ def plot_strain_profile(results: dict):
     ax.set_xlim(eps_min, eps_max)
     ax.set_ylim(zmin - z_pad, zmax + z_pad)
 
-    return fig, ax
+    return ax.figure, ax
 
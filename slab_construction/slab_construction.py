@@ -19,9 +19,18 @@ class FloorMaterial(Material):
     """
     Author: Elliot Melcer
     Instantiable Simple Material for floor layers.
+    Resilient layers (impact sound insulation under floating screeds) carry their dynamic stiffness s' in [MN/m³].
     """
-    def __init__(self, density: float, name: str | None = "FloorMaterial") -> None:
+    def __init__(
+            self,
+            density: float,
+            name: str | None = "FloorMaterial",
+            dynamic_stiffness: float | None = None
+    ) -> None:
         super().__init__(density=density, name=name)
+        if dynamic_stiffness is not None and dynamic_stiffness <= 0:
+            raise ValueError("Dynamic stiffness must be positive")
+        self.dynamic_stiffness = dynamic_stiffness
 
 class Floor:
     """
@@ -30,6 +39,15 @@ class Floor:
     """
     def __init__(self, layers: list[FloorLayer] | None = None) -> None:
         self.layers: list[FloorLayer] = list(layers) if layers is not None else []
+        # Incremented on every change, so dependent caches (SlabConstruction) can detect it.
+        # Call invalidate() after editing self.layers directly.
+        self.version: int = 0
+
+    def invalidate(self) -> None:
+        """
+        Marks the floor as changed
+        """
+        self.version += 1
 
     def add_layer(self, material: Material, thickness: float) -> None:
         """
@@ -40,6 +58,7 @@ class Floor:
             raise ValueError("Thickness must be positive")
 
         self.layers.append(FloorLayer(material, thickness))
+        self.invalidate()
 
     def dead_load(self) -> float:
         """
@@ -61,19 +80,60 @@ class SlabConstruction:
         self.slab = slab
         self.floor = floor
 
+    @property
+    def slab(self) -> Slab:
+        return self._slab
+
+    @slab.setter
+    def slab(self, slab: Slab) -> None:
+        self._slab = slab
+        self.invalidate()
+
+    @property
+    def floor(self) -> Floor:
+        return self._floor
+
+    @floor.setter
+    def floor(self, floor: Floor) -> None:
+        self._floor = floor
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        Clears the cached dead loads. Called when slab or floor are replaced and when the floor changes
+        (Floor.version); call it after changing the slab in place.
+        """
+        self._structural_dead_load: float | None = None
+        self._infill_load: float | None = None
+        self._floor_dead_load: float | None = None
+        self._floor_version: int | None = None
+
     def structural_dead_load(self) -> float:
         """
-        Total structural dead load of the slab construction [kN/m²].
+        Total structural dead load of the slab construction [kN/m²] (cached).
         """
-        return (
-            self.slab.self_load()
-        )
+        if self._structural_dead_load is None:
+            self._structural_dead_load = self.slab.self_load()
+
+        return self._structural_dead_load
 
     def non_structural_dead_load(self) -> float:
         """
-        Total non-structural dead load of the slab construction [kN/m²].
+        Total non-structural dead load of the slab construction [kN/m²] (cached).
         """
+        if self._infill_load is None:
+            self._infill_load = self.slab.infill_load()
+        if self._floor_version != self.floor.version:
+            self._floor_dead_load = self.floor.dead_load()
+            self._floor_version = self.floor.version
+
         return (
-            self.slab.infill_load()
-            + self.floor.dead_load()
-        )
\ No newline at end of file
+            self._infill_load
+            + self._floor_dead_load
+        )
+
+    def dead_load(self) -> float:
+        """
+        Total characteristic dead load Gk of the slab construction [kN/m²].
+        """
+        return self.structural_dead_load() + self.non_structural_dead_load()
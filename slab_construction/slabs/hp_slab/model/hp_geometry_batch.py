@@ -0,0 +1,200 @@
+from typing import Iterable
+
+import numpy as np
+from numpy import sqrt
+from numpy.typing import ArrayLike
+
+from core.unit_core import mm2_to_m2, mm3_to_m3
+from slab_construction.slabs.hp_slab.model.hp_geometry import HPGeometry
+
+
+class HPGeometryBatch:
+    def __init__(
+            self,
+            B: ArrayLike,
+            L: ArrayLike,
+            Hx: ArrayLike,
+            Hy: ArrayLike,
+            t: ArrayLike,
+            dy: ArrayLike,
+            nt: ArrayLike,
+    ):
+        """
+        Represents many hyperbolic paraboloid (hp) shells at once, for screening large numbers of candidates.
+
+        All parameters are broadcast against each other to one common shape (n,), so a scalar applies to all
+        candidates. The methods mirror HPGeometry (same units and formulas) but return arrays over all candidates.
+
+        Parameters
+        ----------
+        B : array_like
+            Width of the shells in mm
+        L : array_like
+            Length of the shells in mm
+        Hx : array_like
+            Rise (sag) in the x-direction in mm
+        Hy : array_like
+            Rise (sag) in the y-direction in mm
+        t : array_like
+            Thickness of the shells in mm
+        dy : array_like
+            Distance of the outermost tendon to the edge of the shell in mm
+        nt : array_like
+            Number of tendons per tendon group, total number of tendons: 2 * nt
+        """
+        B, L, Hx, Hy, t, dy, nt = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(p, dtype=float)) for p in (B, L, Hx, Hy, t, dy, nt))
+        )
+        if B.ndim != 1:
+            raise ValueError("HPGeometryBatch parameters must be scalars or one-dimensional arrays")
+
+        self.B = B.copy()
+        self.L = L.copy()
+        self.Hx = Hx.copy()
+        self.Hy = Hy.copy()
+        self.t = t.copy()
+        self.dy = dy.copy()
+        self.nt = nt.astype(int)
+
+        if np.any(self.nt < 1):
+            raise ValueError("nt must be at least 1 for all candidates")
+
+    @classmethod
+    def from_geometries(cls, geometries: Iterable[HPGeometry]) -> "HPGeometryBatch":
+        """
+        Returns a batch holding the given scalar geometries
+        """
+        geometries = list(geometries)
+        return cls(*(
+            [getattr(g, name) for g in geometries]
+            for name in ("B", "L", "Hx", "Hy", "t", "dy", "nt")
+        ))
+
+    def __len__(self) -> int:
+        return len(self.B)
+
+    def geometry(self, i: int) -> HPGeometry:
+        """
+        Returns candidate i as a scalar HPGeometry, e.g. for the detailed analysis after screening
+        """
+        return HPGeometry(self.B[i], self.L[i], self.Hx[i], self.Hy[i], self.t[i], self.dy[i], int(self.nt[i]))
+
+    def _a(self) -> np.ndarray:
+        return self.L / (2 * sqrt(self.Hx))
+
+    def _b(self) -> np.ndarray:
+        return self.B / (2 * sqrt(self.Hy))
+
+    def x_p(self) -> np.ndarray:
+        return self.L / 2 * (1 + sqrt(self.Hy) / sqrt(self.Hx))
+
+    def y_p(self) -> np.ndarray:
+        return self.B / 2 * (1 + sqrt(self.Hx) / sqrt(self.Hy))
+
+    def z_p(self) -> np.ndarray:
+        return (sqrt(self.Hx) + sqrt(self.Hy)) ** 2
+
+    def alpha_edge(self) -> np.ndarray:
+        return 1 / 2 * ((-self.B / 2 + self.dy) / self.y_p() + (self.L / 2) / self.x_p() + 1)
+
+    def alpha_edge_bar(self) -> np.ndarray:
+        alpha_edge = self.alpha_edge()
+        return np.where(alpha_edge > 0.5, 0.5, 1 - alpha_edge)
+
+    def tendon_mask(self) -> np.ndarray:
+        """
+        Returns a boolean array (n, nt_max), True where tendon i of a tendon group exists
+        """
+        return np.arange(self.nt.max())[None, :] < self.nt[:, None]
+
+    def alpha_array(self) -> np.ndarray:
+        """
+        Returns the alpha coordinates of all tendons in a tendon group as array (n, nt_max), NaN-padded
+        where a candidate has fewer tendons than nt_max.
+        A single tendon (nt = 1) is placed at alpha = 0.5, like HPGeometry.alpha_list.
+        """
+        single = self.nt == 1
+        alpha_edge = np.where(single, 0.5, self.alpha_edge())
+        # guard the division for nt = 1, where delta_alpha is not used
+        delta_alpha = np.where(single, 0.0, (self.alpha_edge_bar() - self.alpha_edge()) / np.maximum(self.nt - 1, 1))
+
+        i = np.arange(self.nt.max())[None, :]
+        alpha = alpha_edge[:, None] + delta_alpha[:, None] * i
+
+        return np.where(self.tendon_mask(), alpha, np.nan)
+
+    def tendons(self) -> np.ndarray:
+        """
+        Returns the tendons of all candidates as array (n, 2 * nt_max, 2, 3) of start and end points (x, y, z).
+
+        Slots [:, :nt_max] hold the regular tendon group, slots [:, nt_max:] the mirrored group in the same order
+        as HPGeometry.tendons(). Missing tendons are NaN, see tendon_mask().
+        """
+        n, nt_max = len(self), int(self.nt.max())
+        alpha = self.alpha_array()                                  # (n, nt_max)
+
+        x_p = self.x_p()[:, None, None]
+        y_p = self.y_p()[:, None, None]
+        z_p = self.z_p()[:, None, None]
+        a = alpha[:, :, None]
+        x = np.stack((-self.L / 2, self.L / 2), axis=-1)[:, None, :]  # (n, 1, 2) start and end
+
+        y = (x / x_p + 2 * a - 1) * y_p                               # (n, nt_max, 2)
+        z = (4 * a * x / x_p - 2 * x / x_p + 4 * a ** 2 - 4 * a + 1) * z_p
+        x = np.broadcast_to(x, y.shape)
+
+        mask = self.tendon_mask()[:, :, None, None]
+        regular = np.where(mask, np.stack((x, y, z), axis=-1), np.nan)  # (n, nt_max, 2, 3)
+
+        # mirrored group: reversed tendon order within the existing tendons and y -> -y
+        k = np.arange(nt_max)[None, :]
+        idx = np.clip(self.nt[:, None] - 1 - k, 0, nt_max - 1)
+        mirrored = np.take_along_axis(regular, idx[:, :, None, None], axis=1) * np.array([1.0, -1.0, 1.0])
+        mirrored = np.where(mask, mirrored, np.nan)
+
+        return np.concatenate((regular, mirrored), axis=1).reshape(n, 2 * nt_max, 2, 3)
+
+    def tendon_lengths(self) -> np.ndarray:
+        """
+        Returns the length of every tendon in mm as array (n, 2 * nt_max), NaN for missing tendons
+        """
+        tendons = self.tendons()
+        return np.linalg.norm(tendons[:, :, 1, :] - tendons[:, :, 0, :], axis=-1)
+
+    def volume(self) -> np.ndarray:
+        """
+        Returns the concrete volume of all shells in mm³ (same formula as HPGeometry.volume)
+        """
+        def arc(H, S, s):
+            return (8 * H * s * np.sqrt(64 * H ** 2 * s * s / (S ** 4) + 1)
+                    + S ** 2 * np.asinh(8 * H * s / (S ** 2))) / (16 * H)
+
+        b = arc(self.Hy, self.B, self.B / 2) - arc(self.Hy, self.B, -self.B / 2)
+        l = arc(self.Hx, self.L, self.L / 2) - arc(self.Hx, self.L, -self.L / 2)
+
+        return l * b * self.t
+
+    def minimum_infill_volume(self) -> np.ndarray:
+        """
+        Returns the minimum infill volume to flatten out the top of the shells in mm³ (see HPSlab)
+        """
+        mid_surface_volume = np.abs(self.B * self.L * (-2 / 3 * self.Hy - 1 / 3 * self.Hx))
+        return mid_surface_volume - self.volume() / 2
+
+    def self_load(self, concrete_density: ArrayLike) -> np.ndarray:
+        """
+        Returns the self-weight load of the concrete shells in [kN/m²]
+
+        :param concrete_density: Concrete density in [kg/m³], scalar or one value per candidate
+        """
+        gamma_c = np.asarray(concrete_density, dtype=float) * 10 / 1000     # [kN/m³]
+        return mm3_to_m3(self.volume()) * gamma_c / mm2_to_m2(self.B * self.L)
+
+    def infill_load(self, infill_density: ArrayLike) -> np.ndarray:
+        """
+        Returns the load due to minimum infill on the slabs in [kN/m²]
+
+        :param infill_density: Infill density in [kg/m³], scalar or one value per candidate
+        """
+        gamma_i = np.asarray(infill_density, dtype=float) * 10 / 1000       # [kN/m³]
+        return mm3_to_m3(self.minimum_infill_volume()) * gamma_i / mm2_to_m2(self.B * self.L)